@@ -0,0 +1,218 @@
+"""
+connection_pool Module
+
+This module provides the `ConnectionPool` class, which keeps a bounded set of open MySQL
+connections for the `PokemonDatabaseManager`. Connections are health-checked when they are
+handed out after being idle, and the fixed queries of the manager are executed as prepared
+statements that are reused for as long as their connection lives.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+import mysql.connector
+
+class ConnectionPool:
+    """
+    A thread-safe pool of MySQL connections with per-connection prepared statements.
+
+    Attributes:
+        db_config (dict): The keyword arguments passed to `mysql.connector.connect`.
+        pool_size (int): The maximum number of open connections. If 0, every query opens and
+                         closes its own connection, as the manager did before pooling.
+        health_check_interval (float): Idle connections older than this many seconds are
+                                       pinged before they are handed out.
+    """
+
+    def __init__(self, db_config, pool_size=5, health_check_interval=30.0):
+        """
+        Initializes the ConnectionPool. Connections are opened lazily on first use.
+
+        Args:
+            db_config (dict): The keyword arguments passed to `mysql.connector.connect`.
+            pool_size (int): The maximum number of open connections, or 0 to disable pooling.
+            health_check_interval (float): The idle time in seconds after which a connection is
+                                           pinged before reuse.
+        """
+        if pool_size < 0:
+            raise ValueError(f"Invalid pool size: {pool_size}")
+        self.db_config = db_config
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(pool_size, 1))
+        self._statements = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks out a healthy connection for the duration of a `with` block.
+
+        Yields:
+            mysql.connector.connection.MySQLConnection: An open connection in autocommit mode.
+        """
+        if self.pool_size == 0:
+            conn = mysql.connector.connect(**self.db_config)
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+        except mysql.connector.Error:
+            self._discard(conn)
+            conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._idle.put((conn, time.monotonic()))
+            self._slots.release()
+
+    def fetch_all(self, sql, params=()):
+        """
+        Executes a query and returns all rows as dictionaries.
+
+        Args:
+            sql (str): The SQL query with %s placeholders.
+            params (tuple): The query parameters.
+
+        Returns:
+            list: A list of dictionaries mapping column names to values.
+        """
+        with self.connection() as conn:
+            cursor = self._cursor(conn, sql)
+            cursor.execute(sql, params)
+            columns = cursor.column_names
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            if self.pool_size == 0:
+                cursor.close()
+            return rows
+
+    def fetch_one(self, sql, params=()):
+        """
+        Executes a query and returns its first row as a dictionary.
+
+        Args:
+            sql (str): The SQL query with %s placeholders.
+            params (tuple): The query parameters.
+
+        Returns:
+            dict: The first row, or None if the query returned no rows.
+        """
+        rows = self.fetch_all(sql, params)
+        return rows[0] if rows else None
+
+    def execute(self, sql, params=()):
+        """
+        Executes a statement that does not return rows and commits it.
+
+        Args:
+            sql (str): The SQL statement with %s placeholders.
+            params (tuple): The statement parameters.
+        """
+        with self.connection() as conn:
+            cursor = self._cursor(conn, sql)
+            cursor.execute(sql, params)
+            conn.commit()
+            if self.pool_size == 0:
+                cursor.close()
+
+    def execute_many(self, sql, rows):
+        """
+        Executes a statement once per parameter row and commits all rows together.
+
+        Args:
+            sql (str): The SQL statement with %s placeholders.
+            rows (list): The parameter tuples.
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(sql, rows)
+            conn.commit()
+            cursor.close()
+
+    def close(self):
+        """
+        Closes all idle connections.
+        """
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    def _open(self):
+        """
+        Opens a new connection in autocommit mode, so that pooled readers never hold an old
+        snapshot of the data.
+
+        Returns:
+            mysql.connector.connection.MySQLConnection: The new connection.
+        """
+        conn = mysql.connector.connect(**self.db_config)
+        conn.autocommit = True
+        return conn
+
+    def _checkout(self):
+        """
+        Takes an idle connection from the pool, or opens a new one. Connections that were idle
+        for longer than the health check interval are pinged and replaced if they are dead.
+
+        Returns:
+            mysql.connector.connection.MySQLConnection: A healthy connection.
+        """
+        try:
+            conn, last_used = self._idle.get_nowait()
+        except queue.Empty:
+            return self._open()
+
+        if time.monotonic() - last_used > self.health_check_interval:
+            try:
+                conn.ping(reconnect=False)
+            except mysql.connector.Error:
+                self._discard(conn)
+                return self._open()
+        return conn
+
+    def _discard(self, conn):
+        """
+        Closes a connection and forgets its prepared statements.
+
+        Args:
+            conn (mysql.connector.connection.MySQLConnection): The connection to discard.
+        """
+        if conn is None:
+            return
+        with self._lock:
+            self._statements.pop(id(conn), None)
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
+
+    def _cursor(self, conn, sql):
+        """
+        Returns the prepared cursor for a query on a connection, preparing it on first use.
+
+        Args:
+            conn (mysql.connector.connection.MySQLConnection): The connection.
+            sql (str): The SQL query.
+
+        Returns:
+            mysql.connector.cursor.MySQLCursorPrepared: The prepared cursor.
+        """
+        if self.pool_size == 0:
+            return conn.cursor(prepared=True)
+        with self._lock:
+            statements = self._statements.setdefault(id(conn), {})
+            if sql not in statements:
+                statements[sql] = conn.cursor(prepared=True)
+            return statements[sql]
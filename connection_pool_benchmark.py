@@ -0,0 +1,60 @@
+"""
+Benchmark for the pooled connection layer of the PokemonDatabaseManager.
+
+Builds the same sequence of questions once with a new connection per query, as the manager
+did before pooling, and once with the connection pool and prepared statements. Requires the
+local MySQL server configured in `PokemonDatabaseManager` with a filled database.
+
+Usage:
+    python connection_pool_benchmark.py [questions]
+"""
+
+import random
+import statistics
+import sys
+import time
+from database_manager import PokemonDatabaseManager, create_backend
+from question import Question
+
+def measure_questions(db_manager, count, seed=42):
+    """
+    Measures the time needed to build a number of questions.
+
+    Args:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        count (int): The number of questions to build.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        list: The latency of every question in milliseconds.
+    """
+    random.seed(seed)
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        Question(db_manager)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    results = {}
+    for label, pool_size in (("Connection per query", 0), ("Pooled, prepared", 5)):
+        db_manager = PokemonDatabaseManager(
+            backend=create_backend('mysql', pool_size=pool_size))
+        db_manager.fill_database()
+        measure_questions(db_manager, 5)
+        results[label] = measure_questions(db_manager, count)
+        db_manager.close()
+
+    print(f"Questions per run: {count}")
+    for label, latencies in results.items():
+        print(f"{label:<22} mean {statistics.mean(latencies):7.2f} ms, "
+              f"median {statistics.median(latencies):7.2f} ms, "
+              f"max {max(latencies):7.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,35 @@ CREATE TABLE IF NOT EXISTS pokemon (
     pokedex_number INT PRIMARY KEY,
     name VARCHAR(100),
     original_image LONGBLOB,
-    black_image LONGBLOB
+    black_image LONGBLOB -- silhouette mask as a 1-bit or grayscale PNG
 );
 
 CREATE TABLE IF NOT EXISTS highscores (
+    id INT AUTO_INCREMENT PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
-    score INT NOT NULL
-)
\ No newline at end of file
+    score INT NOT NULL,
+    mode VARCHAR(32) NOT NULL DEFAULT 'All Pokemon',
+    entry_id CHAR(32) NULL UNIQUE,
+    INDEX idx_highscores_mode_score (mode, score DESC, id)
+);
+
+CREATE TABLE IF NOT EXISTS highscore_counts (
+    mode VARCHAR(32) NOT NULL,
+    score INT NOT NULL,
+    entries INT NOT NULL,
+    PRIMARY KEY (mode, score)
+);
+
+-- The highscores_count trigger is created by MySQLBackend.migrate_highscores, once the
+-- highscores table has its mode column.
+CREATE TABLE IF NOT EXISTS pokemon_variants (
+    pokedex_number INT NOT NULL,
+    size INT NOT NULL,
+    original_image MEDIUMBLOB,
+    black_image MEDIUMBLOB,
+    PRIMARY KEY (pokedex_number, size)
+);
+
+CREATE TABLE IF NOT EXISTS schema_info (
+    version VARCHAR(64) NOT NULL -- hash of this script, checked at startup
+);
@@ -0,0 +1,40 @@
+CREATE TABLE IF NOT EXISTS pokemon (
+    pokedex_number INTEGER PRIMARY KEY,
+    name TEXT,
+    original_image BLOB,
+    black_image BLOB -- silhouette mask as a 1-bit or grayscale PNG
+);
+
+CREATE TABLE IF NOT EXISTS highscores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    mode TEXT NOT NULL DEFAULT 'All Pokemon',
+    entry_id TEXT UNIQUE
+);
+
+CREATE INDEX IF NOT EXISTS idx_highscores_mode_score ON highscores (mode, score DESC, id);
+
+CREATE TABLE IF NOT EXISTS highscore_counts (
+    mode TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    entries INTEGER NOT NULL,
+    PRIMARY KEY (mode, score)
+);
+
+CREATE TRIGGER IF NOT EXISTS highscores_count AFTER INSERT ON highscores BEGIN
+    INSERT INTO highscore_counts (mode, score, entries) VALUES (NEW.mode, NEW.score, 1)
+    ON CONFLICT (mode, score) DO UPDATE SET entries = entries + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS pokemon_variants (
+    pokedex_number INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    original_image BLOB,
+    black_image BLOB,
+    PRIMARY KEY (pokedex_number, size)
+);
+
+CREATE TABLE IF NOT EXISTS schema_info (
+    version TEXT NOT NULL -- hash of this script, checked at startup
+);
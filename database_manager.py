@@ -1,78 +1,162 @@
 """
 This module provides functionality to manage a Pokémon database. It includes methods to fetch
-Pokémon data from the PokeAPI, process and store the data in a MySQL database, and retrieve Pokémon
-information such as names, images, and highscores.
+Pokémon data from the PokeAPI, process and store the data in a database, and retrieve Pokémon
+information such as names, images, and highscores. The database is accessed through a storage
+backend, MySQL by default or an embedded SQLite file.
+
+The HTTP client and the ingest pipeline, with `requests`, `asyncio` and the process pool, are
+imported only when the database has to be filled, so starting with a filled database does not
+load them.
 """
 
-import os
-import io
-import time
+import threading
 from io import BytesIO
-from concurrent.futures import ThreadPoolExecutor
-import requests
-import mysql.connector
 from PIL import Image
+from silhouette import SilhouetteEngine
+from name_index import PokemonNameIndex
+from image_cache import ImageCache
+from leaderboard import Leaderboard
+from memory_profiler import MEMORY
+from metrics import METRICS
+from highscore_writer import HighscoreWriter
+from storage_backend import DEFAULT_MODE
+from image_variants import ImageVariantEncoder
+from sprite_pack import SpritePack
+
+def create_backend(kind='mysql', **options):
+    """
+    Creates a storage backend by name. The database driver is imported only for the backend
+    that is used, so SQLite deployments do not need the MySQL connector.
+
+    Args:
+        kind (str): 'mysql' or 'sqlite'.
+        **options: Keyword arguments of the backend class.
+
+    Returns:
+        StorageBackend: The backend.
+
+    Raises:
+        ValueError: If the kind is unknown.
+    """
+    # pylint: disable=import-outside-toplevel
+    if kind == 'mysql':
+        from mysql_backend import MySQLBackend
+        return MySQLBackend(**options)
+    if kind == 'sqlite':
+        from sqlite_backend import SQLiteBackend
+        return SQLiteBackend(**options)
+    raise ValueError(f"Unknown storage backend: {kind}")
 
 class PokemonDatabaseManager:
     """
-    A class to manage Pokémon data in a MySQL database. It provides methods to fetch data from the
+    A class to manage Pokémon data in a database. It provides methods to fetch data from the
     PokeAPI, process and store the data, and retrieve Pokémon information and highscores.
     """
 
-    def __init__(self, max_pokedex_number=1025):
+    def __init__(  # pylint: disable=too-many-arguments
+            self, max_pokedex_number=1025, *, image_cache_bytes=64 * 1024 * 1024,
+            api_base_url="https://pokeapi.co/api/v2/pokemon", http_cache_dir='http_cache',
+            offline=False, image_store='database', sprite_pack_path='sprites.pack',
+            backend=None, checkpoint_path='ingest_checkpoint.json',
+            highscore_journal_path='highscores.journal'):
         """
         Initializes the PokemonDatabaseManager with database configuration and API URL.
 
         Args:
             max_pokedex_number (int): The maximum Pokédex number to fetch from the PokeAPI.
-        """
-        self.db_config = {
-            'host': 'localhost',
-            'user': 'root',
-            'password': 'passwort',
-            'database': 'pokemon_db'
-        }
+            image_cache_bytes (int): The budget of the decoded image cache in bytes.
+            api_base_url (str): The PokeAPI endpoint listing the Pokémon, for example a local
+                                stand-in server for tests.
+            http_cache_dir (str): The directory of the on-disk HTTP cache, or None to disable it.
+            offline (bool): If True, ingestion uses only responses from the HTTP cache.
+            image_store (str): Where the images are read from: 'database', or 'pack' to serve
+                               them from the memory-mapped sprite pack at `sprite_pack_path`.
+            sprite_pack_path (str): The path of the sprite pack file.
+            backend (StorageBackend, optional): The storage backend. Defaults to a
+                                                `MySQLBackend` for the local server.
+            checkpoint_path (str): The file recording the progress of `fill_database`, so
+                                   that an interrupted run resumes.
+            highscore_journal_path (str): The journal of highscores not yet written to the
+                                          database.
+
+        Raises:
+            ValueError: If the image store is unknown.
+        """
+        if image_store not in ('database', 'pack'):
+            raise ValueError(f"Unknown image store: {image_store}")
         self.max_pokedex_number = max_pokedex_number
-        self.api_url = f"https://pokeapi.co/api/v2/pokemon?limit={self.max_pokedex_number}"
-        self.run_sql_script('createdatabase.sql')
+        self.api_base_url = api_base_url.rstrip('/')
+        self.checkpoint_path = checkpoint_path
+        self.silhouette_engine = SilhouetteEngine()
+        self.variant_encoder = ImageVariantEncoder()
+        self.http_cache_dir = http_cache_dir
+        self.offline = offline
+        self._http_client = None
+        self.backend = backend or create_backend('mysql')
+        self.backend.initialize(migrations=(self._migrate_silhouettes,))
+        self.leaderboards = {}
+        self._leaderboards_lock = threading.Lock()
+        self.highscore_journal_path = highscore_journal_path
+        self.highscore_writer = None
+        self._highscore_writer_lock = threading.Lock()
+        self._name_index = None
+        self._name_index_lock = threading.Lock()
+        self.image_cache = ImageCache(image_cache_bytes)
+        self.sprite_pack_path = sprite_pack_path
+        self.sprite_pack = None
+        if image_store == 'pack':
+            try:
+                self.sprite_pack = SpritePack(sprite_pack_path)
+            except (OSError, ValueError) as error:
+                print(f"Sprite pack unavailable, reading images from the database: {error}")
 
     def connect_to_database(self):
         """
-        Establishes a connection to the MySQL database.
+        Establishes a new connection to the database.
 
         Returns:
-            mysql.connector.connection.MySQLConnection: A connection object to the database.
+            object: A DB-API connection object to the database.
         """
-        return mysql.connector.connect(**self.db_config)
+        return self.backend.connect()
 
-    def fetch_pokemon_data(self):
+    def close(self):
+        """
+        Stops the highscore writer and closes the database connections, the HTTP client and
+        the sprite pack.
         """
-        Sends a request to the PokeAPI to fetch Pokémon data.
+        self.stop_highscore_writer()
+        self.backend.close()
+        if self._http_client:
+            self._http_client.close()
+        if self.sprite_pack:
+            self.sprite_pack.close()
+            self.sprite_pack = None
 
-        Returns:
-            dict: The JSON response containing Pokémon data, or None if the request fails.
+    @property
+    def http_client(self):
+        """
+        The PokeAPI client with the on-disk HTTP cache, created on first access.
         """
-        response = requests.get(self.api_url, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        print("Error while requesting data from the PokeAPI")
-        return None
+        if self._http_client is None:
+            # pylint: disable=import-outside-toplevel
+            from http_cache import HttpCache
+            from pokeapi_client import PokeApiClient
+            cache = (HttpCache(self.http_cache_dir, offline=self.offline)
+                     if self.http_cache_dir else None)
+            self._http_client = PokeApiClient(cache=cache)
+        return self._http_client
 
-    def fetch_pokemon_details(self, pokemon_url):
+    def _pokemon_url(self, pokedex_number):
         """
-        Fetches detailed data for a specific Pokémon from the PokeAPI.
+        Returns the PokeAPI URL with the details of a Pokémon.
 
         Args:
-            pokemon_url (str): The URL to fetch the Pokémon details.
+            pokedex_number (int): The Pokédex number of the Pokémon.
 
         Returns:
-            dict: The JSON response containing Pokémon details, or None if the request fails.
+            str: The URL of the Pokémon's details.
         """
-        response = requests.get(pokemon_url, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        print(f"Error while fetching details from {pokemon_url}")
-        return None
+        return f"{self.api_base_url}/{pokedex_number}/"
 
     def convert_to_black(self, image):
         """
@@ -84,251 +168,404 @@ class PokemonDatabaseManager:
         Returns:
             PIL.Image.Image: The black version of the image.
         """
-        image = image.convert('RGBA')
-        pixels = image.load()
-        width, height = image.size
-        for y in range(height):
-            for x in range(width):
-                a = pixels[x, y][3]
-                if a > 0:
-                    pixels[x, y] = (0, 0, 0, 255)
-        return image
+        return self.silhouette_engine.convert(image)
 
-    def save_pokemon_batch_to_database(self, cursor, pokemon_data, batch_size=100):
+    async def fetch_pokemon_artwork_async(self, pokemon):
         """
-        Saves multiple Pokémon data entries to the MySQL database in smaller batches.
+        Fetches the details and the official artwork of a single Pokémon from asyncio, using
+        the shared keep-alive HTTP client.
 
         Args:
-            cursor (mysql.connector.cursor.MySQLCursor): The database cursor.
-            pokemon_data (list): A list of Pokémon data tuples to be inserted.
-            batch_size (int): The size of each batch for insertion.
+            pokemon (dict): A dictionary containing Pokémon data from the PokeAPI.
+
+        Returns:
+            tuple: A tuple containing Pokémon ID, name, and the downloaded artwork,
+                   or None if fetching fails.
         """
-        sql = '''
-        INSERT IGNORE INTO pokemon (pokedex_number, name, original_image, black_image)
-        VALUES (%s, %s, %s, %s)
-        '''
-        for i in range(0, len(pokemon_data), batch_size):
-            batch = pokemon_data[i:i + batch_size]
-            cursor.executemany(sql, batch)
+        return await self.http_client.fetch_artwork_async(pokemon['url'])
 
-    def fetch_and_process_pokemon(self, pokemon):
+    @MEMORY.profiled('fill_database.ingest')
+    def process_pokemon_data_parallel(self, data, conn, checkpoint=None):
         """
-        Fetches and processes data for a single Pokémon.
+        Processes Pokémon data in a streaming pipeline and saves it to the database.
+
+        Downloads run in an asyncio stage, image processing in a process pool, and every batch
+        is committed as soon as it is full.
 
         Args:
-            pokemon (dict): A dictionary containing Pokémon data from the PokeAPI.
+            data (dict): The Pokémon data fetched from the PokeAPI.
+            conn (object): The database connection.
+            checkpoint (IngestCheckpoint, optional): The checkpoint to update after every commit.
 
         Returns:
-            tuple: A tuple containing Pokémon ID, name, original image blob, and black image blob,
-                   or None if processing fails.
+            IngestPipeline: The pipeline that ran, with the statistics of its stages.
         """
-        pokemon_details = self.fetch_pokemon_details(pokemon['url'])
-        if not pokemon_details:
-            return None
+        from ingest_pipeline import IngestPipeline  # pylint: disable=import-outside-toplevel
+        pipeline = IngestPipeline(self, checkpoint=checkpoint)
+        saved = pipeline.run(data['results'], conn)
+        print(f"{saved} Pokémon records saved.")
+        pipeline.print_stats()
+        print(self.http_client.summary())
+        return pipeline
 
-        pokemon_name = pokemon_details['name']
-        pokemon_id = pokemon_details['id']
-        front_sprite_url = pokemon_details['sprites']['other']['official-artwork']['front_default']
+    def get_pokemon_name(self, pokedex_number):
+        """
+        Retrieves the name of a Pokémon by its Pokédex number from the name index.
 
-        print(f"Fetching Pokémon: {pokemon_name} (ID: {pokemon_id})")
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
 
-        if front_sprite_url:
-            img_response = requests.get(front_sprite_url, timeout=10)
-            if img_response.status_code == 200:
-                original_image = Image.open(io.BytesIO(img_response.content))
+        Returns:
+            str: The name of the Pokémon, or None if not found.
+        """
+        return self.get_name_index().get_name(pokedex_number)
 
-                original_image_blob = io.BytesIO()
-                original_image.save(original_image_blob, format='PNG')
-                original_image_blob.seek(0)
+    def get_pokemon_image(self, pokedex_number, size=None):
+        """
+        Retrieves the original image of a Pokémon as a PIL image.
 
-                black_image = self.convert_to_black(original_image)
-                black_image_blob = io.BytesIO()
-                black_image.save(black_image_blob, format='PNG')
-                black_image_blob.seek(0)
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            size (int, optional): The edge length the image is shown at. The nearest stored
+                                  variant that is at least as large is used. If None, the
+                                  full-resolution image is returned.
 
-                return (
-                    pokemon_id, pokemon_name, original_image_blob.read(), black_image_blob.read())
-        return None
+        Returns:
+            PIL.Image.Image: The original image of the Pokémon, or None if not found.
+        """
+        variant_size = self.variant_encoder.nearest(size)
+        return self.image_cache.get_or_load(
+            pokedex_number, self._cache_variant('original', variant_size),
+            lambda: self._load_images(('original_image',), pokedex_number, variant_size)[0])
 
-    def process_pokemon_data_parallel(self, data, cursor):
+    def get_black_image(self, pokedex_number, size=None):
         """
-        Processes Pokémon data in parallel and saves it to the database.
+        Retrieves the black image of a Pokémon as a PIL image.
 
         Args:
-            data (dict): The Pokémon data fetched from the PokeAPI.
-            cursor (mysql.connector.cursor.MySQLCursor): The database cursor.
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            size (int, optional): The edge length the image is shown at. The nearest stored
+                                  variant that is at least as large is used. If None, the
+                                  full-resolution image is returned.
+
+        Returns:
+            PIL.Image.Image: The black image of the Pokémon, or None if not found.
         """
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            pokemon_batch = list(executor.map(self.fetch_and_process_pokemon, data['results']))
+        variant_size = self.variant_encoder.nearest(size)
+        return self.image_cache.get_or_load(
+            pokedex_number, self._cache_variant('black', variant_size),
+            lambda: self._load_images(('black_image',), pokedex_number, variant_size)[0])
 
-        pokemon_batch = [p for p in pokemon_batch if p]
+    def _load_images(self, columns, pokedex_number, variant_size=None):
+        """
+        Loads image columns of a Pokémon from the sprite pack, if one is used, or else from
+        the database. Pokémon missing from the pack, for example those ingested after it was
+        exported, are loaded from the database. If the requested variant was not stored, for
+        example for rows ingested before variants existed, the full-resolution images are
+        loaded instead.
 
-        self.save_pokemon_batch_to_database(cursor, pokemon_batch)
-        print(f"{len(pokemon_batch)} Pokémon records saved.")
+        Args:
+            columns (tuple): The names of the image columns.
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            variant_size (int, optional): The size of the variant, or None for full resolution.
 
-    def get_pokemon_name(self, pokedex_number):
+        Returns:
+            list: The images in the order of `columns`, or None for each if not found.
+        """
+        if self.sprite_pack:
+            images = self._load_packed_images(columns, pokedex_number, variant_size)
+            if images is not None:
+                return images
+
+        result = self.backend.load_images(columns, pokedex_number, variant_size)
+        if not result:
+            return [None] * len(columns)
+        return [self._open_silhouette(result[column]) if column == 'black_image'
+                else self._open_image(result[column]) for column in columns]
+
+    def _load_packed_images(self, columns, pokedex_number, variant_size=None):
         """
-        Retrieves the name of a Pokémon by its Pokédex number.
+        Loads images of a Pokémon from the sprite pack, falling back to full resolution like
+        `_load_images`.
 
         Args:
+            columns (tuple): The names of the image columns.
             pokedex_number (int): The Pokédex number of the Pokémon.
+            variant_size (int, optional): The size of the variant, or None for full resolution.
 
         Returns:
-            str: The name of the Pokémon, or None if not found.
+            list: The images in the order of `columns`, or None if one of them is not in the
+                  pack.
+        """
+        blobs = []
+        for column in columns:
+            kind = 'black' if column == 'black_image' else 'original'
+            data = self.sprite_pack.get(pokedex_number, kind, variant_size)
+            if data is None and variant_size is not None:
+                data = self.sprite_pack.get(pokedex_number, kind)
+            if data is None:
+                return None
+            blobs.append((kind, data))
+        return [self._open_silhouette(data) if kind == 'black' else self._open_image(data)
+                for kind, data in blobs]
+
+    @staticmethod
+    def _cache_variant(kind, variant_size):
+        """
+        Builds the image cache variant name of an image.
+
+        Args:
+            kind (str): 'original' or 'black'.
+            variant_size (int): The size of the variant, or None for full resolution.
+
+        Returns:
+            str: The variant name.
         """
-        conn = self.connect_to_database()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute('SELECT name FROM pokemon WHERE pokedex_number = %s', (pokedex_number,))
-        result = cursor.fetchone()
-        conn.close()
-        if result:
-            return result['name'].capitalize()
-        return None
+        return kind if variant_size is None else f"{kind}@{variant_size}"
 
-    def get_pokemon_image(self, pokedex_number):
+    def get_name_index(self):
         """
-        Retrieves the original image of a Pokémon as a PIL image.
+        Returns the in-memory name index, loading it with one query on first use.
+
+        Returns:
+            PokemonNameIndex: The index of the Pokémon present in the database.
+        """
+        with self._name_index_lock:
+            if self._name_index is None:
+                self._name_index = PokemonNameIndex(self.backend.load_names())
+            return self._name_index
+
+    @MEMORY.profiled('fill_database.name_index')
+    def _refresh_name_index(self):
+        """
+        Reloads the name index, for example after new Pokémon were ingested.
+
+        Returns:
+            PokemonNameIndex: The reloaded index.
+        """
+        with self._name_index_lock:
+            self._name_index = None
+        return self.get_name_index()
+
+    def get_question_bundle(self, pokedex_number, size=None):
+        """
+        Retrieves what a question needs up front: the name of the Pokémon from the name index
+        and its black image from the image cache or the database. The original image is
+        loaded when the answer is revealed, with `get_pokemon_image`.
 
         Args:
-            pokedex_number (int): The Pokédex number of the Pokémon.
+            pokedex_number (int): The Pokédex number of the Pokémon to guess.
+            size (int, optional): The edge length the images are shown at, as for
+                                  `get_pokemon_image`.
 
         Returns:
-            PIL.Image.Image: The original image of the Pokémon, or None if not found.
+            dict: A dictionary with the 'name' and 'black_image' of the Pokémon, or None if
+                  the Pokémon is not found.
         """
-        conn = self.connect_to_database()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(
-            'SELECT original_image FROM pokemon WHERE pokedex_number = %s', (pokedex_number,))
-        result = cursor.fetchone()
-        conn.close()
-
-        if result and result['original_image']:
-            image_data = result['original_image']
-            image = Image.open(BytesIO(image_data))
-            return image
-        return None
+        name = self.get_pokemon_name(pokedex_number)
+        if name is None:
+            return None
+        return {'name': name, 'black_image': self.get_black_image(pokedex_number, size)}
 
-    def get_black_image(self, pokedex_number):
+    @staticmethod
+    def _open_image(image_data):
         """
-        Retrieves the black image of a Pokémon as a PIL image.
+        Opens and decodes an image blob from the database as a PIL image. The image is
+        decoded right away, in the thread that reads it, rather than when it is first drawn.
 
         Args:
-            pokedex_number (int): The Pokédex number of the Pokémon.
+            image_data (bytes): The PNG data, or None.
 
         Returns:
-            PIL.Image.Image: The black image of the Pokémon, or None if not found.
+            PIL.Image.Image: The image, or None if there is no data.
         """
-        conn = self.connect_to_database()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(
-            'SELECT black_image FROM pokemon WHERE pokedex_number = %s', (pokedex_number,))
-        result = cursor.fetchone()
-        conn.close()
-
-        if result and result['black_image']:
-            image_data = result['black_image']
+        if not image_data:
+            return None
+        with METRICS.span('png_decode_seconds', image='database'):
             image = Image.open(BytesIO(image_data))
-            return image
-        return None
+            image.load()
+        return image
 
-    def set_highscore(self, name, score):
+    def _open_silhouette(self, image_data):
         """
-        Saves a highscore to the database.
+        Opens a silhouette blob from the database and composites the black image from it.
 
         Args:
-            name (str): The name of the player.
-            score (int): The score of the player.
+            image_data (bytes): The mask PNG, a legacy RGBA PNG, or None.
+
+        Returns:
+            PIL.Image.Image: The black image, or None if there is no data.
         """
-        conn = self.connect_to_database()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute('INSERT INTO highscores (name, score) VALUES (%s, %s)', (name, score))
-        conn.commit()
-        conn.close()
+        image = self._open_image(image_data)
+        if image is not None and image.mode in ('1', 'L'):
+            return self.silhouette_engine.composite(image)
+        return image
 
-    def get_highscore(self):
+    @MEMORY.profiled('migrate_silhouettes')
+    def _migrate_silhouettes(self, batch_size=100):
         """
-        Retrieves the top 10 highscores from the database.
+        Converts legacy RGBA silhouettes to masks. Legacy rows are found by the color type
+        byte of their PNG header, so rows that are already migrated are not read. It runs
+        when the schema of the database is upgraded, as rows ingested since masks were
+        introduced are masks already.
+
+        Args:
+            batch_size (int): The number of rows converted per transaction.
 
         Returns:
-            list: A list of dictionaries containing player names and scores.
-        """
-        conn = self.connect_to_database()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute('SELECT name, score FROM highscores ORDER BY score DESC LIMIT 10')
-        result = cursor.fetchall()
-        conn.close()
-        return result
+            int: The number of migrated rows.
+        """
+        migrated = 0
+        saved_bytes = 0
+        last_number = 0
+        while True:
+            rows = self.backend.legacy_silhouettes(last_number, batch_size)
+            if not rows:
+                break
+            last_number = rows[-1]['pokedex_number']
+
+            updates = []
+            for row in rows:
+                try:
+                    mask = self.silhouette_engine.encode_mask(self._open_image(row['black_image']))
+                except (OSError, ValueError) as error:
+                    print(f"Error while migrating the silhouette of #{row['pokedex_number']}: "
+                          f"{error}")
+                    continue
+                saved_bytes += len(row['black_image']) - len(mask)
+                updates.append((mask, row['pokedex_number']))
+            if updates:
+                self.backend.update_silhouettes(updates)
+            migrated += len(updates)
+
+        if migrated:
+            print(f"Migrated {migrated} silhouettes to masks, saving "
+                  f"{saved_bytes / 1024 / 1024:.1f} MiB.")
+        return migrated
+
+    def get_leaderboard(self, mode=DEFAULT_MODE):
+        """
+        Returns the leaderboard cache of a game mode, creating it on first use. It includes
+        the queued highscores that are not saved yet.
+
+        Args:
+            mode (str): The game mode.
 
-    def fill_database(self):
+        Returns:
+            Leaderboard: The leaderboard of the mode.
         """
-        Main function to populate the database with Pokémon data.
+        self.get_highscore_writer()
+        return self._leaderboard(mode)
 
-        Checks if the database is already filled. If not, fetches data from the PokeAPI,
-        processes it, and stores it in the database.
+    def _leaderboard(self, mode):
         """
-        print("Checking database...")
-        if self.get_highest_pokedex_number() >= self.max_pokedex_number:
-            print("Database is already filled with Pokémon data.")
-            return
+        Returns the leaderboard cache of a game mode, creating it on first use.
 
-        print("Filling database with Pokémon data...")
-        start_time = time.time()
+        Args:
+            mode (str): The game mode.
 
-        conn = self.connect_to_database()
-        cursor = conn.cursor()
-        data = self.fetch_pokemon_data()
+        Returns:
+            Leaderboard: The leaderboard of the mode.
+        """
+        with self._leaderboards_lock:
+            leaderboard = self.leaderboards.get(mode)
+            if leaderboard is None:
+                leaderboard = self.leaderboards[mode] = Leaderboard(self.backend, mode)
+            return leaderboard
 
-        if data:
-            self.process_pokemon_data_parallel(data, cursor)
-            conn.commit()
+    def get_highscore_writer(self):
+        """
+        Returns the background writer of queued highscores. On first use, the highscores left
+        in its journal by a previous run are added to the leaderboards and the writer is
+        started.
 
-        conn.close()
+        Returns:
+            HighscoreWriter: The running writer.
+        """
+        with self._highscore_writer_lock:
+            if self.highscore_writer is None:
+                writer = HighscoreWriter(self.backend, self.highscore_journal_path)
+                for entry in writer.pending():
+                    self._leaderboard(entry['mode']).record(entry['name'], entry['score'])
+                self.highscore_writer = writer
+            self.highscore_writer.start()
+            return self.highscore_writer
 
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        print(f"Database population completed. Duration: {elapsed_time:.2f} seconds")
+    def stop_highscore_writer(self, timeout=5.0):
+        """
+        Gives the highscore writer time to save the queued highscores and stops it.
+        Highscores that are not saved stay in the journal for the next run.
 
-    def get_highest_pokedex_number(self):
+        Args:
+            timeout (float): The maximum number of seconds to wait.
         """
-        Retrieves the highest Pokédex number from the database.
+        with self._highscore_writer_lock:
+            writer = self.highscore_writer
+        if writer:
+            writer.stop(timeout)
 
-        Returns:
-            int: The highest Pokédex number, or None if the table is empty.
+    def set_highscore(self, name, score, mode=DEFAULT_MODE):
         """
-        conn = self.connect_to_database()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute('SELECT MAX(pokedex_number) AS highest_pokedex_number FROM pokemon')
-        result = cursor.fetchone()
-        conn.close()
+        Saves a highscore to the database and waits for the commit.
 
-        if result and result['highest_pokedex_number'] is not None:
-            return int(result['highest_pokedex_number'])
-        return 0
+        Args:
+            name (str): The name of the player.
+            score (int): The score of the player.
+            mode (str): The game mode the score was earned in.
+        """
+        self.get_leaderboard(mode).add(name, score)
 
-    def run_sql_script(self, script_path):
+    def get_highscore(self, mode=DEFAULT_MODE):
         """
-        Executes an SQL script to set up the database and tables.
+        Retrieves the top 10 highscores of a game mode from its leaderboard cache.
 
         Args:
-            script_path (str): The file path to the SQL script.
+            mode (str): The game mode.
+
+        Returns:
+            list: A list of dictionaries containing player names and scores.
         """
-        if not os.path.exists(script_path):
-            print(f"SQL script not found at {script_path}")
-            return
+        return self.get_leaderboard(mode).top(10)
 
-        db_config_without_db = self.db_config.copy()
-        db_config_without_db.pop('database', None)
+    @MEMORY.profiled('fill_database')
+    def fill_database(self, progress=None):
+        """
+        Main function to populate the database with Pokémon data.
 
-        conn = mysql.connector.connect(**db_config_without_db)
-        cursor = conn.cursor()
+        Determines which Pokédex numbers are missing from the database and fetches, processes
+        and stores only those. Progress is recorded in a checkpoint file, so an interrupted
+        run resumes where it stopped.
 
-        with open(script_path, 'r', encoding='utf-8') as file:
-            sql_script = file.read()
-            for statement in sql_script.split(';'):
-                if statement.strip():
-                    cursor.execute(statement)
-        conn.commit()
-        print("SQL script executed successfully.")
+        Args:
+            progress (callable, optional): Called with the number of saved and of planned
+                                           Pokémon of the run after every commit.
 
-        cursor.close()
-        conn.close()
+        Returns:
+            IngestPipeline: The pipeline that ingested the missing Pokémon, or None if the
+                            database was already filled.
+        """
+        print("Checking database...")
+        with MEMORY.phase('fill_database.plan'):
+            missing = self.backend.missing_pokedex_numbers(self.max_pokedex_number)
+        if not missing:
+            print("Database is already filled with Pokémon data.")
+            return None
+
+        from ingest_pipeline import IngestCheckpoint  # pylint: disable=import-outside-toplevel
+        checkpoint = IngestCheckpoint(self.checkpoint_path, on_progress=progress)
+        missing = checkpoint.start(missing)
+        print(f"Filling database with {len(missing)} missing Pokémon...")
+
+        conn = self.connect_to_database()
+        try:
+            data = {'results': [{'url': self._pokemon_url(number)} for number in missing]}
+            pipeline = self.process_pokemon_data_parallel(data, conn, checkpoint)
+        finally:
+            conn.close()
+        self._refresh_name_index()
+
+        if checkpoint.finish():
+            print("Database population completed.")
+        else:
+            print("Database population incomplete. Missing Pokémon are fetched on the next run.")
+        return pipeline
@@ -4,10 +4,65 @@ Unit tests for the PokemonDatabaseManager class.
 This module contains test cases to verify the functionality of the
 PokemonDatabaseManager class, including methods for connecting to the database,
 retrieving Pokémon data, and managing highscores.
+
+The database is filled from the local PokeAPI stub. The tests run against a temporary SQLite
+database, or against the local MySQL server if the environment variable
+POKEMON_DB_BACKEND is set to 'mysql'.
 """
 
+import os
+import shutil
+import tempfile
 import unittest
-from database_manager import PokemonDatabaseManager
+from concurrent.futures import ThreadPoolExecutor
+from database_manager import PokemonDatabaseManager, create_backend
+from pokeapi_stub import PokeApiStub
+from question import Question
+from scoreboard import Scoreboard
+from sprite_pack import SpritePackWriter
+
+BACKEND = os.environ.get('POKEMON_DB_BACKEND', 'sqlite')
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """
+    A single-threaded executor that counts the submitted work.
+    """
+
+    def __init__(self):
+        """
+        Initializes the RecordingExecutor.
+        """
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        """
+        Counts and submits work.
+
+        Args:
+            fn (callable): The work.
+            *args: The positional arguments of the work.
+            **kwargs: The keyword arguments of the work.
+
+        Returns:
+            concurrent.futures.Future: The future of the work.
+        """
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+def make_backend(directory):
+    """
+    Creates the storage backend selected for the tests.
+
+    Args:
+        directory (str): A temporary directory for the SQLite database.
+
+    Returns:
+        StorageBackend: The backend.
+    """
+    if BACKEND == 'sqlite':
+        return create_backend('sqlite', path=os.path.join(directory, 'pokemon.db'))
+    return create_backend(BACKEND)
 
 class TestDatabaseManager(unittest.TestCase):
     """
@@ -18,12 +73,28 @@ class TestDatabaseManager(unittest.TestCase):
     for database operations and Pokémon data retrieval.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the test case by creating an instance of PokemonDatabaseManager.
+        Start the PokeAPI stub with ten Pokémon and fill a database from it.
         """
-        self.db_manager = PokemonDatabaseManager(10)
-        self.db_manager.fill_database()
+        cls.stub = PokeApiStub(max_pokedex_number=10, artwork_size=64).start()
+        cls.directory = tempfile.mkdtemp()
+        cls.db_manager = PokemonDatabaseManager(
+            10, api_base_url=cls.stub.api_base_url, http_cache_dir=None,
+            backend=make_backend(cls.directory),
+            checkpoint_path=os.path.join(cls.directory, 'checkpoint.json'),
+            highscore_journal_path=os.path.join(cls.directory, 'highscores.journal'))
+        cls.db_manager.fill_database()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Close the manager, stop the stub and remove the temporary directory.
+        """
+        cls.db_manager.close()
+        cls.stub.stop()
+        shutil.rmtree(cls.directory, ignore_errors=True)
 
     def test_get_pokemon_name(self):
         """
@@ -47,6 +118,14 @@ class TestDatabaseManager(unittest.TestCase):
         """
         black_image = self.db_manager.get_black_image(1)
         self.assertIsNotNone(black_image)
+        self.assertEqual(black_image.mode, 'RGBA')
+
+    def test_get_image_variant(self):
+        """
+        Test that a size picks the stored display variant.
+        """
+        self.assertEqual(self.db_manager.get_black_image(2, 300).size, (64, 64))
+        self.assertLessEqual(max(self.db_manager.get_pokemon_image(2, 96).size), 96)
 
     def test_get_highscore(self):
         """
@@ -55,5 +134,100 @@ class TestDatabaseManager(unittest.TestCase):
         highscores = self.db_manager.get_highscore()
         self.assertIsInstance(highscores, list)
 
+    def test_scoreboard(self):
+        """
+        Test that submitted highscores are returned best first.
+        """
+        scoreboard = Scoreboard(self.db_manager)
+        scoreboard.submit_highscore("Ash", 3)
+        scoreboard.submit_highscore("Misty", 7)
+        self.assertEqual([row['name'] for row in scoreboard.get_highscores()[:2]],
+                         ["Misty", "Ash"])
+        self.assertTrue(self.db_manager.get_highscore_writer().flush(5))
+        self.assertEqual([row['name'] for row in self.db_manager.backend.top_highscores(2)],
+                         ["Misty", "Ash"])
+
+    def test_scoreboard_per_mode(self):
+        """
+        Test that highscores of a mode only appear on the scoreboard of that mode.
+        """
+        scoreboard = Scoreboard(self.db_manager)
+        scoreboard.submit_highscore("Brock", 1000, "Generation 2")
+        self.assertEqual(scoreboard.get_highscores("Generation 2")[0]['name'], "Brock")
+        self.assertNotIn("Brock", [row['name'] for row in scoreboard.get_highscores()])
+        self.assertEqual(scoreboard.get_rank(1001, "Generation 2"), (1, 1))
+
+    def test_question(self):
+        """
+        Test that a question is built from the database.
+        """
+        question = Question(self.db_manager, (1, 10), image_size=300)
+        self.assertIn(question.get_correct_answer(), question.get_choices())
+        self.assertIsNotNone(question.get_black_image())
+        self.assertIsNotNone(question.get_original_image())
+
+    def test_original_image_is_warmed_once(self):
+        """
+        Test that warming a question loads its original image once, however often it is
+        warmed.
+        """
+        question = Question(self.db_manager, (1, 10), image_size=300)
+        with RecordingExecutor() as executor:
+            question.warm_original_image(executor)
+            question.warm_original_image(executor)
+        question.warm_original_image(executor)
+        self.assertEqual(executor.submitted, 1)
+        self.assertIsNotNone(question.get_original_image())
+
+    def test_pokemon_missing_from_sprite_pack(self):
+        """
+        Test that the images of a Pokémon missing from the sprite pack are loaded from the
+        database.
+        """
+        pack_path = os.path.join(self.directory, 'sprites.pack')
+        with SpritePackWriter(pack_path, 10) as pack:
+            pack.add(1, 'original', None, self.db_manager.backend.load_images(
+                ('original_image',), 1)['original_image'])
+        db_manager = PokemonDatabaseManager(
+            10, api_base_url=self.stub.api_base_url, http_cache_dir=None, image_store='pack',
+            sprite_pack_path=pack_path, backend=make_backend(self.directory))
+        try:
+            self.assertIsNotNone(db_manager.sprite_pack)
+            self.assertIsNotNone(db_manager.get_pokemon_image(1))
+            self.assertIsNotNone(db_manager.get_black_image(1))
+            self.assertIsNotNone(db_manager.get_pokemon_image(2, 300))
+            self.assertIsNotNone(db_manager.get_black_image(2, 300))
+        finally:
+            db_manager.close()
+
+    def test_silhouettes_are_migrated_on_upgrade(self):
+        """
+        Test that legacy RGBA silhouettes are converted to masks when the schema is upgraded,
+        and left alone by `fill_database` otherwise.
+        """
+        backend = self.db_manager.backend
+        artwork = backend.load_images(('original_image',), 3)['original_image']
+        backend.update_silhouettes([(artwork, 3)])
+        self.db_manager.fill_database()
+        self.assertEqual([row['pokedex_number'] for row in backend.legacy_silhouettes(0, 10)],
+                         [3])
+
+        backend.execute("UPDATE schema_info SET version = 'old'")
+        PokemonDatabaseManager(
+            10, api_base_url=self.stub.api_base_url, http_cache_dir=None,
+            backend=make_backend(self.directory)).close()
+        self.assertEqual(backend.legacy_silhouettes(0, 10), [])
+        self.assertEqual(backend.stored_schema_version(), backend.schema_version())
+        self.assertIsNotNone(self.db_manager.get_black_image(3))
+
+    def test_fill_database_is_idempotent(self):
+        """
+        Test that a filled database is not fetched again.
+        """
+        requests = len(self.stub.requests)
+        self.db_manager.fill_database()
+        self.assertEqual(len(self.stub.requests), requests)
+        self.assertEqual(self.db_manager.backend.highest_pokedex_number(), 10)
+
 if __name__ == '__main__':
     unittest.main()
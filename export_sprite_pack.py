@@ -0,0 +1,56 @@
+"""
+Exports the images of the Pokémon database to a sprite pack file, which the game reads
+instead of the database when it is started with --sprite-pack. Exporting again appends only
+the images that are missing from the pack.
+
+Usage:
+    python export_sprite_pack.py [sprites.pack] [--sqlite]
+"""
+
+import sys
+from database_manager import PokemonDatabaseManager, create_backend
+from sprite_pack import SpritePackWriter
+
+def export_sprite_pack(db_manager, path=None, batch_size=50):
+    """
+    Writes the images of all Pokémon in the database to a sprite pack. Images that are
+    already in the pack are skipped, so exporting again only appends new Pokémon.
+
+    Args:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        path (str, optional): The path of the pack file. Defaults to the `sprite_pack_path`
+                              of the manager.
+        batch_size (int): The number of Pokémon read per query.
+
+    Returns:
+        int: The number of images appended.
+    """
+    added = 0
+    max_pokedex_number = db_manager.max_pokedex_number
+    with SpritePackWriter(path or db_manager.sprite_pack_path, max_pokedex_number,
+                          db_manager.variant_encoder.sizes) as pack:
+        for low in range(1, max_pokedex_number + 1, batch_size):
+            high = min(low + batch_size - 1, max_pokedex_number)
+            for row in db_manager.backend.image_rows(low, high):
+                size = row.get('size')
+                for kind, column in (('original', 'original_image'), ('black', 'black_image')):
+                    if row[column] and not pack.has(row['pokedex_number'], kind, size):
+                        pack.add(row['pokedex_number'], kind, size, row[column])
+                        added += 1
+    print(f"Exported {added} images to the sprite pack.")
+    return added
+
+def main():
+    """
+    Exports the sprite pack.
+    """
+    paths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    backend = 'sqlite' if '--sqlite' in sys.argv[1:] else 'mysql'
+    db_manager = PokemonDatabaseManager(backend=create_backend(backend))
+    try:
+        export_sprite_pack(db_manager, paths[0] if paths else None)
+    finally:
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Benchmark for the gameplay hot path.
+
+Plays seeded games through `PokemonGame` without a window, in every mode: a question is taken
+with `next_question`, its silhouette is decoded as `ask_question` would, the original image is
+warmed on a worker thread, as the window's executor does, and after the player's think time the
+answer is revealed with the original image. The database is a disposable SQLite file filled
+from the local PokeAPI stub. Each strategy plays the same seeded games:
+
+* baseline: no image cache, every question is built when it is needed.
+* cache: the decoded image cache of the database manager.
+* prefetch: questions are built ahead in the background, without the image cache.
+* cache + prefetch: both, as the game runs by default.
+* sprite pack: the images are read from the memory-mapped sprite pack.
+* MySQL per query and MySQL pooled: a new connection per query against the connection
+  pool, if the local MySQL server is reachable. Missing Pokémon are ingested into it first.
+
+For every strategy and mode, the p50, p95 and p99 latency of `next_question` and of the
+reveal, the database round trips per question and the image decode time per question are
+printed. The round trips are the queries sent to the storage backend, including those of
+the prefetch thread.
+
+Usage:
+    python gameplay_benchmark.py [questions per mode] [pokemon] [think ms]
+"""
+
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from database_manager import PokemonDatabaseManager, create_backend
+from export_sprite_pack import export_sprite_pack
+from pokeapi_stub import PokeApiStub
+from pokemon_game import PokemonGame
+
+MODES = ["All Pokemon"] + [f"Generation {generation}" for generation in range(1, 10)]
+IMAGE_SIZE = 300
+
+class GameplayProbe:  # pylint: disable=too-few-public-methods
+    """
+    Counts the database round trips and times the image decoding of a database manager.
+
+    Attributes:
+        round_trips (int): The number of queries sent to the storage backend.
+        decode_time (float): The seconds spent decoding images.
+    """
+
+    def __init__(self, db_manager):
+        """
+        Initializes the GameplayProbe and wraps the query and decode methods of a manager.
+
+        Args:
+            db_manager (PokemonDatabaseManager): The database manager instance.
+        """
+        self.round_trips = 0
+        self.decode_time = 0.0
+        self._lock = threading.Lock()
+        backend = db_manager.backend
+        for name in ('fetch_all', 'execute', 'execute_many'):
+            setattr(backend, name, self._count(getattr(backend, name)))
+        open_image = db_manager._open_image  # pylint: disable=protected-access
+
+        def open_and_decode(image_data):
+            start = time.perf_counter()
+            image = open_image(image_data)
+            with self._lock:
+                self.decode_time += time.perf_counter() - start
+            return image
+        db_manager._open_image = open_and_decode  # pylint: disable=protected-access
+
+    def _count(self, method):
+        """
+        Wraps a backend method so that every call is counted as a round trip.
+
+        Args:
+            method (callable): The bound backend method.
+
+        Returns:
+            callable: The counting method.
+        """
+        def counted(*args, **kwargs):
+            with self._lock:
+                self.round_trips += 1
+            return method(*args, **kwargs)
+        return counted
+
+    def snapshot(self):
+        """
+        Returns the current counters.
+
+        Returns:
+            tuple: The round trips and the decode time in seconds.
+        """
+        with self._lock:
+            return self.round_trips, self.decode_time
+
+def percentile(values, fraction):
+    """
+    Returns a percentile of a list of values.
+
+    Args:
+        values (list): The values.
+        fraction (float): The percentile as a fraction, for example 0.95.
+
+    Returns:
+        float: The value below which the fraction of the values lies.
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def play_mode(game, probe, mode, *, count, think_time, seed):  # pylint: disable=too-many-arguments
+    """
+    Plays a number of questions of a mode.
+
+    Args:
+        game (PokemonGame): The game.
+        probe (GameplayProbe): The probe of the game's database manager.
+        mode (str): The name of the mode.
+        count (int): The number of questions.
+        think_time (float): The seconds the player takes to answer.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        dict: The latencies in milliseconds of the questions and the reveals, and the round
+              trips and decode milliseconds per question.
+    """
+    random.seed(seed)
+    game.change_mode(mode)
+    game.start_new_game()
+    round_trips, decode_time = probe.snapshot()
+    questions, reveals = [], []
+    with ThreadPoolExecutor(max_workers=1) as warmer:
+        for _ in range(count):
+            start = time.perf_counter()
+            game.next_question()
+            question = game.get_current_question()
+            question.get_black_image().load()
+            questions.append((time.perf_counter() - start) * 1000)
+            question.warm_original_image(warmer)
+
+            time.sleep(think_time)
+            start = time.perf_counter()
+            question.get_original_image().load()
+            reveals.append((time.perf_counter() - start) * 1000)
+    end_round_trips, end_decode_time = probe.snapshot()
+    return {
+        'questions': questions,
+        'reveals': reveals,
+        'round_trips': (end_round_trips - round_trips) / count,
+        'decode_ms': (end_decode_time - decode_time) * 1000 / count,
+    }
+
+def playable(db_manager, mode):
+    """
+    Checks whether the database holds Pokémon of a mode.
+
+    Args:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        mode (str): The name of the mode.
+
+    Returns:
+        bool: True if a question of the mode can be built.
+    """
+    game = PokemonGame(db_manager, prefetch_depth=0)
+    game.change_mode(mode)
+    return db_manager.get_name_index().count_in_range(*game.mode) > 0
+
+def run_strategy(backend, options, count, think_time, stub):
+    """
+    Plays every mode with one strategy. Pokémon missing from the database of the strategy
+    are ingested from the stub first.
+
+    Args:
+        backend (StorageBackend): The backend of the database.
+        options (dict): The `image_cache_bytes`, `prefetch_depth`, `image_store` and
+                        `sprite_pack_path` of the strategy.
+        count (int): The number of questions per mode.
+        think_time (float): The seconds the player takes to answer.
+        stub (PokeApiStub): The running PokeAPI stub.
+
+    Returns:
+        dict: The results of `play_mode` keyed by mode.
+    """
+    db_manager = PokemonDatabaseManager(
+        stub.max_pokedex_number, image_cache_bytes=options['image_cache_bytes'],
+        api_base_url=stub.api_base_url, http_cache_dir=None,
+        image_store=options['image_store'], sprite_pack_path=options['sprite_pack_path'],
+        backend=backend, checkpoint_path=options['checkpoint_path'])
+    db_manager.fill_database()
+    probe = GameplayProbe(db_manager)
+    game = PokemonGame(db_manager, prefetch_depth=options['prefetch_depth'],
+                       image_size=IMAGE_SIZE)
+    results = {}
+    try:
+        for seed, mode in enumerate(MODES):
+            if playable(db_manager, mode):
+                results[mode] = play_mode(
+                    game, probe, mode, count=count, think_time=think_time, seed=seed)
+    finally:
+        game.shutdown()
+        db_manager.close()
+    return results
+
+def fill(directory, stub):
+    """
+    Fills a disposable SQLite database and a sprite pack from the PokeAPI stub.
+
+    Args:
+        directory (str): The temporary directory of the database.
+        stub (PokeApiStub): The running PokeAPI stub.
+
+    Returns:
+        tuple: The path of the database and the path of the sprite pack.
+    """
+    path = os.path.join(directory, 'pokemon.db')
+    pack_path = os.path.join(directory, 'sprites.pack')
+    db_manager = PokemonDatabaseManager(
+        stub.max_pokedex_number, api_base_url=stub.api_base_url, http_cache_dir=None,
+        sprite_pack_path=pack_path, backend=create_backend('sqlite', path=path),
+        checkpoint_path=os.path.join(directory, 'checkpoint.json'))
+    try:
+        db_manager.fill_database()
+        export_sprite_pack(db_manager)
+    finally:
+        db_manager.close()
+    return path, pack_path
+
+def strategies(directory, path, pack_path):
+    """
+    Lists the strategies to compare.
+
+    Args:
+        directory (str): The temporary directory of the database.
+        path (str): The path of the SQLite database.
+        pack_path (str): The path of the sprite pack.
+
+    Returns:
+        list: Pairs of a label and a function creating the backend and the options.
+    """
+    def options(image_cache_bytes, prefetch_depth, image_store='database'):
+        return {'image_cache_bytes': image_cache_bytes, 'prefetch_depth': prefetch_depth,
+                'image_store': image_store, 'sprite_pack_path': pack_path,
+                'checkpoint_path': os.path.join(directory, 'checkpoint.json')}
+
+    def sqlite(image_cache_bytes, prefetch_depth, image_store='database'):
+        return lambda: (create_backend('sqlite', path=path),
+                        options(image_cache_bytes, prefetch_depth, image_store))
+
+    def mysql(pool_size):
+        return lambda: (create_backend('mysql', pool_size=pool_size), options(0, 0))
+
+    return [
+        ("baseline", sqlite(0, 0)),
+        ("cache", sqlite(64 * 1024 * 1024, 0)),
+        ("prefetch", sqlite(0, 3)),
+        ("cache + prefetch", sqlite(64 * 1024 * 1024, 3)),
+        ("sprite pack", sqlite(0, 0, 'pack')),
+        ("MySQL per query", mysql(0)),
+        ("MySQL pooled", mysql(5)),
+    ]
+
+def print_results(label, results):
+    """
+    Prints the results of a strategy, one line per mode and a total.
+
+    Args:
+        label (str): The label of the strategy.
+        results (dict): The results of `play_mode` keyed by mode.
+    """
+    print(label)
+    total = {'questions': [], 'reveals': [], 'round_trips': [], 'decode_ms': []}
+    for mode, result in list(results.items()) + [("Total", None)]:
+        if result is None:
+            result = {'questions': total['questions'], 'reveals': total['reveals'],
+                      'round_trips': statistics.mean(total['round_trips']),
+                      'decode_ms': statistics.mean(total['decode_ms'])}
+        else:
+            for key, value in result.items():
+                total[key] += value if isinstance(value, list) else [value]
+        questions = result['questions']
+        print(f"    {mode:<13} question p50 {percentile(questions, 0.5):6.2f} ms, "
+              f"p95 {percentile(questions, 0.95):6.2f} ms, "
+              f"p99 {percentile(questions, 0.99):6.2f} ms, "
+              f"reveal p95 {percentile(result['reveals'], 0.95):6.2f} ms, "
+              f"{result['round_trips']:4.2f} round trips, "
+              f"decode {result['decode_ms']:5.2f} ms")
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    max_pokedex_number = int(sys.argv[2]) if len(sys.argv) > 2 else 1025
+    think_time = (float(sys.argv[3]) if len(sys.argv) > 3 else 5.0) / 1000
+    directory = tempfile.mkdtemp()
+    try:
+        with PokeApiStub(max_pokedex_number) as stub:
+            path, pack_path = fill(directory, stub)
+            print(f"Pokémon: {max_pokedex_number}, questions per mode: {count}, "
+                  f"think time: {think_time * 1000:.0f} ms")
+            for label, create in strategies(directory, path, pack_path):
+                try:
+                    backend, options = create()
+                    backend.initialize()
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    print(f"{label} skipped: {error}")
+                    continue
+                print_results(label, run_strategy(backend, options, count, think_time, stub))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+highscore_writer Module
+
+This module provides the `HighscoreWriter` class, which saves highscores in the background so
+that submitting a score never waits for the database. Every submission is first appended to a
+journal file and synced to disk, then a worker thread inserts the journaled highscores in
+batches and retries with a growing delay while the database fails. Each highscore carries a
+unique entry id that is saved with it, so a batch that was committed shortly before a crash is
+recognized on restart instead of being inserted twice. The journal is emptied whenever all of
+its highscores are saved.
+"""
+
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+class HighscoreWriter:
+    """
+    A durable queue of highscores flushed to a storage backend by a worker thread.
+
+    Attributes:
+        backend (StorageBackend): The backend storing the highscores.
+        journal_path (str): The path of the append-only journal file.
+        batch_size (int): The maximum number of highscores inserted together.
+        retry_delay (float): The delay in seconds before the first retry of a failed batch.
+        max_retry_delay (float): The maximum delay in seconds between retries.
+        written (int): The number of highscores saved to the backend.
+        failures (int): The number of failed batches.
+    """
+
+    def __init__(self, backend, journal_path='highscores.journal', batch_size=50,
+                 retry_delay=0.5, max_retry_delay=30.0):
+        """
+        Initializes the HighscoreWriter and recovers the highscores left in the journal by a
+        previous run. The worker thread starts with `start`.
+
+        Args:
+            backend (StorageBackend): The backend storing the highscores.
+            journal_path (str): The path of the append-only journal file.
+            batch_size (int): The maximum number of highscores inserted together.
+            retry_delay (float): The delay in seconds before the first retry of a failed batch.
+            max_retry_delay (float): The maximum delay in seconds between retries.
+        """
+        self.backend = backend
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.written = 0
+        self.failures = 0
+        self._pending = OrderedDict()
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._recover()
+
+    def pending(self):
+        """
+        Returns the highscores not yet saved to the backend.
+
+        Returns:
+            list: Dictionaries with the 'id', 'name', 'score' and 'mode', oldest first.
+        """
+        with self._condition:
+            return [dict(entry) for entry in self._pending.values()]
+
+    def start(self):
+        """
+        Starts the worker thread.
+        """
+        with self._condition:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def submit(self, name, score, mode):
+        """
+        Journals a highscore and queues it for the worker. The highscore is on disk when this
+        method returns.
+
+        Args:
+            name (str): The name of the player.
+            score (int): The score of the player.
+            mode (str): The game mode the score was earned in.
+
+        Returns:
+            dict: The journaled highscore with its entry 'id'.
+        """
+        entry = {'id': uuid.uuid4().hex, 'name': name, 'score': score, 'mode': mode}
+        with self._condition:
+            self._append({'submit': entry})
+            self._pending[entry['id']] = entry
+            self._condition.notify_all()
+        return entry
+
+    def flush(self, timeout=None):
+        """
+        Waits until all queued highscores are saved.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+
+        Returns:
+            bool: True if no highscore is pending.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+    def stop(self, timeout=5.0):
+        """
+        Gives the worker thread time to save the queued highscores, then stops it. Highscores
+        that could not be saved stay in the journal for the next run.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait for the queue to drain.
+        """
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        """
+        Saves the queued highscores batch by batch until the writer is stopped.
+        """
+        delay = self.retry_delay
+        while not self._stopped.is_set():
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._pending or self._stopped.is_set())
+                batch = list(self._pending.values())[:self.batch_size]
+            if not batch:
+                continue
+            try:
+                self.backend.add_highscores(
+                    [(entry['id'], entry['name'], entry['score'], entry['mode'])
+                     for entry in batch])
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.failures += 1
+                print(f"Saving {len(batch)} highscores failed, retrying in {delay:.1f} s: "
+                      f"{error}")
+                self._stopped.wait(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+                continue
+            delay = self.retry_delay
+            self._mark_written([entry['id'] for entry in batch])
+
+    def _mark_written(self, entry_ids):
+        """
+        Records saved highscores in the journal and empties the journal once nothing is
+        pending.
+
+        Args:
+            entry_ids (list): The entry ids of the saved highscores.
+        """
+        with self._condition:
+            for entry_id in entry_ids:
+                self._pending.pop(entry_id, None)
+            self.written += len(entry_ids)
+            if self._pending:
+                self._append({'written': entry_ids})
+            else:
+                with open(self.journal_path, 'w', encoding='utf-8'):
+                    pass
+            self._condition.notify_all()
+
+    def _append(self, record):
+        """
+        Appends a record to the journal and syncs it to disk. The caller holds the lock.
+
+        Args:
+            record (dict): The record.
+        """
+        with open(self.journal_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _recover(self):
+        """
+        Loads the highscores of the journal that were not saved, skipping a record torn by a
+        crash and highscores whose batch was committed without being marked, and rewrites the
+        journal with the remaining ones.
+        """
+        if not os.path.exists(self.journal_path):
+            return
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+        except OSError as error:
+            print(f"Could not read the highscore journal at {self.journal_path}: {error}")
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'submit' in record:
+                self._pending[record['submit']['id']] = record['submit']
+            for entry_id in record.get('written', ()):
+                self._pending.pop(entry_id, None)
+        if self._pending:
+            try:
+                for entry_id in self.backend.highscore_entries(list(self._pending)):
+                    self._pending.pop(entry_id, None)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                print(f"Could not check the journaled highscores, saving them again: {error}")
+        temporary_path = self.journal_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            for entry in self._pending.values():
+                file.write(json.dumps({'submit': entry}) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.journal_path)
+        if self._pending:
+            print(f"Recovered {len(self._pending)} unsaved highscores from the journal.")
@@ -0,0 +1,139 @@
+"""
+Unit tests for the HighscoreWriter class.
+
+This module contains test cases that check that journaled highscores reach an SQLite
+database in the background, survive database failures and are recovered exactly once after
+a crash.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from highscore_writer import HighscoreWriter
+from sqlite_backend import SQLiteBackend
+
+class FlakySQLiteBackend(SQLiteBackend):
+    """
+    An SQLite backend whose highscore batches fail a given number of times.
+    """
+
+    def __init__(self, path, failures=0):
+        """
+        Initializes the FlakySQLiteBackend.
+
+        Args:
+            path (str): The path of the database file.
+            failures (int): The number of batches that fail before batches succeed.
+        """
+        super().__init__(path)
+        self.failures = failures
+
+    def add_highscores(self, entries):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("database unavailable")
+        super().add_highscores(entries)
+
+class TestHighscoreWriter(unittest.TestCase):
+    """
+    Test suite for the HighscoreWriter class.
+    """
+
+    def setUp(self):
+        """
+        Create a database and a journal path in a temporary directory.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.directory, 'highscores.journal')
+        self.backend = FlakySQLiteBackend(os.path.join(self.directory, 'pokemon.db'))
+        self.backend.initialize()
+
+    def tearDown(self):
+        """
+        Close the backend and remove the temporary directory.
+        """
+        self.backend.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def saved(self, mode='All Pokemon'):
+        """
+        Loads the saved highscores of a mode.
+
+        Args:
+            mode (str): The game mode.
+
+        Returns:
+            list: (name, score) tuples, best first.
+        """
+        return [(row['name'], row['score'])
+                for row in self.backend.top_highscores(100, mode)]
+
+    def test_submit_and_flush(self):
+        """
+        Test that submitted highscores are saved and the journal is emptied.
+        """
+        writer = HighscoreWriter(self.backend, self.journal_path)
+        writer.start()
+        writer.submit("Ash", 3, 'All Pokemon')
+        writer.submit("Misty", 7, 'Generation 1')
+        self.assertTrue(writer.flush(5))
+        writer.stop()
+        self.assertEqual(self.saved(), [("Ash", 3)])
+        self.assertEqual(self.saved('Generation 1'), [("Misty", 7)])
+        self.assertEqual(os.path.getsize(self.journal_path), 0)
+        self.assertEqual(writer.written, 2)
+
+    def test_retries_failed_batches(self):
+        """
+        Test that a batch is retried until the database accepts it.
+        """
+        self.backend.failures = 2
+        writer = HighscoreWriter(self.backend, self.journal_path, retry_delay=0.01)
+        writer.start()
+        writer.submit("Brock", 5, 'All Pokemon')
+        self.assertTrue(writer.flush(5))
+        writer.stop()
+        self.assertEqual(writer.failures, 2)
+        self.assertEqual(self.saved(), [("Brock", 5)])
+
+    def test_unsaved_highscores_stay_journaled(self):
+        """
+        Test that highscores submitted while the database is down are kept in the journal.
+        """
+        self.backend.failures = 1000
+        writer = HighscoreWriter(self.backend, self.journal_path, retry_delay=0.01)
+        writer.start()
+        writer.submit("Gary", 9, 'All Pokemon')
+        writer.stop(timeout=0.1)
+        recovered = HighscoreWriter(self.backend, self.journal_path)
+        self.assertEqual([entry['name'] for entry in recovered.pending()], ["Gary"])
+
+    def test_recovery_after_crash(self):
+        """
+        Test that a restart saves every journaled highscore exactly once, even if its batch
+        was committed without being marked or the last record was torn.
+        """
+        records = [{'submit': {'id': 'a' * 32, 'name': "Ash", 'score': 3,
+                               'mode': 'All Pokemon'}},
+                   {'submit': {'id': 'b' * 32, 'name': "Misty", 'score': 7,
+                               'mode': 'All Pokemon'}},
+                   {'submit': {'id': 'c' * 32, 'name': "Brock", 'score': 5,
+                               'mode': 'All Pokemon'}},
+                   {'written': ['c' * 32]}]
+        with open(self.journal_path, 'w', encoding='utf-8') as file:
+            for record in records:
+                file.write(json.dumps(record) + '\n')
+            file.write('{"submit": {"id": "d')
+        self.backend.add_highscores([('b' * 32, "Misty", 7, 'All Pokemon')])
+
+        writer = HighscoreWriter(self.backend, self.journal_path)
+        self.assertEqual([entry['name'] for entry in writer.pending()], ["Ash"])
+        writer.start()
+        self.assertTrue(writer.flush(5))
+        writer.stop()
+        self.assertEqual(self.saved(), [("Misty", 7), ("Ash", 3)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,344 @@
+"""
+http_cache Module
+
+This module provides the `HttpCache` class, an on-disk cache for PokeAPI responses. Response
+bodies are stored content-addressed by their SHA-256 hash, so identical bodies are kept once,
+and every cached URL remembers the ETag and Last-Modified headers needed to revalidate it with
+a conditional request. The cache has a size cap and evicts the least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+class CachedResponse:  # pylint: disable=too-few-public-methods
+    """
+    A response served from the cache, with the attributes of `requests.Response` used by the
+    `PokeApiClient`.
+
+    Attributes:
+        url (str): The requested URL.
+        status_code (int): Always 200.
+        content (bytes): The cached body.
+    """
+
+    def __init__(self, url, content):
+        """
+        Initializes the CachedResponse.
+
+        Args:
+            url (str): The requested URL.
+            content (bytes): The cached body.
+        """
+        self.url = url
+        self.status_code = 200
+        self.content = content
+
+    def json(self):
+        """
+        Decodes the body as JSON.
+
+        Returns:
+            dict: The decoded document.
+        """
+        return json.loads(self.content)
+
+class HttpCache:
+    """
+    A content-addressed on-disk cache of HTTP response bodies with validators.
+
+    Attributes:
+        directory (str): The root directory of the cache.
+        max_bytes (int): The maximum total size of the cached bodies.
+        offline (bool): If True, the network must not be used and only cached bodies are served.
+        hits (int): The number of responses served from the cache without revalidation.
+        revalidated (int): The number of cached bodies confirmed by a 304 response.
+        stored (int): The number of bodies written to the cache.
+        evictions (int): The number of entries evicted to stay within the size cap.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024, offline=False):
+        """
+        Initializes the HttpCache and indexes the entries already on disk.
+
+        Args:
+            directory (str): The root directory of the cache. It is created if necessary.
+            max_bytes (int): The maximum total size of the cached bodies.
+            offline (bool): Whether to serve only cached bodies without using the network.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = 0
+        self.revalidated = 0
+        self.stored = 0
+        self.evictions = 0
+        self._entries = {}
+        self._bodies = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(self._path('meta'), exist_ok=True)
+        os.makedirs(self._path('bodies'), exist_ok=True)
+        self._load_index()
+
+    def lookup(self, url):
+        """
+        Looks up the cache entry of a URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            dict: The entry with the 'url', 'etag', 'last_modified', 'body' hash and 'size',
+                  or None if the URL is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(url))
+            return dict(entry) if entry else None
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Builds the headers of a conditional request for a cached entry.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            dict: The If-None-Match and If-Modified-Since headers.
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read(self, entry, revalidated=False):
+        """
+        Reads the body of a cache entry and marks the entry as recently used.
+
+        Args:
+            entry (dict): The cache entry.
+            revalidated (bool): Whether the server confirmed the entry with a 304 response.
+
+        Returns:
+            CachedResponse: The cached response, or None if the body is missing on disk.
+        """
+        try:
+            with open(self._path('bodies', entry['body']), 'rb') as file:
+                content = file.read()
+        except OSError:
+            with self._lock:
+                self._drop(self._key(entry['url']))
+            return None
+
+        key = self._key(entry['url'])
+        with self._lock:
+            if key in self._entries:
+                self._entries[key]['last_used'] = time.time()
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.hits += 1
+        try:
+            os.utime(self._path('meta', f"{key}.json"))
+        except OSError:
+            pass
+        return CachedResponse(entry['url'], content)
+
+    def store(self, url, headers, content):
+        """
+        Stores a response body and its validators, then evicts entries over the size cap.
+
+        Args:
+            url (str): The requested URL.
+            headers (dict): The response headers.
+            content (bytes): The response body.
+        """
+        body = hashlib.sha256(content).hexdigest()
+        body_path = self._path('bodies', body)
+        if not os.path.exists(body_path):
+            self._write(body_path, content)
+
+        key = self._key(url)
+        entry = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'body': body,
+            'size': len(content),
+        }
+        self._write(self._path('meta', f"{key}.json"), json.dumps(entry).encode('utf-8'))
+        entry['last_used'] = time.time()
+
+        with self._lock:
+            replaced_body = self._drop(key)
+            self._add(key, entry)
+            self.stored += 1
+            evicted = self._evict(keep=key)
+        if replaced_body and replaced_body != body:
+            self._remove(None, replaced_body)
+        for old_key, old_body in evicted:
+            self._remove(old_key, old_body)
+
+    def size(self):
+        """
+        Returns the total size of the cached bodies.
+
+        Returns:
+            int: The size in bytes.
+        """
+        with self._lock:
+            return self._bytes
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            dict: The 'entries', 'bytes', 'hits', 'revalidated', 'stored' and 'evictions'.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'stored': self.stored,
+                'evictions': self.evictions,
+            }
+
+    def _add(self, key, entry):
+        """
+        Adds an entry to the index and counts its body. Must hold the lock.
+
+        Args:
+            key (str): The key of the entry.
+            entry (dict): The entry.
+        """
+        self._entries[key] = entry
+        body = self._bodies.setdefault(entry['body'], [entry['size'], 0])
+        if body[1] == 0:
+            self._bytes += body[0]
+        body[1] += 1
+
+    def _drop(self, key):
+        """
+        Removes an entry from the index. Must hold the lock.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            str: The hash of the entry's body if no other entry uses it, otherwise None.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        body = self._bodies[entry['body']]
+        body[1] -= 1
+        if body[1] > 0:
+            return None
+        del self._bodies[entry['body']]
+        self._bytes -= body[0]
+        return entry['body']
+
+    def _evict(self, keep):
+        """
+        Drops the least recently used entries until the cache fits its size cap. Must hold
+        the lock.
+
+        Args:
+            keep (str): The key of an entry that must not be evicted.
+
+        Returns:
+            list: The keys and body hashes of the evicted entries.
+        """
+        evicted = []
+        if self._bytes <= self.max_bytes:
+            return evicted
+        by_age = sorted(self._entries.items(), key=lambda item: item[1]['last_used'])
+        for key, _ in by_age:
+            if self._bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            evicted.append((key, self._drop(key)))
+            self.evictions += 1
+        return evicted
+
+    def _remove(self, key, body):
+        """
+        Removes the files of an evicted entry.
+
+        Args:
+            key (str): The key of the entry, or None to remove only a body.
+            body (str): The hash of its body, or None if another entry still uses the body.
+        """
+        paths = [self._path('meta', f"{key}.json")] if key else []
+        if body:
+            paths.append(self._path('bodies', body))
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _load_index(self):
+        """
+        Reads the metadata of all entries on disk into memory.
+        """
+        meta_directory = self._path('meta')
+        for name in os.listdir(meta_directory):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(meta_directory, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    entry = json.load(file)
+                entry['last_used'] = os.path.getmtime(path)
+            except (OSError, ValueError):
+                continue
+            self._add(name[:-len('.json')], entry)
+
+    def _path(self, *parts):
+        """
+        Builds a path inside the cache directory.
+
+        Args:
+            *parts (str): The path components.
+
+        Returns:
+            str: The path.
+        """
+        return os.path.join(self.directory, *parts)
+
+    @staticmethod
+    def _key(url):
+        """
+        Computes the key of a URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            str: The SHA-256 hash of the URL.
+        """
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _write(path, data):
+        """
+        Atomically writes a file.
+
+        Args:
+            path (str): The file path.
+            data (bytes): The file content.
+        """
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
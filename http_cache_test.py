@@ -0,0 +1,110 @@
+"""
+Unit tests for the HttpCache class.
+
+This module contains test cases that run the cached HTTP client against the local stand-in
+server and check revalidation, offline mode and the size cap.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from http_cache import HttpCache
+from pokeapi_client import PokeApiClient
+from pokeapi_stub import PokeApiStub
+
+class TestHttpCache(unittest.TestCase):
+    """
+    Test suite for the HttpCache class.
+    """
+
+    def setUp(self):
+        """
+        Start a stub server with 12 Pokémon and create an empty cache directory.
+        """
+        self.stub = PokeApiStub(max_pokedex_number=12, artwork_size=32).start()
+        self.directory = tempfile.mkdtemp()
+        self.clients = []
+
+    def tearDown(self):
+        """
+        Close the clients, stop the stub server and remove the cache directory.
+        """
+        for client in self.clients:
+            client.close()
+        self.stub.stop()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def client(self, **options):
+        """
+        Creates a client with a cache in the test directory.
+
+        Args:
+            **options: Keyword arguments of the `HttpCache`.
+
+        Returns:
+            PokeApiClient: The client.
+        """
+        client = PokeApiClient(max_in_flight=2, retries=1, backoff=0.01,
+                               cache=HttpCache(self.directory, **options))
+        self.clients.append(client)
+        return client
+
+    def test_revalidates_with_etag(self):
+        """
+        Test that a cached response is revalidated with a conditional request and served
+        from the cache on 304.
+        """
+        url = f"{self.stub.api_base_url}/1/"
+        first = self.client().get_json(url)
+        client = self.client()
+        self.assertEqual(client.get_json(url), first)
+        self.assertEqual(self.stub.not_modified, 1)
+        self.assertEqual(client.cache.stats()['revalidated'], 1)
+
+    def test_offline_mode_uses_only_cache(self):
+        """
+        Test that offline mode serves cached responses without any request and fails fast
+        for uncached URLs.
+        """
+        url = f"{self.stub.base_url}/artwork/4.png"
+        artwork = self.client().get_bytes(url)
+        requests_before = len(self.stub.requests)
+
+        client = self.client(offline=True)
+        self.assertEqual(client.get_bytes(url), artwork)
+        self.assertIsNone(client.get_bytes(f"{self.stub.base_url}/artwork/5.png"))
+        self.assertEqual(len(self.stub.requests), requests_before)
+        self.assertEqual(client.timings[-1].attempts, 1)
+
+    def test_identical_bodies_are_stored_once(self):
+        """
+        Test that bodies are content-addressed and shared between URLs.
+        """
+        cache = HttpCache(self.directory)
+        cache.store('http://example/a', {}, b'same body')
+        cache.store('http://example/b', {}, b'same body')
+        self.assertEqual(cache.size(), len(b'same body'))
+        self.assertEqual(len(os.listdir(os.path.join(self.directory, 'bodies'))), 1)
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test that the oldest entries are evicted when the size cap is exceeded and that the
+        index survives a restart.
+        """
+        cache = HttpCache(self.directory, max_bytes=25)
+        cache.store('http://example/a', {'ETag': '"a"'}, b'a' * 10)
+        cache.store('http://example/b', {}, b'b' * 10)
+        cache.read(cache.lookup('http://example/a'))
+        cache.store('http://example/c', {}, b'c' * 10)
+
+        self.assertIsNotNone(cache.lookup('http://example/a'))
+        self.assertIsNone(cache.lookup('http://example/b'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+        reopened = HttpCache(self.directory, max_bytes=25)
+        self.assertEqual(reopened.size(), 20)
+        self.assertEqual(reopened.lookup('http://example/a')['etag'], '"a"')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+image_cache Module
+
+This module provides the `ImageCache` class, a thread-safe least-recently-used cache for
+decoded Pokémon images. Entries are keyed by Pokédex number and variant, and eviction is
+driven by the decoded size of the images rather than by the number of entries.
+"""
+
+import threading
+from collections import OrderedDict
+
+class ImageCache:
+    """
+    A byte-budgeted LRU cache of decoded PIL images.
+
+    Attributes:
+        max_bytes (int): The maximum total decoded size of the cached images.
+        current_bytes (int): The current total decoded size of the cached images.
+        hits (int): The number of lookups that found an image.
+        misses (int): The number of lookups that did not find an image.
+        evictions (int): The number of images evicted to stay within the budget.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Initializes the ImageCache.
+
+        Args:
+            max_bytes (int): The maximum total decoded size of the cached images. If 0, the
+                             cache stores nothing.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def image_size(image):
+        """
+        Computes the decoded size of an image in bytes.
+
+        Args:
+            image (PIL.Image.Image): The image.
+
+        Returns:
+            int: The number of bytes of the decoded pixel data.
+        """
+        return image.width * image.height * len(image.getbands())
+
+    def get(self, pokedex_number, variant):
+        """
+        Looks up an image and marks it as recently used.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            variant (str): The image variant, for example 'original' or 'black'.
+
+        Returns:
+            PIL.Image.Image: The cached image, or None if it is not cached.
+        """
+        key = (pokedex_number, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, pokedex_number, variant, image):
+        """
+        Stores a decoded image and evicts the least recently used images over the budget.
+
+        The image is fully decoded before it is stored. Images larger than the whole budget
+        are not cached.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            variant (str): The image variant, for example 'original' or 'black'.
+            image (PIL.Image.Image): The image to cache.
+        """
+        image.load()
+        size = self.image_size(image)
+        key = (pokedex_number, variant)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (image, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_load(self, pokedex_number, variant, loader):
+        """
+        Returns a cached image, or loads and caches it on a miss.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            variant (str): The image variant, for example 'original' or 'black'.
+            loader (callable): Called without arguments on a miss. Returns the image or None.
+
+        Returns:
+            PIL.Image.Image: The image, or None if the loader returned None.
+        """
+        image = self.get(pokedex_number, variant)
+        if image is None:
+            image = loader()
+            if image is not None:
+                self.put(pokedex_number, variant, image)
+        return image
+
+    def clear(self):
+        """
+        Removes all images from the cache. The counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            dict: The 'entries', 'bytes', 'max_bytes', 'hits', 'misses' and 'evictions'.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,112 @@
+"""
+Unit tests for the ImageCache class.
+
+This module contains test cases to verify lookups, byte-based eviction, the counters and
+concurrent use of the image cache.
+"""
+
+import threading
+import unittest
+from PIL import Image
+from image_cache import ImageCache
+
+def make_image(size=10):
+    """
+    Creates an RGBA image of size x size pixels, which decodes to size * size * 4 bytes.
+
+    Args:
+        size (int): The width and height of the image.
+
+    Returns:
+        PIL.Image.Image: The image.
+    """
+    return Image.new('RGBA', (size, size), (0, 0, 0, 255))
+
+class TestImageCache(unittest.TestCase):
+    """
+    Test suite for the ImageCache class.
+    """
+
+    def setUp(self):
+        """
+        Set up a cache with room for two 10x10 RGBA images.
+        """
+        self.cache = ImageCache(max_bytes=800)
+
+    def test_hit_and_miss(self):
+        """
+        Test that cached images are found and that hits and misses are counted.
+        """
+        image = make_image()
+        self.assertIsNone(self.cache.get(1, 'black'))
+        self.cache.put(1, 'black', image)
+        self.assertIs(self.cache.get(1, 'black'), image)
+        self.assertIsNone(self.cache.get(1, 'original'))
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+        self.assertEqual(stats['bytes'], 400)
+
+    def test_evicts_least_recently_used_by_size(self):
+        """
+        Test that the least recently used image is evicted once the byte budget is exceeded.
+        """
+        self.cache.put(1, 'black', make_image())
+        self.cache.put(2, 'black', make_image())
+        self.cache.get(1, 'black')
+        self.cache.put(3, 'black', make_image())
+        self.assertIsNone(self.cache.get(2, 'black'))
+        self.assertIsNotNone(self.cache.get(1, 'black'))
+        self.assertIsNotNone(self.cache.get(3, 'black'))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_one_large_image_evicts_several_small_ones(self):
+        """
+        Test that eviction is driven by bytes rather than entry count.
+        """
+        self.cache.put(1, 'black', make_image(5))
+        self.cache.put(2, 'black', make_image(5))
+        self.cache.put(3, 'original', make_image(14))
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertLessEqual(stats['bytes'], 800)
+
+    def test_oversized_image_is_not_cached(self):
+        """
+        Test that an image larger than the whole budget is not stored.
+        """
+        self.cache.put(1, 'original', make_image(20))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_get_or_load(self):
+        """
+        Test that the loader is only called on a miss.
+        """
+        calls = []
+        def loader():
+            calls.append(1)
+            return make_image()
+        self.cache.get_or_load(7, 'black', loader)
+        self.cache.get_or_load(7, 'black', loader)
+        self.assertEqual(len(calls), 1)
+
+    def test_concurrent_use(self):
+        """
+        Test that several threads can use the cache at the same time.
+        """
+        cache = ImageCache(max_bytes=4000)
+        def worker(offset):
+            for i in range(200):
+                cache.get_or_load((i + offset) % 30, 'black', make_image)
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 800)
+        self.assertLessEqual(stats['bytes'], 4000)
+        self.assertEqual(stats['bytes'], stats['entries'] * 400)
+
+if __name__ == '__main__':
+    unittest.main()
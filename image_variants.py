@@ -0,0 +1,99 @@
+"""
+image_variants Module
+
+This module provides the `ImageVariantEncoder` class, which builds the pre-scaled variants of
+the Pokémon artwork stored at ingest time. Each variant fits a square of a fixed size and is
+encoded compactly, as a palette PNG or optionally as WebP, together with the 1-bit silhouette
+mask of the scaled image. The game shows these variants instead of the full-resolution artwork.
+"""
+
+import io
+from PIL import Image, features
+from metrics import METRICS
+
+class ImageVariantEncoder:
+    """
+    Builds and encodes the display-resolution variants of an image.
+
+    Attributes:
+        sizes (tuple): The edge lengths of the variants in pixels, in ascending order.
+        image_format (str): The format of the scaled artwork, 'PNG' or 'WEBP'.
+        colors (int): The palette size of quantized PNGs, or None to keep full color.
+    """
+
+    def __init__(self, sizes=(96, 300), image_format='PNG', colors=256):
+        """
+        Initializes the ImageVariantEncoder.
+
+        Args:
+            sizes (iterable): The edge lengths of the variants in pixels.
+            image_format (str): The format of the scaled artwork, 'PNG' or 'WEBP'.
+            colors (int, optional): The palette size of quantized PNGs. If None, PNGs keep
+                                    full color and are only optimized.
+        """
+        image_format = image_format.upper()
+        if image_format not in ('PNG', 'WEBP'):
+            raise ValueError(f"Unsupported variant format: {image_format}")
+        if image_format == 'WEBP' and not features.check('webp'):
+            raise ValueError("WebP variants require Pillow with WebP support")
+        self.sizes = tuple(sorted(set(sizes)))
+        self.image_format = image_format
+        self.colors = colors
+
+    def nearest(self, size):
+        """
+        Picks the stored variant for a requested size: the smallest variant that is at least
+        as large, so that images are never scaled up.
+
+        Args:
+            size (int): The requested edge length in pixels, or None for full resolution.
+
+        Returns:
+            int: The size of the variant, or None if only the full resolution is large enough.
+        """
+        if size is None:
+            return None
+        for variant_size in self.sizes:
+            if variant_size >= size:
+                return variant_size
+        return None
+
+    def encode(self, image, engine):
+        """
+        Builds and encodes all variants of an image.
+
+        Args:
+            image (PIL.Image.Image): The full-resolution artwork.
+            engine (SilhouetteEngine): The engine used to build the silhouette masks.
+
+        Returns:
+            list: A tuple of size, encoded artwork and silhouette mask for every variant.
+        """
+        image = image.convert('RGBA')
+        variants = []
+        for size in self.sizes:
+            scaled = image.copy()
+            scaled.thumbnail((size, size), Image.Resampling.LANCZOS)
+            variants.append((size, self.encode_image(scaled), engine.encode_mask(scaled)))
+        return variants
+
+    @METRICS.timed('png_encode_seconds', image='variant')
+    def encode_image(self, image):
+        """
+        Encodes a scaled image in the compact variant format.
+
+        Args:
+            image (PIL.Image.Image): The scaled RGBA image.
+
+        Returns:
+            bytes: The encoded image.
+        """
+        buffer = io.BytesIO()
+        if self.image_format == 'WEBP':
+            image.save(buffer, format='WEBP', quality=90, method=4)
+        elif self.colors:
+            image.quantize(self.colors, method=Image.Quantize.FASTOCTREE).save(
+                buffer, format='PNG', optimize=True)
+        else:
+            image.save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
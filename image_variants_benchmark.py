@@ -0,0 +1,117 @@
+"""
+Benchmark for the display-resolution image variants.
+
+Compares the bytes per question and the decode time of the full-resolution images with the
+stored display variant. A question moves the silhouette and the original image. The
+generated artwork is shaded with noise so that it compresses like real artwork; image files
+can be passed as command line arguments to benchmark real artwork instead.
+
+Usage:
+    python image_variants_benchmark.py [image.png ...]
+"""
+
+import io
+import sys
+import time
+from PIL import Image, features
+from image_variants import ImageVariantEncoder
+from pokeapi_stub import make_artwork
+from silhouette import SilhouetteEngine
+
+DISPLAY_SIZE = 300
+
+def make_shaded_artwork(pokedex_number, size=475):
+    """
+    Generates artwork with shading noise inside the shape.
+
+    Args:
+        pokedex_number (int): The Pokédex number used to vary the shape and color.
+        size (int): The width and height of the artwork.
+
+    Returns:
+        PIL.Image.Image: The RGBA artwork.
+    """
+    artwork = Image.open(io.BytesIO(make_artwork(pokedex_number, size))).convert('RGBA')
+    noise = Image.effect_noise((size, size), 24).convert('RGB')
+    shaded = Image.blend(artwork.convert('RGB'), noise, 0.25)
+    shaded.putalpha(artwork.getchannel('A'))
+    return shaded
+
+def png_bytes(image):
+    """
+    Encodes an image as PNG, as ingestion stores the full-resolution images.
+
+    Args:
+        image (PIL.Image.Image): The image.
+
+    Returns:
+        bytes: The PNG data.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def decode_question(engine, original_data, mask_data):
+    """
+    Decodes the two images of a question.
+
+    Args:
+        engine (SilhouetteEngine): The silhouette engine.
+        original_data (bytes): The original image.
+        mask_data (bytes): The silhouette mask.
+    """
+    Image.open(io.BytesIO(original_data)).load()
+    engine.composite(Image.open(io.BytesIO(mask_data)))
+
+def measure(engine, questions, repeat=5):
+    """
+    Measures the best time to decode all questions.
+
+    Args:
+        engine (SilhouetteEngine): The silhouette engine.
+        questions (list): Pairs of original image and mask data.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The best time per question in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for original_data, mask_data in questions:
+            decode_question(engine, original_data, mask_data)
+        best = min(best, time.perf_counter() - start)
+    return best / len(questions)
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    if len(sys.argv) > 1:
+        artworks = [Image.open(path).convert('RGBA') for path in sys.argv[1:]]
+    else:
+        artworks = [make_shaded_artwork(n) for n in range(1, 21)]
+
+    engine = SilhouetteEngine()
+    variants = {'PNG': ImageVariantEncoder(sizes=(DISPLAY_SIZE,))}
+    if features.check('webp'):
+        variants['WEBP'] = ImageVariantEncoder(sizes=(DISPLAY_SIZE,), image_format='WEBP')
+
+    full = [(png_bytes(artwork), engine.encode_mask(artwork)) for artwork in artworks]
+    rows = [('Full resolution PNG', full)]
+    for name, encoder in variants.items():
+        rows.append((f"{DISPLAY_SIZE}px {name} variant",
+                     [encoder.encode(artwork, engine)[0][1:] for artwork in artworks]))
+
+    full_bytes = sum(len(a) + len(b) for a, b in full) / len(full)
+    full_time = measure(engine, full)
+    print(f"Questions: {len(artworks)}, artwork {artworks[0].size[0]}x{artworks[0].size[1]}")
+    for name, questions in rows:
+        size = sum(len(a) + len(b) for a, b in questions) / len(questions)
+        seconds = measure(engine, questions)
+        print(f"{name:<22} {size / 1024:7.1f} KiB per question "
+              f"({full_bytes / size:4.1f}x), decode {seconds * 1000:6.2f} ms "
+              f"({full_time / seconds:4.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Unit tests for the ImageVariantEncoder class.
+
+This module contains test cases to verify that the variants are scaled, encoded compactly and
+picked by size as expected.
+"""
+
+import io
+import unittest
+from PIL import Image, features
+from image_variants import ImageVariantEncoder
+from pokeapi_stub import make_artwork
+from silhouette import SilhouetteEngine
+
+class TestImageVariantEncoder(unittest.TestCase):
+    """
+    Test suite for the ImageVariantEncoder class.
+    """
+
+    def setUp(self):
+        """
+        Set up an encoder with two variants and a generated 475x475 artwork.
+        """
+        self.encoder = ImageVariantEncoder(sizes=(300, 96))
+        self.engine = SilhouetteEngine()
+        self.artwork = Image.open(io.BytesIO(make_artwork(25)))
+
+    def test_nearest_never_scales_up(self):
+        """
+        Test that the smallest variant at least as large as the requested size is picked.
+        """
+        self.assertEqual(self.encoder.sizes, (96, 300))
+        self.assertEqual(self.encoder.nearest(64), 96)
+        self.assertEqual(self.encoder.nearest(96), 96)
+        self.assertEqual(self.encoder.nearest(200), 300)
+        self.assertIsNone(self.encoder.nearest(400))
+        self.assertIsNone(self.encoder.nearest(None))
+
+    def test_encode_variants(self):
+        """
+        Test that every variant fits its size and comes with a 1-bit mask of the same size.
+        """
+        variants = self.encoder.encode(self.artwork, self.engine)
+        self.assertEqual([size for size, _, _ in variants], [96, 300])
+        for size, image_data, mask_data in variants:
+            image = Image.open(io.BytesIO(image_data))
+            mask = Image.open(io.BytesIO(mask_data))
+            self.assertEqual(image.size, (size, size))
+            self.assertEqual(image.mode, 'P')
+            self.assertEqual(mask.size, image.size)
+            self.assertEqual(mask.mode, '1')
+
+    def test_keeps_transparency(self):
+        """
+        Test that the quantized variant keeps the transparent background and the opaque body,
+        within the precision of the palette.
+        """
+        _, image_data, _ = self.encoder.encode(self.artwork, self.engine)[1]
+        image = Image.open(io.BytesIO(image_data)).convert('RGBA')
+        self.assertEqual(image.getpixel((0, 0))[3], 0)
+        self.assertGreaterEqual(image.getpixel((150, 190))[3], 250)
+
+    @unittest.skipUnless(features.check('webp'), "Pillow without WebP support")
+    def test_webp_variants(self):
+        """
+        Test that WebP variants can be decoded.
+        """
+        encoder = ImageVariantEncoder(sizes=(96,), image_format='webp')
+        _, image_data, _ = encoder.encode(self.artwork, self.engine)[0]
+        self.assertEqual(Image.open(io.BytesIO(image_data)).format, 'WEBP')
+
+    def test_invalid_format(self):
+        """
+        Test that an unsupported format is rejected.
+        """
+        with self.assertRaises(ValueError):
+            ImageVariantEncoder(image_format='GIF')
+
+if __name__ == '__main__':
+    unittest.main()
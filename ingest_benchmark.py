@@ -0,0 +1,272 @@
+"""
+Benchmark suite for the ingestion.
+
+Fills a disposable SQLite database in a temporary directory from the local PokeAPI stub, so
+the timings do not depend on pokeapi.co. Every scenario runs in a fresh interpreter, so its
+peak resident set size is its own, and gives the stub a different network:
+
+* local: no added latency, unlimited bandwidth, no failures.
+* latency: every response is delayed by 50 ms.
+* bandwidth: response bodies are sent at 64 KiB/s.
+* flaky: 5% of the requests fail with 503 and are retried.
+
+For every scenario the end-to-end time of `fill_database` is measured, together with the
+stages of the ingestion:
+
+* fetch_pokemon_details and image_download: the summed request times of the detail
+  documents and of the artwork, from the timings of the HTTP client.
+* decode, convert_to_black, png_encode and variants: the artwork of the run decoded,
+  turned into a silhouette, encoded as PNG and scaled to the display sizes in the benchmark
+  process, as the process pool does during the ingestion.
+* save_pokemon_batch: the busy time of the writer stage.
+* The elapsed and busy times of the fetch, process and write stages of the pipeline.
+
+The results are written as JSON together with the commit they were measured at. With a
+baseline file from an earlier commit, the changes of the end-to-end times are printed.
+
+Usage:
+    python ingest_benchmark.py [pokemon] [results.json] [baseline.json]
+"""
+
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from PIL import Image
+from database_manager import PokemonDatabaseManager, create_backend
+from pokeapi_stub import PokeApiStub
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SCENARIOS = {
+    'local': {},
+    'latency': {'latency': 0.05},
+    'bandwidth': {'bandwidth': 64 * 1024},
+    'flaky': {'failure_rate': 0.05},
+}
+
+def peak_rss():
+    """
+    Returns the peak resident set size of the process and of its finished children.
+
+    Returns:
+        dict: The peak sizes in MiB of 'self' and 'children', or None where the platform does
+              not report them.
+    """
+    if resource is None:
+        return {'self': None, 'children': None}
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    unit = 1 if sys.platform == 'darwin' else 1024
+    return {
+        'self': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / 2 ** 20,
+        'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit / 2 ** 20,
+    }
+
+def summarize(seconds):
+    """
+    Summarizes the durations of a stage.
+
+    Args:
+        seconds (list): The duration of every item in seconds.
+
+    Returns:
+        dict: The number of items, the total in seconds and the mean and p95 in milliseconds.
+    """
+    if not seconds:
+        return {'count': 0, 'total_s': 0.0, 'mean_ms': 0.0, 'p95_ms': 0.0}
+    ordered = sorted(seconds)
+    return {
+        'count': len(ordered),
+        'total_s': sum(ordered),
+        'mean_ms': statistics.mean(ordered) * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+    }
+
+def measure_image_stages(db_manager, stub, pokedex_numbers):
+    """
+    Measures the image work of the ingestion for the artwork of a run.
+
+    Args:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        stub (PokeApiStub): The running PokeAPI stub.
+        pokedex_numbers (list): The Pokédex numbers of the artwork.
+
+    Returns:
+        dict: The summaries of the decode, convert_to_black, png_encode and variants stages.
+    """
+    stages = {'decode': [], 'convert_to_black': [], 'png_encode': [], 'variants': []}
+    for number in pokedex_numbers:
+        artwork = stub.respond(f"/artwork/{number}.png")[2]
+        start = time.perf_counter()
+        image = Image.open(io.BytesIO(artwork))
+        image.load()
+        decoded = time.perf_counter()
+        black_image = db_manager.convert_to_black(image)
+        converted = time.perf_counter()
+        for encoded in (image, black_image):
+            encoded.save(io.BytesIO(), format='PNG')
+        encoded_at = time.perf_counter()
+        db_manager.variant_encoder.encode(image, db_manager.silhouette_engine)
+        end = time.perf_counter()
+        stages['decode'].append(decoded - start)
+        stages['convert_to_black'].append(converted - decoded)
+        stages['png_encode'].append(encoded_at - converted)
+        stages['variants'].append(end - encoded_at)
+    return {name: summarize(seconds) for name, seconds in stages.items()}
+
+def run_scenario(name, max_pokedex_number):
+    """
+    Fills a disposable database from a stub with the network of a scenario.
+
+    Args:
+        name (str): The name of the scenario in `SCENARIOS`.
+        max_pokedex_number (int): The number of Pokémon to ingest.
+
+    Returns:
+        dict: The results of the scenario.
+    """
+    directory = tempfile.mkdtemp()
+    stub = PokeApiStub(max_pokedex_number, **SCENARIOS[name]).start()
+    db_manager = PokemonDatabaseManager(
+        max_pokedex_number, image_cache_bytes=0, api_base_url=stub.api_base_url,
+        http_cache_dir=None,
+        backend=create_backend('sqlite', path=os.path.join(directory, 'pokemon.db')),
+        checkpoint_path=os.path.join(directory, 'checkpoint.json'),
+        highscore_journal_path=os.path.join(directory, 'highscores.journal'))
+    try:
+        start = time.perf_counter()
+        pipeline = db_manager.fill_database()
+        total = time.perf_counter() - start
+
+        timings = db_manager.http_client.timings
+        stages = {
+            'fetch_pokemon_details': summarize(
+                [t.seconds for t in timings if '/api/v2/pokemon/' in t.url]),
+            'image_download': summarize(
+                [t.seconds for t in timings if '/artwork/' in t.url]),
+        }
+        stages.update(measure_image_stages(
+            db_manager, stub, range(1, max_pokedex_number + 1)))
+        write = pipeline.stats['write']
+        stages['save_pokemon_batch'] = {
+            'count': write.count, 'total_s': write.busy_time}
+
+        return {
+            'network': SCENARIOS[name],
+            'ingest_s': total,
+            'saved': len(db_manager.backend.pokedex_numbers(max_pokedex_number)),
+            'requests': len(timings),
+            'retried': sum(1 for t in timings if t.attempts > 1),
+            'injected_failures': stub.injected_failures,
+            'stages': stages,
+            'pipeline': {key: {'count': stage.count, 'failed': stage.failed,
+                               'elapsed_s': stage.elapsed(), 'busy_s': stage.busy_time}
+                         for key, stage in pipeline.stats.items()},
+            'peak_rss_mib': peak_rss(),
+        }
+    finally:
+        db_manager.close()
+        stub.stop()
+        shutil.rmtree(directory, ignore_errors=True)
+
+def run_in_subprocess(name, max_pokedex_number):
+    """
+    Runs a scenario in a fresh interpreter.
+
+    Args:
+        name (str): The name of the scenario.
+        max_pokedex_number (int): The number of Pokémon to ingest.
+
+    Returns:
+        dict: The results of the scenario.
+    """
+    handle, path = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    try:
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--scenario', name,
+                        str(max_pokedex_number), path],
+                       check=True, stdout=subprocess.DEVNULL)
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    finally:
+        os.remove(path)
+
+def current_commit():
+    """
+    Returns the commit of the working tree.
+
+    Returns:
+        str: The commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+                              ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results, baseline=None):
+    """
+    Prints the results, with the changes against a baseline.
+
+    Args:
+        results (dict): The results of the benchmark.
+        baseline (dict, optional): The results of an earlier run.
+    """
+    print(f"Commit: {results['commit']}, Pokémon: {results['pokemon']}")
+    if baseline and baseline['pokemon'] != results['pokemon']:
+        print(f"The baseline ingested {baseline['pokemon']} Pokémon, the changes are not "
+              f"comparable.")
+    for name, scenario in results['scenarios'].items():
+        line = (f"{name:<10} ingest {scenario['ingest_s']:7.2f} s, "
+                f"{scenario['saved']} saved, {scenario['retried']} retried, "
+                f"peak RSS {scenario['peak_rss_mib']['self'] or 0:6.1f} MiB "
+                f"(workers {scenario['peak_rss_mib']['children'] or 0:6.1f} MiB)")
+        previous = (baseline or {}).get('scenarios', {}).get(name)
+        if previous:
+            change = scenario['ingest_s'] / previous['ingest_s'] - 1
+            line += f", {change:+.1%} against {(baseline['commit'] or 'baseline')[:8]}"
+        print(line)
+        for stage, summary in scenario['stages'].items():
+            print(f"    {stage:<32} {summary['total_s']:7.3f} s over {summary['count']} items")
+
+def main():
+    """
+    Runs the benchmark, writes the results and prints them.
+    """
+    if sys.argv[1:2] == ['--scenario']:
+        name, max_pokedex_number, path = sys.argv[2], int(sys.argv[3]), sys.argv[4]
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(run_scenario(name, max_pokedex_number), file)
+        return
+
+    max_pokedex_number = int(sys.argv[1]) if len(sys.argv) > 1 else 151
+    output = sys.argv[2] if len(sys.argv) > 2 else 'ingest_benchmark.json'
+    baseline = None
+    if len(sys.argv) > 3:
+        with open(sys.argv[3], 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    results = {
+        'commit': current_commit(),
+        'python': sys.version.split()[0],
+        'cpus': os.cpu_count(),
+        'pokemon': max_pokedex_number,
+        'scenarios': {name: run_in_subprocess(name, max_pokedex_number)
+                      for name in SCENARIOS},
+    }
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print_results(results, baseline)
+    print(f"Results written to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,560 @@
+"""
+ingest_pipeline Module
+
+This module provides the `IngestPipeline` class, which fills the Pokémon database in three
+streaming stages: an asyncio stage downloads the details and artwork, a process pool decodes
+the artwork and builds the silhouettes, and a writer commits the rows batch by batch. The
+stages are joined by bounded queues, so memory use stays flat regardless of how many Pokémon are
+ingested.
+"""
+
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+from metrics import METRICS
+from silhouette import SilhouetteEngine
+
+_DONE = object()
+
+def encode_pokemon_images(pokemon_id, pokemon_name, image_data, engine=None, variants=None):
+    """
+    Decodes the artwork of a Pokémon, builds its silhouette mask and encodes both as PNG,
+    together with the display-resolution variants.
+
+    This is a module-level function so that it can be run in a process pool.
+
+    Args:
+        pokemon_id (int): The Pokédex number of the Pokémon.
+        pokemon_name (str): The name of the Pokémon.
+        image_data (bytes): The downloaded artwork.
+        engine (SilhouetteEngine, optional): The engine used to build the silhouette.
+        variants (ImageVariantEncoder, optional): The encoder of the scaled variants. If None,
+                                                  no variants are built.
+
+    Returns:
+        tuple: A tuple containing Pokémon ID, name, original image blob, silhouette mask
+               blob, and a list of (size, image blob, mask blob) variants.
+    """
+    engine = engine or SilhouetteEngine()
+    with METRICS.span('png_decode_seconds', image='artwork'):
+        original_image = Image.open(io.BytesIO(image_data))
+        original_image.load()
+
+    original_image_blob = io.BytesIO()
+    with METRICS.span('png_encode_seconds', image='original'):
+        original_image.save(original_image_blob, format='PNG')
+
+    return (pokemon_id, pokemon_name, original_image_blob.getvalue(),
+            engine.encode_mask(original_image),
+            variants.encode(original_image, engine) if variants else [])
+
+def _encode_in_worker(metrics_enabled, *artwork, engine=None, variants=None):
+    """
+    Runs `encode_pokemon_images` in a process pool worker. The registry of a worker does not
+    reach the parent, so the measurements taken while encoding are returned with the row.
+    Those of a call that failed are returned with the next row of the worker.
+
+    Args:
+        metrics_enabled (bool): Whether the parent records metrics.
+        *artwork: The Pokémon ID, name and artwork.
+        engine (SilhouetteEngine, optional): The engine used to build the silhouette.
+        variants (ImageVariantEncoder, optional): The encoder of the scaled variants.
+
+    Returns:
+        tuple: The row from `encode_pokemon_images` and the measurements of the worker, to
+               be merged with `METRICS.merge`.
+    """
+    METRICS.enable(metrics_enabled)
+    row = encode_pokemon_images(*artwork, engine=engine, variants=variants)
+    return row, METRICS.drain()
+
+class StageStats:
+    """
+    Throughput counters for one pipeline stage.
+
+    Attributes:
+        name (str): The name of the stage.
+        count (int): The number of items the stage completed.
+        failed (int): The number of items the stage dropped because of an error.
+        busy_time (float): The summed time spent working on items, in seconds.
+    """
+
+    def __init__(self, name):
+        """
+        Initializes the StageStats.
+
+        Args:
+            name (str): The name of the stage.
+        """
+        self.name = name
+        self.count = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.first_start = None
+        self.last_end = None
+        self._lock = threading.Lock()
+
+    def record(self, start, end, ok=True, items=1):
+        """
+        Records processed items.
+
+        Args:
+            start (float): The `time.perf_counter()` value when work on the items started.
+            end (float): The `time.perf_counter()` value when work on the items ended.
+            ok (bool): Whether the items were processed successfully.
+            items (int): The number of items processed together.
+        """
+        with self._lock:
+            if ok:
+                self.count += items
+            else:
+                self.failed += items
+            self.busy_time += end - start
+            if self.first_start is None or start < self.first_start:
+                self.first_start = start
+            if self.last_end is None or end > self.last_end:
+                self.last_end = end
+        METRICS.observe('ingest_stage_seconds', end - start, stage=self.name.lower())
+        METRICS.count('ingest_items', items, stage=self.name.lower(), ok=ok)
+
+    def elapsed(self):
+        """
+        Returns the wall-clock time between the first and the last item of the stage.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        if self.first_start is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    def throughput(self):
+        """
+        Returns the number of completed items per second of wall-clock time.
+
+        Returns:
+            float: The throughput of the stage.
+        """
+        elapsed = self.elapsed()
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def summary(self):
+        """
+        Returns a one-line summary of the stage.
+
+        Returns:
+            str: The summary line.
+        """
+        return (f"{self.name:<8} {self.count:>5} done, {self.failed:>3} failed in "
+                f"{self.elapsed():7.2f}s ({self.throughput():7.1f}/s, "
+                f"busy {self.busy_time:7.2f}s)")
+
+class IngestCheckpoint:
+    """
+    Records the progress of an ingestion run in a small JSON file, so that an interrupted run
+    can be resumed and reported as such.
+
+    Attributes:
+        path (str): The file path of the checkpoint.
+        planned (set): The Pokédex numbers the current run set out to ingest.
+        saved (set): The Pokédex numbers committed to the database during the run.
+        on_progress (callable): Called with the number of saved and of planned Pokédex
+                                numbers whenever they change, or None.
+    """
+
+    def __init__(self, path, on_progress=None):
+        """
+        Initializes the IngestCheckpoint and loads an existing checkpoint file.
+
+        Args:
+            path (str): The file path of the checkpoint.
+            on_progress (callable, optional): Called with the number of saved and of planned
+                                              Pokédex numbers whenever they change.
+        """
+        self.path = path
+        self.on_progress = on_progress
+        self.planned = set()
+        self.saved = set()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    state = json.load(file)
+                self.planned = set(state['planned'])
+                self.saved = set(state['saved'])
+            except (OSError, ValueError, KeyError):
+                print(f"Ignoring unreadable ingest checkpoint at {path}")
+
+    def is_resume(self):
+        """
+        Checks whether a previous run was interrupted before it finished.
+
+        Returns:
+            bool: True if the checkpoint file describes an unfinished run.
+        """
+        return bool(self.planned - self.saved)
+
+    def start(self, missing):
+        """
+        Starts or resumes a run for the given missing Pokédex numbers.
+
+        Args:
+            missing (list): The Pokédex numbers missing from the database.
+
+        Returns:
+            list: The sorted Pokédex numbers to fetch.
+        """
+        missing = set(missing)
+        if self.is_resume():
+            remaining = (self.planned - self.saved) & missing
+            print(f"Resuming interrupted ingestion: {len(remaining)} of "
+                  f"{len(self.planned)} Pokémon left.")
+            self.planned |= missing
+        else:
+            self.planned = missing
+        self.saved = self.planned - missing
+        self._write()
+        self._report()
+        return sorted(missing)
+
+    def mark_saved(self, pokedex_numbers):
+        """
+        Records Pokédex numbers that were committed to the database.
+
+        Args:
+            pokedex_numbers (iterable): The committed Pokédex numbers.
+        """
+        with self._lock:
+            self.saved.update(pokedex_numbers)
+            self._write()
+        self._report()
+
+    def finish(self):
+        """
+        Removes the checkpoint file once every planned Pokémon is saved.
+
+        Returns:
+            bool: True if the run is complete.
+        """
+        if self.is_resume():
+            return False
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        return True
+
+    def _report(self):
+        """
+        Passes the progress of the run to the progress callback.
+        """
+        if self.on_progress:
+            self.on_progress(len(self.saved), len(self.planned))
+
+    def _write(self):
+        """
+        Atomically writes the checkpoint file.
+        """
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'planned': sorted(self.planned), 'saved': sorted(self.saved)}, file)
+        os.replace(temp_path, self.path)
+
+class IngestPipeline:
+    """
+    A streaming fetch -> decode/silhouette -> insert pipeline.
+
+    Attributes:
+        db_manager (PokemonDatabaseManager): The manager used for HTTP fetches and inserts.
+        max_in_flight (int): The maximum number of Pokémon being downloaded at the same time.
+        process_workers (int): The number of processes decoding images. If 0, images are
+                               processed in a thread of the current process.
+        queue_size (int): The capacity of each queue between stages.
+        batch_size (int): The number of rows committed together by the writer.
+        stats (dict): The `StageStats` of the fetch, process and write stages.
+        checkpoint (IngestCheckpoint): The checkpoint updated after every commit, or None.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self, db_manager, *, max_in_flight=20, process_workers=None, queue_size=32,
+            batch_size=100, checkpoint=None):
+        """
+        Initializes the IngestPipeline.
+
+        Args:
+            db_manager (PokemonDatabaseManager): The database manager instance. The other
+                                                 options are passed by keyword.
+            max_in_flight (int): The maximum number of Pokémon being downloaded at once.
+            process_workers (int, optional): The number of worker processes. Defaults to the
+                                             number of CPUs.
+            queue_size (int): The capacity of each queue between stages.
+            batch_size (int): The number of rows committed together.
+            checkpoint (IngestCheckpoint, optional): The checkpoint to update after every commit.
+        """
+        self.db_manager = db_manager
+        self.max_in_flight = max_in_flight
+        self.process_workers = (
+            (os.cpu_count() or 1) if process_workers is None else process_workers)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.stats = {
+            'fetch': StageStats('Fetch'),
+            'process': StageStats('Process'),
+            'write': StageStats('Write'),
+        }
+        self.checkpoint = checkpoint
+        self._stop = threading.Event()
+
+    def run(self, pokemon_list, conn):
+        """
+        Runs the pipeline over a list of Pokémon and commits the results.
+
+        Args:
+            pokemon_list (list): Dictionaries with the 'url' of each Pokémon in the PokeAPI.
+            conn (object): The DB-API connection used by the writer.
+
+        Returns:
+            int: The number of Pokémon records saved.
+        """
+        self._stop.clear()
+        decode_queue = queue.Queue(maxsize=self.queue_size)
+        write_queue = queue.Queue(maxsize=self.queue_size)
+
+        fetcher = threading.Thread(
+            target=self._fetch_stage, args=(pokemon_list, decode_queue), daemon=True)
+        fetcher.start()
+
+        processor = threading.Thread(
+            target=self._process_stage, args=(decode_queue, write_queue), daemon=True)
+        processor.start()
+
+        saved = None
+        try:
+            saved = self._write_stage(write_queue, conn)
+        finally:
+            if saved is None:
+                self._abort(write_queue, processor)
+
+        processor.join()
+        fetcher.join()
+        return saved
+
+    def print_stats(self):
+        """
+        Prints the throughput counters of every stage.
+        """
+        for stage in self.stats.values():
+            print(stage.summary())
+
+    def _abort(self, write_queue, processor):
+        """
+        Stops the upstream stages after the writer failed.
+
+        Args:
+            write_queue (queue.Queue): The queue the processing stage writes to.
+            processor (threading.Thread): The thread running the processing stage.
+        """
+        self._stop.set()
+        while processor.is_alive():
+            try:
+                write_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    def _fetch_stage(self, pokemon_list, decode_queue):
+        """
+        Runs the asyncio fetch stage in the current thread and marks the end of its output.
+
+        Args:
+            pokemon_list (list): Dictionaries with the 'url' of each Pokémon in the PokeAPI.
+            decode_queue (queue.Queue): The queue receiving downloaded artwork.
+        """
+        try:
+            asyncio.run(self._fetch_all(pokemon_list, decode_queue))
+        finally:
+            decode_queue.put(_DONE)
+
+    async def _fetch_all(self, pokemon_list, decode_queue):
+        """
+        Downloads details and artwork with at most `max_in_flight` Pokémon in progress.
+
+        A Pokémon stays in progress until its artwork is accepted by the bounded decode queue,
+        so a slow processing stage throttles the downloads.
+
+        Args:
+            pokemon_list (list): Dictionaries with the 'url' of each Pokémon in the PokeAPI.
+            decode_queue (queue.Queue): The queue receiving downloaded artwork.
+        """
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(max(1, self.max_in_flight))
+        tasks = set()
+
+        async def fetch(pokemon):
+            try:
+                start = time.perf_counter()
+                try:
+                    artwork = await self.db_manager.fetch_pokemon_artwork_async(pokemon)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    print(f"Error while fetching {pokemon['url']}: {error!r}")
+                    artwork = None
+                self.stats['fetch'].record(start, time.perf_counter(), artwork is not None)
+                if artwork:
+                    await loop.run_in_executor(None, decode_queue.put, artwork)
+            finally:
+                slots.release()
+
+        for pokemon in pokemon_list:
+            await slots.acquire()
+            if self._stop.is_set():
+                slots.release()
+                break
+            task = asyncio.create_task(fetch(pokemon))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+
+    def _process_stage(self, decode_queue, write_queue):
+        """
+        Decodes artwork and builds silhouettes, keeping a bounded number of tasks in flight.
+        The end of the output is always marked, so the writer finishes even if the stage
+        fails. If the stage fails, the fetch stage is stopped and its remaining output is
+        dropped.
+
+        Args:
+            decode_queue (queue.Queue): The queue with downloaded artwork.
+            write_queue (queue.Queue): The queue receiving rows ready to be inserted.
+        """
+        try:
+            if self.process_workers == 0:
+                self._process_in_thread(decode_queue, write_queue)
+            else:
+                self._process_in_pool(decode_queue, write_queue)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"Error while processing Pokémon, stopping the ingestion: {error!r}")
+            self._stop.set()
+            self._drain(decode_queue)
+        finally:
+            write_queue.put(_DONE)
+
+    def _process_in_thread(self, decode_queue, write_queue):
+        """
+        Decodes artwork and builds silhouettes in the current thread.
+
+        Args:
+            decode_queue (queue.Queue): The queue with downloaded artwork.
+            write_queue (queue.Queue): The queue receiving rows ready to be inserted.
+        """
+        engine = self.db_manager.silhouette_engine
+        variants = self.db_manager.variant_encoder
+        while (artwork := decode_queue.get()) is not _DONE:
+            start = time.perf_counter()
+            try:
+                row = encode_pokemon_images(*artwork, engine=engine, variants=variants)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                print(f"Error while processing Pokémon {artwork[0]}: {error!r}")
+                row = None
+            self._forward(row, start, write_queue)
+
+    def _process_in_pool(self, decode_queue, write_queue):
+        """
+        Decodes artwork and builds silhouettes in a process pool. The workers are spawned
+        rather than forked, since the pipeline runs next to other threads, for example those
+        of the UI, and forking a multi-threaded process can deadlock the child.
+
+        Args:
+            decode_queue (queue.Queue): The queue with downloaded artwork.
+            write_queue (queue.Queue): The queue receiving rows ready to be inserted.
+        """
+        engine = self.db_manager.silhouette_engine
+        variants = self.db_manager.variant_encoder
+        in_flight = deque()
+        with ProcessPoolExecutor(max_workers=self.process_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            while (artwork := decode_queue.get()) is not _DONE:
+                in_flight.append((
+                    artwork[0], time.perf_counter(),
+                    executor.submit(_encode_in_worker, METRICS.enabled, *artwork,
+                                    engine=engine, variants=variants)))
+                if len(in_flight) >= self.queue_size:
+                    self._collect(in_flight.popleft(), write_queue)
+            while in_flight:
+                self._collect(in_flight.popleft(), write_queue)
+
+    def _drain(self, decode_queue):
+        """
+        Drops the artwork left in the decode queue until the fetch stage marks its end, so
+        that the fetch stage is not blocked on the full queue. Dropped items count as failed.
+
+        Args:
+            decode_queue (queue.Queue): The queue with downloaded artwork.
+        """
+        while decode_queue.get() is not _DONE:
+            now = time.perf_counter()
+            self.stats['process'].record(now, now, ok=False)
+
+    def _collect(self, task, write_queue):
+        """
+        Waits for a process pool task and forwards its result to the writer.
+
+        Args:
+            task (tuple): The Pokémon ID, submission time and future of the task.
+            write_queue (queue.Queue): The queue receiving rows ready to be inserted.
+        """
+        pokemon_id, start, future = task
+        try:
+            row, recorded = future.result()
+            METRICS.merge(recorded)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"Error while processing Pokémon {pokemon_id}: {error!r}")
+            row = None
+        self._forward(row, start, write_queue)
+
+    def _forward(self, row, start, write_queue):
+        """
+        Records a processed item and passes it on to the writer.
+
+        Args:
+            row (tuple): The row to insert, or None if processing failed.
+            start (float): The time processing of the item started.
+            write_queue (queue.Queue): The queue receiving rows ready to be inserted.
+        """
+        self.stats['process'].record(start, time.perf_counter(), row is not None)
+        if row:
+            write_queue.put(row)
+
+    def _write_stage(self, write_queue, conn):
+        """
+        Inserts rows batch by batch and commits each batch as soon as it is full.
+
+        Args:
+            write_queue (queue.Queue): The queue with rows ready to be inserted.
+            conn (object): The DB-API database connection.
+
+        Returns:
+            int: The number of Pokémon records saved.
+        """
+        cursor = conn.cursor()
+        batch = []
+        saved = 0
+        while True:
+            row = write_queue.get()
+            if row is not _DONE:
+                batch.append(row)
+            if batch and (row is _DONE or len(batch) >= self.batch_size):
+                start = time.perf_counter()
+                self.db_manager.backend.save_pokemon_batch(cursor, batch, self.batch_size)
+                conn.commit()
+                if self.checkpoint:
+                    self.checkpoint.mark_saved(row[0] for row in batch)
+                self.stats['write'].record(start, time.perf_counter(), items=len(batch))
+                saved += len(batch)
+                batch = []
+            if row is _DONE:
+                cursor.close()
+                return saved
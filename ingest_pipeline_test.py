@@ -0,0 +1,325 @@
+"""
+Unit tests for the IngestPipeline class.
+
+This module contains test cases that run the streaming ingest pipeline against an
+in-memory stand-in for the database manager and the database connection.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from PIL import Image
+from image_variants import ImageVariantEncoder
+from ingest_pipeline import IngestCheckpoint, IngestPipeline
+from metrics import METRICS
+from silhouette import SilhouetteEngine
+
+def make_png(color):
+    """
+    Creates a small PNG image with a transparent border.
+
+    Args:
+        color (tuple): The RGBA color of the opaque center.
+
+    Returns:
+        bytes: The PNG data.
+    """
+    image = Image.new('RGBA', (8, 8), (0, 0, 0, 0))
+    image.paste(color, (2, 2, 6, 6))
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+class FakeCursor:
+    """
+    A cursor that records inserted rows.
+    """
+
+    def __init__(self, connection):
+        """
+        Initializes the FakeCursor.
+
+        Args:
+            connection (FakeConnection): The connection the cursor belongs to.
+        """
+        self.connection = connection
+
+    def executemany(self, _sql, rows):
+        """
+        Records the inserted rows.
+
+        Args:
+            _sql (str): The SQL statement.
+            rows (list): The rows to insert.
+        """
+        self.connection.pending.extend(rows)
+
+    def close(self):
+        """
+        Closes the cursor.
+        """
+
+class FakeConnection:
+    """
+    A connection that records committed batches.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FakeConnection.
+        """
+        self.pending = []
+        self.commits = []
+
+    def cursor(self):
+        """
+        Returns a new cursor.
+
+        Returns:
+            FakeCursor: The cursor.
+        """
+        return FakeCursor(self)
+
+    def commit(self):
+        """
+        Commits the pending rows as one batch.
+        """
+        self.commits.append(self.pending)
+        self.pending = []
+
+class FakeManager:
+    """
+    A database manager that serves artwork from memory.
+    """
+
+    def __init__(self, count):
+        """
+        Initializes the FakeManager.
+
+        Args:
+            count (int): The number of Pokémon to serve.
+        """
+        self.silhouette_engine = SilhouetteEngine()
+        self.variant_encoder = ImageVariantEncoder(sizes=(4,))
+        self.artwork = {i: make_png((i, 100, 200, 255)) for i in range(1, count + 1)}
+        self.backend = self
+
+    async def fetch_pokemon_artwork_async(self, pokemon):
+        """
+        Returns the artwork of a Pokémon, or None for unknown URLs.
+
+        Args:
+            pokemon (dict): A dictionary with the 'url' of the Pokémon.
+
+        Returns:
+            tuple: The Pokémon ID, name and artwork, or None.
+        """
+        pokemon_id = int(pokemon['url'].rstrip('/').rsplit('/', 1)[1])
+        if pokemon_id not in self.artwork:
+            return None
+        return (pokemon_id, f"pokemon-{pokemon_id}", self.artwork[pokemon_id])
+
+    @staticmethod
+    def save_pokemon_batch(cursor, pokemon_data, _batch_size=100):
+        """
+        Saves a batch of rows with the given cursor, in place of the storage backend.
+
+        Args:
+            cursor (FakeCursor): The cursor.
+            pokemon_data (list): The rows to insert.
+        """
+        cursor.executemany('', pokemon_data)
+
+class FailingEncoder:  # pylint: disable=too-few-public-methods
+    """
+    A variant encoder that raises a RuntimeError for some Pokémon.
+    """
+
+    def __init__(self, failing):
+        """
+        Initializes the FailingEncoder.
+
+        Args:
+            failing (set): The Pokédex numbers whose variants fail.
+        """
+        self.failing = failing
+
+    def encode(self, image, _engine):
+        """
+        Raises a RuntimeError if the artwork belongs to a failing Pokémon.
+
+        Args:
+            image (PIL.Image.Image): The artwork, colored by Pokédex number.
+
+        Returns:
+            list: No variants.
+        """
+        if image.getpixel((3, 3))[0] in self.failing:
+            raise RuntimeError("encoder crashed")
+        return []
+
+class TestIngestPipeline(unittest.TestCase):
+    """
+    Test suite for the IngestPipeline class.
+    """
+
+    def run_pipeline(self, count, requested, **options):
+        """
+        Runs a pipeline over a number of requested Pokémon.
+
+        Args:
+            count (int): The number of Pokémon the fake manager knows.
+            requested (int): The number of Pokémon to request.
+            **options: Options passed to IngestPipeline.
+
+        Returns:
+            tuple: The pipeline, the connection and the number of saved rows.
+        """
+        pipeline = IngestPipeline(FakeManager(count), **options)
+        conn = FakeConnection()
+        pokemon_list = [{'url': f"http://pokeapi/pokemon/{i}/"} for i in range(1, requested + 1)]
+        saved = pipeline.run(pokemon_list, conn)
+        return pipeline, conn, saved
+
+    def test_commits_in_batches(self):
+        """
+        Test that every row is saved and committed in batches of the configured size.
+        """
+        _, conn, saved = self.run_pipeline(
+            25, 25, max_in_flight=3, process_workers=0, queue_size=4, batch_size=10)
+        self.assertEqual(saved, 25)
+        self.assertEqual([len(batch) for batch in conn.commits], [10, 10, 5])
+        ids = sorted(row[0] for batch in conn.commits for row in batch)
+        self.assertEqual(ids, list(range(1, 26)))
+
+    def test_rows_contain_silhouette(self):
+        """
+        Test that the saved rows contain the original image and the silhouette mask.
+        """
+        _, conn, _ = self.run_pipeline(1, 1, process_workers=0)
+        _, name, original_blob, black_blob, variants = conn.commits[0][0]
+        self.assertEqual(name, "pokemon-1")
+        mask = Image.open(io.BytesIO(black_blob))
+        self.assertEqual(mask.mode, '1')
+        black_image = SilhouetteEngine.composite(mask)
+        self.assertEqual(black_image.getpixel((3, 3)), (0, 0, 0, 255))
+        self.assertEqual(Image.open(io.BytesIO(original_blob)).getpixel((3, 3)), (1, 100, 200, 255))
+        self.assertEqual([size for size, _, _ in variants], [4])
+
+    def test_failed_fetches_are_counted(self):
+        """
+        Test that failed fetches are skipped and counted.
+        """
+        pipeline, _, saved = self.run_pipeline(5, 8, process_workers=0)
+        self.assertEqual(saved, 5)
+        self.assertEqual(pipeline.stats['fetch'].failed, 3)
+        self.assertEqual(pipeline.stats['write'].count, 5)
+
+    def test_process_pool(self):
+        """
+        Test that the pipeline works with a process pool.
+        """
+        pipeline, _, saved = self.run_pipeline(6, 6, process_workers=2, queue_size=2)
+        self.assertEqual(saved, 6)
+        self.assertEqual(pipeline.stats['process'].count, 6)
+
+    def test_process_pool_metrics_reach_the_parent(self):
+        """
+        Test that the decode, encode and silhouette timings taken in the pool workers are
+        recorded in the registry of the parent process.
+        """
+        METRICS.reset()
+        METRICS.enable()
+        try:
+            self.run_pipeline(4, 4, process_workers=1)
+            histograms = METRICS.snapshot()['histograms']
+        finally:
+            METRICS.enable(False)
+            METRICS.reset()
+        counts = {(name, tuple(sorted(series['labels'].items()))): series['count']
+                  for name, entries in histograms.items() for series in entries}
+        self.assertEqual(counts[('png_decode_seconds', (('image', 'artwork'),))], 4)
+        self.assertEqual(counts[('png_encode_seconds', (('image', 'original'),))], 4)
+        self.assertEqual(counts[('png_encode_seconds', (('image', 'variant'),))], 4)
+        # One mask for the artwork and one for its variant.
+        self.assertEqual(counts[('silhouette_seconds', (('operation', 'encode_mask'),))], 8)
+
+    def test_unexpected_processing_errors_are_counted(self):
+        """
+        Test that errors other than OSError and ValueError drop the item instead of stopping
+        the processing stage, so the pipeline finishes.
+        """
+        pipeline = IngestPipeline(FakeManager(5), process_workers=0)
+        pipeline.db_manager.variant_encoder = FailingEncoder({2, 4})
+        conn = FakeConnection()
+        saved = pipeline.run([{'url': f"http://pokeapi/pokemon/{i}/"} for i in range(1, 6)],
+                             conn)
+        self.assertEqual(saved, 3)
+        self.assertEqual(pipeline.stats['process'].failed, 2)
+        self.assertEqual(sorted(row[0] for batch in conn.commits for row in batch), [1, 3, 5])
+
+    def test_failing_processing_stage_ends_the_run(self):
+        """
+        Test that the writer and the fetch stage finish if the processing stage fails as a
+        whole, for example because the process pool cannot be started.
+        """
+        pipeline = IngestPipeline(FakeManager(40), process_workers=-1, queue_size=2)
+        conn = FakeConnection()
+        saved = pipeline.run([{'url': f"http://pokeapi/pokemon/{i}/"} for i in range(1, 41)],
+                             conn)
+        self.assertEqual(saved, 0)
+        self.assertEqual(conn.commits, [])
+
+class TestIngestCheckpoint(unittest.TestCase):
+    """
+    Test suite for the IngestCheckpoint class.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary checkpoint path before each test.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'checkpoint.json')
+
+    def tearDown(self):
+        """
+        Remove the temporary directory after each test.
+        """
+        shutil.rmtree(self.directory)
+
+    def test_interrupted_run_is_resumed(self):
+        """
+        Test that a run interrupted after its first commit is resumed by the next run.
+        """
+        checkpoint = IngestCheckpoint(self.path)
+        self.assertEqual(checkpoint.start([3, 1, 2, 4]), [1, 2, 3, 4])
+        checkpoint.mark_saved([1, 2])
+
+        progress = []
+        resumed = IngestCheckpoint(self.path, on_progress=lambda *done: progress.append(done))
+        self.assertTrue(resumed.is_resume())
+        self.assertEqual(resumed.start([3, 4]), [3, 4])
+        resumed.mark_saved([3, 4])
+        self.assertEqual(progress, [(2, 4), (4, 4)])
+        self.assertTrue(resumed.finish())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_pipeline_updates_checkpoint(self):
+        """
+        Test that the pipeline records every committed Pokémon in the checkpoint.
+        """
+        checkpoint = IngestCheckpoint(self.path)
+        checkpoint.start(range(1, 8))
+        pipeline = IngestPipeline(
+            FakeManager(5), process_workers=0, batch_size=2, checkpoint=checkpoint)
+        pipeline.run([{'url': f"http://pokeapi/pokemon/{i}/"} for i in range(1, 8)],
+                     FakeConnection())
+        self.assertEqual(checkpoint.saved, {1, 2, 3, 4, 5})
+        self.assertFalse(checkpoint.finish())
+        self.assertEqual(IngestCheckpoint(self.path).saved, {1, 2, 3, 4, 5})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+leaderboard Module
+
+This module provides the `Leaderboard` class, an in-process cache of the best highscores of a
+game mode and of the number of highscores per score. Both are loaded from the storage backend
+once and kept current by writing every new highscore through the cache to the backend, so
+showing the scoreboard or the rank of a score does not query the database, however many
+highscores it holds. Rank lookups only depend on the number of distinct scores, not on the
+number of rows. The `PokemonDatabaseManager` keeps one leaderboard per game mode.
+"""
+
+import bisect
+import threading
+from storage_backend import DEFAULT_MODE
+
+class Leaderboard:
+    """
+    A write-through cache of the top highscores and the score distribution of a game mode.
+
+    Attributes:
+        backend (StorageBackend): The backend storing the highscores.
+        mode (str): The game mode.
+        size (int): The number of best highscores kept.
+    """
+
+    def __init__(self, backend, mode=DEFAULT_MODE, size=10):
+        """
+        Initializes the Leaderboard. The highscores are loaded on first use.
+
+        Args:
+            backend (StorageBackend): The backend storing the highscores.
+            mode (str): The game mode.
+            size (int): The number of best highscores kept.
+        """
+        self.backend = backend
+        self.mode = mode
+        self.size = size
+        self._top = None
+        self._counts = None
+        self._scores = None
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def top(self, limit=None):
+        """
+        Returns the best highscores. Equal scores are ordered by age.
+
+        Args:
+            limit (int, optional): The number of highscores, at most `size`.
+
+        Returns:
+            list: Dictionaries with the 'name' and 'score', best first.
+        """
+        with self._lock:
+            self._load()
+            return [dict(row) for row in self._top[:limit or self.size]]
+
+    def add(self, name, score, save=None):
+        """
+        Saves a highscore and adds it to the cache. The cache is loaded before the highscore
+        is saved, so it is never counted twice.
+
+        Args:
+            name (str): The name of the player.
+            score (int): The score of the player.
+            save (callable, optional): Saves the highscore instead of the backend, for example
+                                       by queueing it in a `HighscoreWriter`.
+        """
+        with self._lock:
+            self._load()
+            if save is None:
+                self.backend.add_highscore(name, score, self.mode)
+            else:
+                save()
+            self._insert(name, score)
+
+    def record(self, name, score):
+        """
+        Adds a highscore to the cache only, for a highscore that is not in the backend yet and
+        is saved by someone else, such as a highscore recovered by the `HighscoreWriter`.
+
+        Args:
+            name (str): The name of the player.
+            score (int): The score of the player.
+        """
+        with self._lock:
+            self._load()
+            self._insert(name, score)
+
+    def rank(self, score):
+        """
+        Computes the rank a score has or would have among all highscores. Equal scores share
+        the rank of the first of them.
+
+        Args:
+            score (int): The score.
+
+        Returns:
+            int: 1 plus the number of highscores that are strictly better.
+        """
+        with self._lock:
+            self._load()
+            better = self._scores[:bisect.bisect_left(self._scores, -score)]
+            return 1 + sum(self._counts[-key] for key in better)
+
+    def total(self):
+        """
+        Returns the number of highscores.
+
+        Returns:
+            int: The number of saved highscores.
+        """
+        with self._lock:
+            self._load()
+            return self._total
+
+    def _load(self):
+        """
+        Loads the best highscores and the score distribution if not cached. The caller holds
+        the lock.
+        """
+        if self._top is not None:
+            return
+        self._top = self.backend.top_highscores(self.size, self.mode)
+        self._counts = self.backend.score_counts(self.mode)
+        self._scores = sorted(-score for score in self._counts)
+        self._total = sum(self._counts.values())
+
+    def _insert(self, name, score):
+        """
+        Adds a highscore to the loaded cache. The caller holds the lock.
+
+        Args:
+            name (str): The name of the player.
+            score (int): The score of the player.
+        """
+        position = bisect.bisect_right(self._top_keys(), -score)
+        if position < self.size:
+            self._top.insert(position, {'name': name, 'score': score})
+            del self._top[self.size:]
+        if score not in self._counts:
+            bisect.insort(self._scores, -score)
+        self._counts[score] = self._counts.get(score, 0) + 1
+        self._total += 1
+
+    def _top_keys(self):
+        """
+        Returns the negated scores of the cached best highscores, in ascending order.
+
+        Returns:
+            list: The sort keys of the best highscores.
+        """
+        return [-row['score'] for row in self._top]
@@ -0,0 +1,115 @@
+"""
+Benchmark for the highscore leaderboard.
+
+Fills SQLite databases in a temporary directory with a growing number of seeded random
+highscores and measures, for every size, the top 10 and rank queries three ways: on a copy of
+the old highscores table without key or index, on the indexed table with its score counts, and
+from the in-process `Leaderboard` cache. The time to save a highscore through the cache is
+measured as well.
+
+Usage:
+    python leaderboard_benchmark.py [rows ...]
+"""
+
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from leaderboard import Leaderboard
+from sqlite_backend import SQLiteBackend
+
+def fill(backend, rows, seed=42):
+    """
+    Inserts seeded random highscores into the indexed table and the unindexed legacy table.
+
+    Args:
+        backend (SQLiteBackend): The initialized backend.
+        rows (int): The number of highscores.
+        seed (int): The seed of the random number generator.
+    """
+    random.seed(seed)
+    backend.execute('CREATE TABLE legacy_highscores (name TEXT NOT NULL, score INTEGER NOT NULL)')
+    for start in range(0, rows, 100000):
+        batch = [(f"Player {i}", min(int(random.expovariate(0.05)), 1025))
+                 for i in range(start, min(start + 100000, rows))]
+        backend.execute_many('INSERT INTO highscores (name, score) VALUES (%s, %s)', batch)
+        backend.execute_many('INSERT INTO legacy_highscores (name, score) VALUES (%s, %s)', batch)
+
+def measure(function, repeat):
+    """
+    Measures the median latency of a function.
+
+    Args:
+        function (callable): The function, called with a random score.
+        repeat (int): The number of calls.
+
+    Returns:
+        float: The median latency in microseconds.
+    """
+    latencies = []
+    for _ in range(repeat):
+        score = random.randint(0, 100)
+        start = time.perf_counter()
+        function(score)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(latencies)
+
+def run(path, rows, repeat):
+    """
+    Measures the leaderboard queries on a database of a given size.
+
+    Args:
+        path (str): The path of the database file.
+        rows (int): The number of highscores.
+        repeat (int): The number of calls per measurement.
+
+    Returns:
+        dict: The median latency in microseconds keyed by measurement.
+    """
+    backend = SQLiteBackend(path)
+    backend.initialize()
+    try:
+        fill(backend, rows)
+        leaderboard = Leaderboard(backend)
+        start = time.perf_counter()
+        leaderboard.top()
+        load = (time.perf_counter() - start) * 1e6
+        slow = max(1, repeat // 20)
+        return {
+            'top unindexed': measure(lambda _: backend.fetch_all(
+                'SELECT name, score FROM legacy_highscores ORDER BY score DESC LIMIT 10'), slow),
+            'top indexed': measure(lambda _: backend.top_highscores(10), repeat),
+            'top cached': measure(lambda _: leaderboard.top(), repeat),
+            'rank unindexed': measure(lambda score: backend.fetch_one(
+                'SELECT COUNT(*) AS better FROM legacy_highscores WHERE score > %s', (score,)),
+                slow),
+            'rank counts': measure(backend.score_rank, repeat),
+            'rank cached': measure(leaderboard.rank, repeat),
+            'save cached': measure(lambda score: leaderboard.add("Benchmark", score), slow),
+            'cache load': load,
+        }
+    finally:
+        backend.close()
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    directory = tempfile.mkdtemp()
+    results = {}
+    try:
+        for rows in sizes:
+            results[rows] = run(os.path.join(directory, f"{rows}.db"), rows, 200)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{'median µs':<16}" + ''.join(f"{rows:>12,}" for rows in sizes))
+    for label in results[sizes[0]]:
+        print(f"{label:<16}" + ''.join(f"{results[rows][label]:12.1f}" for rows in sizes))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the Leaderboard class.
+
+This module contains test cases that check that the cached top highscores and ranks stay
+consistent with the highscores table of an SQLite database.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from leaderboard import Leaderboard
+from sqlite_backend import SQLiteBackend
+
+class TestLeaderboard(unittest.TestCase):
+    """
+    Test suite for the Leaderboard class.
+    """
+
+    def setUp(self):
+        """
+        Create a leaderboard of three entries on a database in a temporary directory.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.backend = SQLiteBackend(os.path.join(self.directory, 'pokemon.db'))
+        self.backend.initialize()
+        self.leaderboard = Leaderboard(self.backend, size=3)
+
+    def tearDown(self):
+        """
+        Close the backend and remove the temporary directory.
+        """
+        self.backend.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_top_matches_database(self):
+        """
+        Test that the cached top highscores equal the indexed query, ties ordered by age.
+        """
+        for name, score in [("Ash", 5), ("Misty", 9), ("Brock", 5), ("Gary", 1), ("Oak", 9)]:
+            self.leaderboard.add(name, score)
+        expected = [{'name': "Misty", 'score': 9}, {'name': "Oak", 'score': 9},
+                    {'name': "Ash", 'score': 5}]
+        self.assertEqual(self.leaderboard.top(), expected)
+        self.assertEqual(self.backend.top_highscores(3), expected)
+
+    def test_rank(self):
+        """
+        Test that ranks count the strictly better highscores, from the cache and the database.
+        """
+        for name, score in [("Ash", 5), ("Misty", 9), ("Brock", 5)]:
+            self.leaderboard.add(name, score)
+        for score, rank in [(10, 1), (9, 1), (7, 2), (5, 2), (4, 4)]:
+            self.assertEqual(self.leaderboard.rank(score), rank)
+            self.assertEqual(self.backend.score_rank(score), rank)
+        self.assertEqual(self.leaderboard.total(), 3)
+
+    def test_loads_existing_highscores(self):
+        """
+        Test that a new leaderboard starts from the saved highscores.
+        """
+        self.backend.add_highscore("Ash", 3)
+        self.backend.add_highscore("Misty", 7)
+        leaderboard = Leaderboard(self.backend)
+        self.assertEqual([row['name'] for row in leaderboard.top()], ["Misty", "Ash"])
+        self.assertEqual(leaderboard.rank(5), 2)
+
+    def test_modes_are_separate(self):
+        """
+        Test that every mode has its own highscores, counts and ranks.
+        """
+        generation = Leaderboard(self.backend, "Generation 1", size=3)
+        self.leaderboard.add("Ash", 5)
+        generation.add("Misty", 2)
+        self.assertEqual([row['name'] for row in self.leaderboard.top()], ["Ash"])
+        self.assertEqual([row['name'] for row in generation.top()], ["Misty"])
+        self.assertEqual(generation.rank(3), 1)
+        self.assertEqual(self.backend.score_rank(3, "Generation 1"), 1)
+        self.assertEqual(self.backend.score_counts("Generation 1"), {2: 1})
+
+    def test_migration_fills_counts(self):
+        """
+        Test that the score counts are rebuilt for highscores saved without them.
+        """
+        self.backend.add_highscore("Ash", 3)
+        self.backend.add_highscore("Brock", 3)
+        self.backend.execute('DELETE FROM highscore_counts')
+        self.backend.migrate_highscores()
+        self.assertEqual(self.backend.score_counts(), {3: 2})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,27 @@
 """
-This module serves as the entry point for the Pokémon game application. 
+This module serves as the entry point for the Pokémon game application.
 It initializes the main application window, manages the database, and starts the game UI.
+
+The window with the logo is shown first, before the database, PIL and HTTP modules are
+imported. Opening the database, filling it and preparing the first question run in the
+background while the splash screen shows the progress. The time to the first frame is
+printed at every start.
+
+With `--metrics`, the hot paths are measured: the metrics are served in the Prometheus text
+format at http://127.0.0.1:9464/metrics and written to `metrics.json` when the window closes.
+If the environment variable `POKEMON_MEMORY_PROFILE` is set, the peak and retained memory of
+the phases of `fill_database` and of the questions are printed when the window closes.
 """
 
+import time
+
+STARTED = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+import sys
 import tkinter as tk
-from pokemon_game import PokemonGame
-from pokemon_game_ui import PokemonGameUI
-from database_manager import PokemonDatabaseManager
+from splash_screen import SplashScreen
+from ui_executor import UiExecutor
 
 class Main:
     """
@@ -14,20 +29,39 @@ class Main:
 
     Attributes:
         root (tk.Tk): The main Tkinter window.
+        splash (SplashScreen): The splash screen shown while the game is loaded.
+        first_frame_ms (float): The milliseconds from the start of the process to the first
+                                frame of the window.
         db_manager (PokemonDatabaseManager): Manages the Pokémon database.
         game (PokemonGame): Handles the game logic.
         game_ui (PokemonGameUI): Manages the game user interface.
     """
 
-    def __init__(self):
+    def __init__(self, offline=False, image_store='database', backend='mysql', metrics=False):
         """
-        Initializes the main application by creating the main window, 
-        database manager, game logic, and user interface.
+        Initializes the main application by creating the main window and showing the splash
+        screen. The database manager, game logic and user interface are created by `prepare`.
+
+        Args:
+            offline (bool): If True, the database is filled only from the HTTP cache.
+            image_store (str): 'database', or 'pack' to read the images from the sprite pack.
+            backend (str): The storage backend, 'mysql' or 'sqlite'.
+            metrics (bool): If True, the hot paths are measured and the metrics are served
+                            on port 9464 and written to `metrics.json` on close.
         """
         self.root = tk.Tk()
-        self.db_manager = PokemonDatabaseManager()
-        self.game = PokemonGame(self.db_manager)
-        self.game_ui = PokemonGameUI(self.root, self.game)
+        self.root.title("Who's that Pokemon?")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.options = {'offline': offline, 'image_store': image_store, 'backend': backend,
+                        'metrics': metrics}
+        self.splash = SplashScreen(self.root)
+        self.root.update()
+        self.first_frame_ms = (time.perf_counter() - STARTED) * 1000
+        print(f"First frame after {self.first_frame_ms:.0f} ms")
+        self.executor = UiExecutor(self.root)
+        self.db_manager = None
+        self.game = None
+        self.game_ui = None
 
     def run(self):
         """
@@ -37,16 +71,78 @@ class Main:
 
     def prepare(self):
         """
-        Prepares the game by filling the database and starting a new game.
-        This method is called before starting the main game loop.
+        Prepares the game in the background: the database is opened and filled and the first
+        question is built. The game UI replaces the splash screen when it is done.
+        """
+        self.executor.run(self.load, on_done=self.show_game, on_error=self.splash.show_error)
+
+    def load(self):
+        """
+        Imports the game modules, opens and fills the database and starts a new game. Runs in
+        a background thread.
+
+        Returns:
+            type: The `PokemonGameUI` class.
         """
-        self.db_manager.fill_database()
+        # pylint: disable=import-outside-toplevel
+        self.splash.report("Loading...")
+        if self.options['metrics']:
+            from metrics import METRICS
+            METRICS.enable()
+            try:
+                print(f"Serving metrics on port {METRICS.serve()}")
+            except OSError as error:
+                print(f"Metrics are not served: {error}")
+        from database_manager import PokemonDatabaseManager, create_backend
+        from pokemon_game import PokemonGame
+        from pokemon_game_ui import PokemonGameUI
+
+        self.splash.report("Checking database...")
+        self.db_manager = PokemonDatabaseManager(
+            offline=self.options['offline'], image_store=self.options['image_store'],
+            backend=create_backend(self.options['backend']))
+        self.db_manager.fill_database(progress=lambda saved, planned: self.splash.report(
+            f"Loading Pokémon {saved} of {planned}...", saved / planned))
         print("Starting game...")
+        self.splash.report("Preparing the first question...", 1.0)
+        self.game = PokemonGame(self.db_manager, image_size=PokemonGameUI.image_size)
         self.game.start_new_game()
+        return PokemonGameUI
+
+    def show_game(self, game_ui_class):
+        """
+        Replaces the splash screen with the game UI.
+
+        Args:
+            game_ui_class (type): The `PokemonGameUI` class.
+        """
+        self.splash.close()
+        self.game_ui = game_ui_class(self.root, self.game)
         self.game_ui.prepare_ui()
+        print(f"Game ready after {(time.perf_counter() - STARTED) * 1000:.0f} ms")
+
+    def close(self):
+        """
+        Closes the window. The game is shut down if it was started.
+        """
+        self.executor.shutdown()
+        if self.options['metrics']:
+            from metrics import METRICS  # pylint: disable=import-outside-toplevel
+            METRICS.stop_serving()
+            METRICS.dump('metrics.json')
+        if 'memory_profiler' in sys.modules:
+            for line in sys.modules['memory_profiler'].MEMORY.summary():
+                print(line)
+        if self.game_ui:
+            self.game_ui.exit_game()
+        else:
+            self.root.destroy()
 
 if __name__ == "__main__":
     print("Starting Pokémon Game...")
-    app = Main()
+    app = Main(offline='--offline' in sys.argv[1:],
+               image_store='pack' if '--sprite-pack' in sys.argv[1:] else 'database',
+               backend='sqlite' if '--sqlite' in sys.argv[1:] else 'mysql',
+               metrics='--metrics' in sys.argv[1:])
     app.prepare()
     app.run()
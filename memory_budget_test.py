@@ -0,0 +1,150 @@
+"""
+Memory regression tests for the ingestion and the questions.
+
+This module fills a temporary SQLite database from the local PokeAPI stub and builds questions
+with the memory profiler enabled. The tests fail if a phase of `fill_database` or a question
+allocates more than the budget configured in `BUDGETS`. tracemalloc does not see the pixel
+buffers of decoded images, so the images a question holds are checked against
+`IMAGE_BUDGETS` separately.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from database_manager import PokemonDatabaseManager, create_backend
+from image_cache import ImageCache
+from memory_profiler import MEMORY
+from pokeapi_stub import PokeApiStub
+from question import Question
+
+POKEMON = 40
+QUESTIONS = 100
+IMAGE_SIZE = 300
+
+# Peak and retained allocations in KiB per phase and call.
+BUDGETS = {
+    'fill_database': {'peak': 2048, 'retained': 768},
+    'fill_database.plan': {'peak': 64, 'retained': 32},
+    'fill_database.ingest': {'peak': 2048, 'retained': 768},
+    'fill_database.name_index': {'peak': 64, 'retained': 32},
+    'question': {'peak': 64, 'retained': 16},
+    'question.original': {'peak': 64, 'retained': 32},
+}
+
+# Decoded image bytes a question holds, in KiB.
+IMAGE_BUDGETS = {'silhouette': 384, 'original': 384}
+
+class TestMemoryBudget(unittest.TestCase):
+    """
+    Test cases checking the allocations of `fill_database` and `Question` against the budgets.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Fills a database from the PokeAPI stub with the memory profiler enabled. A small
+        database is filled first, so that the modules imported on first use are not counted.
+        """
+        cls.stub = PokeApiStub(max_pokedex_number=POKEMON).start()
+        cls.directory = tempfile.mkdtemp()
+        warmup = cls.make_manager('warmup', 2)
+        warmup.fill_database()
+        warmup.close()
+        cls.db_manager = cls.make_manager('pokemon', POKEMON)
+        MEMORY.enable()
+        MEMORY.reset()
+        try:
+            cls.db_manager.fill_database()
+            cls.fill_report = MEMORY.report()
+        finally:
+            MEMORY.enable(False)
+
+    @classmethod
+    def make_manager(cls, name, max_pokedex_number):
+        """
+        Creates a database manager with a temporary SQLite database filled from the stub.
+
+        Args:
+            name (str): The name of the database file, without extension.
+            max_pokedex_number (int): The highest Pokédex number to fill.
+
+        Returns:
+            PokemonDatabaseManager: The database manager.
+        """
+        db_manager = PokemonDatabaseManager(
+            max_pokedex_number, image_cache_bytes=0, api_base_url=cls.stub.api_base_url,
+            http_cache_dir=None,
+            backend=create_backend('sqlite', path=os.path.join(cls.directory, f'{name}.db')),
+            checkpoint_path=os.path.join(cls.directory, f'{name}.json'),
+            highscore_journal_path=os.path.join(cls.directory, f'{name}.journal'))
+        return db_manager
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Closes the database and stops the PokeAPI stub.
+        """
+        cls.db_manager.close()
+        cls.stub.stop()
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    def tearDown(self):
+        """
+        Disables the memory profiler.
+        """
+        MEMORY.enable(False)
+
+    def assert_within_budget(self, report, names):
+        """
+        Checks the recorded phases against their budgets.
+
+        Args:
+            report (dict): The report of the memory profiler.
+            names (list): The names of the phases to check.
+        """
+        for name in names:
+            self.assertIn(name, report)
+            for key, budget in BUDGETS[name].items():
+                with self.subTest(phase=name, value=key):
+                    self.assertLessEqual(report[name][key] / 1024, budget,
+                                         f"{name} {key} over budget: "
+                                         f"{report[name][key] / 1024:.1f} KiB > {budget} KiB")
+
+    def test_fill_database_within_budget(self):
+        """
+        Tests that every phase of `fill_database` stays within its budget.
+        """
+        self.assertEqual(self.db_manager.backend.missing_pokedex_numbers(POKEMON), [])
+        self.assert_within_budget(self.fill_report, [name for name in BUDGETS
+                                                     if name.startswith('fill_database')])
+
+    def test_questions_within_budget(self):
+        """
+        Tests that building questions and loading their originals stays within the budget,
+        and that the questions do not keep allocations alive.
+        """
+        random.seed(42)
+        MEMORY.enable()
+        MEMORY.reset()
+        for _ in range(QUESTIONS):
+            Question(self.db_manager, image_size=IMAGE_SIZE).get_original_image()
+        report = MEMORY.report()
+        self.assertEqual(report['question']['calls'], QUESTIONS)
+        self.assert_within_budget(report, ['question', 'question.original'])
+
+    def test_question_images_within_budget(self):
+        """
+        Tests that a question holds its images at display size.
+        """
+        random.seed(42)
+        question = Question(self.db_manager, image_size=IMAGE_SIZE)
+        images = {'silhouette': question.get_black_image(),
+                  'original': question.get_original_image()}
+        for name, image in images.items():
+            with self.subTest(image=name):
+                self.assertLessEqual(ImageCache.image_size(image) / 1024, IMAGE_BUDGETS[name])
+
+if __name__ == '__main__':
+    unittest.main()
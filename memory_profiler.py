@@ -0,0 +1,206 @@
+"""
+memory_profiler Module
+
+This module provides the `MemoryProfiler` class, a memory-profiling mode based on
+`tracemalloc`. Code marks its phases, such as the steps of `fill_database` or the
+construction of a question, and the profiler records for every phase how much memory it
+allocated at its peak and how much it still held when it ended.
+
+The shared profiler `MEMORY` is disabled unless the environment variable
+`POKEMON_MEMORY_PROFILE` is set or `enable` is called, and a disabled profiler does not
+trace allocations. tracemalloc sees the memory of Python objects, such as downloaded and
+encoded image data, rows and queues, but not the pixel buffers Pillow allocates for decoded
+images, and not the memory of worker processes.
+"""
+
+import functools
+import os
+import threading
+import tracemalloc
+
+class _NoPhase:
+    """
+    The context manager handed out by a disabled profiler.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+_NO_PHASE = _NoPhase()
+
+class _Phase:
+    """
+    Measures the allocations of a block.
+    """
+
+    __slots__ = ('profiler', 'name', 'frame')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.frame = None
+
+    def __enter__(self):
+        self.frame = self.profiler._enter()
+        return self
+
+    def __exit__(self, *_exc):
+        self.profiler._exit(self.name, self.frame)
+        return False
+
+class MemoryProfiler:
+    """
+    Peak and retained allocations of named phases.
+
+    Phases may be nested; the peak of a phase includes the peaks of the phases inside it.
+    Allocations of all threads are counted, so phases running concurrently in several
+    threads are measured together.
+
+    Attributes:
+        enabled (bool): Whether phases are measured.
+        frames (int): The number of stack frames tracemalloc records per allocation.
+    """
+
+    def __init__(self, enabled=False, frames=1):
+        """
+        Initializes the MemoryProfiler.
+
+        Args:
+            enabled (bool): Whether phases are measured. Tracing starts right away.
+            frames (int): The number of stack frames tracemalloc records per allocation.
+        """
+        self.enabled = False
+        self.frames = frames
+        self._phases = {}
+        self._stack = []
+        self._started_tracing = False
+        self._lock = threading.RLock()
+        if enabled:
+            self.enable()
+
+    def enable(self, enabled=True):
+        """
+        Switches the profiling on or off. Tracing is started if it is not running yet and
+        stopped again if the profiler started it.
+
+        Args:
+            enabled (bool): Whether phases are measured.
+        """
+        with self._lock:
+            if enabled and not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started_tracing = True
+            elif not enabled and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+            self._stack.clear()
+            self.enabled = enabled
+
+    def reset(self):
+        """
+        Discards all recorded phases.
+        """
+        with self._lock:
+            self._phases.clear()
+
+    def phase(self, name):
+        """
+        Measures a block: `with profiler.phase('fill_database.ingest'): ...`.
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            object: The context manager measuring the block.
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def profiled(self, name):
+        """
+        Decorates a function so that every call is measured like a `phase`.
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            callable: The decorator.
+        """
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Phase(self, name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def report(self):
+        """
+        Returns the recorded phases.
+
+        Returns:
+            dict: For every phase, the number of 'calls', the largest 'peak' and 'retained'
+                  bytes of a single call and the 'retained_total' bytes of all calls.
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in sorted(self._phases.items())}
+
+    def summary(self):
+        """
+        Returns one line per recorded phase.
+
+        Returns:
+            list: The summary lines.
+        """
+        return [f"{name:<28} {stats['calls']:>6} calls, peak {stats['peak'] / 1024:9.1f} KiB, "
+                f"retained {stats['retained'] / 1024:9.1f} KiB "
+                f"(total {stats['retained_total'] / 1024:9.1f} KiB)"
+                for name, stats in self.report().items()]
+
+    def _enter(self):
+        """
+        Starts measuring a phase.
+
+        Returns:
+            dict: The state of the phase.
+        """
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            for frame in self._stack:
+                frame['peak'] = max(frame['peak'], peak)
+            tracemalloc.reset_peak()
+            frame = {'start': current, 'peak': current}
+            self._stack.append(frame)
+            return frame
+
+    def _exit(self, name, frame):
+        """
+        Ends measuring a phase and records it.
+
+        Args:
+            name (str): The name of the phase.
+            frame (dict): The state of the phase, from `_enter`.
+        """
+        with self._lock:
+            position = next((i for i, other in enumerate(self._stack) if other is frame), None)
+            if position is None:
+                return
+            current, peak = tracemalloc.get_traced_memory()
+            del self._stack[position]
+            peak = max(frame['peak'], peak)
+            for outer in self._stack:
+                outer['peak'] = max(outer['peak'], peak)
+            stats = self._phases.setdefault(
+                name, {'calls': 0, 'peak': 0, 'retained': 0, 'retained_total': 0})
+            stats['calls'] += 1
+            stats['peak'] = max(stats['peak'], peak - frame['start'])
+            stats['retained'] = max(stats['retained'], current - frame['start'])
+            stats['retained_total'] += current - frame['start']
+
+MEMORY = MemoryProfiler(enabled=bool(os.environ.get('POKEMON_MEMORY_PROFILE')))
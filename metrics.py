@@ -0,0 +1,390 @@
+"""
+metrics Module
+
+This module provides the `Metrics` class, a small in-process registry of counters and
+latency histograms for the hot paths of the game: database queries, HTTP requests,
+silhouettes, PNG encoding and decoding, and question construction. The registry can be
+exported as a JSON snapshot or in the Prometheus text format, written to a file or served
+from a local port.
+
+The shared registry `METRICS` is disabled unless the environment variable `POKEMON_METRICS`
+is set or `enable` is called. While it is disabled, `span` hands out one shared no-op
+context manager and `timed` functions only check a flag, so the instrumentation costs next to
+nothing.
+"""
+
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+                   2.5, 5.0, 10.0)
+
+class _NoSpan:
+    """
+    The context manager handed out by a disabled registry.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+class _Span:
+    """
+    Times a block and records it in a histogram.
+    """
+
+    __slots__ = ('metrics', 'key', 'start')
+
+    def __init__(self, metrics, key):
+        self.metrics = metrics
+        self.key = key
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *_exc):
+        self.metrics._record(self.key, time.perf_counter() - self.start)
+        if exc_type is not None:
+            name, labels = self.key
+            self.metrics.count(f"{name.removesuffix('_seconds')}_errors", **dict(labels))
+        return False
+
+class Metrics:
+    """
+    Counters and histograms kept in process.
+
+    Attributes:
+        enabled (bool): Whether measurements are recorded.
+        prefix (str): The prefix of the exported metric names.
+        buckets (tuple): The upper bounds of the histogram buckets in seconds.
+    """
+
+    def __init__(self, enabled=False, prefix='pokemon', buckets=DEFAULT_BUCKETS):
+        """
+        Initializes an empty Metrics registry.
+
+        Args:
+            enabled (bool): Whether measurements are recorded.
+            prefix (str): The prefix of the exported metric names.
+            buckets (tuple): The upper bounds of the histogram buckets in seconds.
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def enable(self, enabled=True):
+        """
+        Switches recording on or off. Recorded values are kept.
+
+        Args:
+            enabled (bool): Whether measurements are recorded.
+        """
+        self.enabled = enabled
+
+    def reset(self):
+        """
+        Discards all recorded values.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def drain(self):
+        """
+        Returns the recorded values and discards them, so that a worker process can hand its
+        measurements over to the registry of its parent.
+
+        Returns:
+            tuple: The counters and histograms, keyed by series, to be passed to `merge`.
+        """
+        with self._lock:
+            recorded = (self._counters, self._histograms)
+            self._counters, self._histograms = {}, {}
+        return recorded
+
+    def merge(self, recorded):
+        """
+        Adds values drained from the registry of a worker process, which must use the same
+        buckets. Nothing is added while the registry is disabled.
+
+        Args:
+            recorded (tuple): The counters and histograms returned by `drain`.
+        """
+        if not self.enabled:
+            return
+        counters, histograms = recorded
+        with self._lock:
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, other in histograms.items():
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    self._histograms[key] = dict(other, counts=list(other['counts']))
+                    continue
+                histogram['counts'] = [a + b for a, b in zip(histogram['counts'],
+                                                              other['counts'])]
+                histogram['sum'] += other['sum']
+                histogram['count'] += other['count']
+
+    def count(self, name, value=1, **labels):
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The name of the counter.
+            value (float): The amount to add.
+            **labels: The labels of the series.
+        """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """
+        Records a duration in a histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            seconds (float): The duration in seconds.
+            **labels: The labels of the series.
+        """
+        if self.enabled:
+            self._record(self._key(name, labels), seconds)
+
+    def _record(self, key, seconds):
+        """
+        Records a duration in the histogram of a series.
+
+        Args:
+            key (tuple): The key of the series, from `_key`.
+            seconds (float): The duration in seconds.
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {
+                    'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            histogram['counts'][index] += 1
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+
+    def span(self, name, **labels):
+        """
+        Times a block: `with metrics.span('db_query_seconds', operation='fetch_all'): ...`.
+        Blocks that raise are also counted, in `db_query_errors` for this example.
+
+        Args:
+            name (str): The name of the histogram.
+            **labels: The labels of the series.
+
+        Returns:
+            object: The context manager timing the block.
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, self._key(name, labels))
+
+    def timed(self, name, **labels):
+        """
+        Decorates a function so that every call is timed like a `span`.
+
+        Args:
+            name (str): The name of the histogram.
+            **labels: The labels of the series.
+
+        Returns:
+            callable: The decorator.
+        """
+        key = self._key(name, labels)
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Span(self, key):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """
+        Returns all recorded values.
+
+        Returns:
+            dict: The 'counters' and 'histograms', each keyed by name with a list of series.
+                  A histogram series holds its 'count', 'sum' and cumulative 'buckets' keyed
+                  by upper bound.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: dict(value, counts=list(value['counts']))
+                          for key, value in self._histograms.items()}
+        snapshot = {'counters': {}, 'histograms': {}}
+        for (name, labels), value in sorted(counters.items()):
+            snapshot['counters'].setdefault(name, []).append(
+                {'labels': dict(labels), 'value': value})
+        for (name, labels), histogram in sorted(histograms.items()):
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets + (float('inf'),), histogram['counts']):
+                cumulative += count
+                buckets['+Inf' if bound == float('inf') else repr(bound)] = cumulative
+            snapshot['histograms'].setdefault(name, []).append({
+                'labels': dict(labels), 'count': histogram['count'],
+                'sum': histogram['sum'], 'buckets': buckets})
+        return snapshot
+
+    def to_json(self):
+        """
+        Exports the recorded values as a JSON snapshot.
+
+        Returns:
+            str: The snapshot as JSON.
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Exports the recorded values in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = []
+        snapshot = self.snapshot()
+        for name, series in snapshot['counters'].items():
+            metric = f"{self.prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for entry in series:
+                lines.append(f"{metric}{self._labels(entry['labels'])} {entry['value']}")
+        for name, series in snapshot['histograms'].items():
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for entry in series:
+                for bound, count in entry['buckets'].items():
+                    labels = self._labels(dict(entry['labels'], le=bound))
+                    lines.append(f"{metric}_bucket{labels} {count}")
+                labels = self._labels(entry['labels'])
+                lines.append(f"{metric}_sum{labels} {entry['sum']}")
+                lines.append(f"{metric}_count{labels} {entry['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """
+        Writes the recorded values to a file, as JSON if the path ends with '.json' and in
+        the Prometheus text format otherwise.
+
+        Args:
+            path (str): The path of the file.
+        """
+        text = self.to_json() if path.endswith('.json') else self.to_prometheus()
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        """
+        Serves the recorded values from a local port in a background thread: the Prometheus
+        text at /metrics and the JSON snapshot at /metrics.json.
+
+        Args:
+            port (int): The port, or 0 for a free port.
+            host (str): The address to listen on.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        # pylint: disable=import-outside-toplevel
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Answers scrapes of the registry.
+            """
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """
+                Answers a GET request.
+                """
+                if self.path == '/metrics':
+                    content_type, body = 'text/plain; version=0.0.4', metrics.to_prometheus()
+                elif self.path == '/metrics.json':
+                    content_type, body = 'application/json', metrics.to_json()
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *_args):  # pylint: disable=arguments-differ
+                """
+                Silences the request log.
+                """
+
+        self.stop_serving()
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop_serving(self):
+        """
+        Stops the server started by `serve`.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @staticmethod
+    def _key(name, labels):
+        """
+        Builds the key of a series.
+
+        Args:
+            name (str): The name of the metric.
+            labels (dict): The labels of the series.
+
+        Returns:
+            tuple: The name and the sorted labels with their values as strings.
+        """
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    @staticmethod
+    def _labels(labels):
+        """
+        Formats the labels of a series.
+
+        Args:
+            labels (dict): The labels.
+
+        Returns:
+            str: The labels in braces, or an empty string.
+        """
+        if not labels:
+            return ''
+        pairs = ','.join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+        return '{' + pairs + '}'
+
+METRICS = Metrics(enabled=bool(os.environ.get('POKEMON_METRICS')))
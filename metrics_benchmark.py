@@ -0,0 +1,114 @@
+"""
+Benchmark for the overhead of the metrics.
+
+Measures the cost of the instrumentation in two ways, with the metrics disabled and enabled:
+
+* Per call: an empty function called directly, through `Metrics.timed` and inside
+  `Metrics.span`.
+* Per question: seeded questions built from a disposable SQLite database filled from the
+  local PokeAPI stub, which runs the instrumented queries, decoding and silhouettes. The
+  overhead of the disabled instrumentation per question is estimated from the number of
+  spans a question records when enabled.
+
+Usage:
+    python metrics_benchmark.py [calls] [questions]
+"""
+
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+from database_manager import PokemonDatabaseManager, create_backend
+from metrics import METRICS
+from pokeapi_stub import PokeApiStub
+from question import Question
+
+def measure_calls(calls):
+    """
+    Measures the time per call of an empty function with and without instrumentation.
+
+    Args:
+        calls (int): The number of calls per measurement.
+
+    Returns:
+        dict: The nanoseconds per call keyed by the way the function was called.
+    """
+    def plain():
+        return None
+
+    timed = METRICS.timed('benchmark_seconds')(plain)
+
+    def spanned():
+        with METRICS.span('benchmark_seconds'):
+            return None
+
+    return {label: min(timeit.repeat(function, number=calls, repeat=5)) / calls * 1e9
+            for label, function in (('plain', plain), ('timed', timed),
+                                    ('span', spanned))}
+
+def measure_questions(db_manager, count, seed=42):
+    """
+    Measures the time needed to build seeded questions with both images.
+
+    Args:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        count (int): The number of questions to build.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        float: The median time per question in milliseconds.
+    """
+    def build():
+        Question(db_manager, image_size=300).get_original_image()
+
+    runs = []
+    for _ in range(5):
+        random.seed(seed)
+        runs.append(timeit.timeit(build, number=count) / count * 1000)
+    return statistics.median(runs)
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    directory = tempfile.mkdtemp()
+    try:
+        with PokeApiStub(151) as stub:
+            db_manager = PokemonDatabaseManager(
+                151, image_cache_bytes=0, api_base_url=stub.api_base_url, http_cache_dir=None,
+                backend=create_backend('sqlite', path=os.path.join(directory, 'pokemon.db')),
+                checkpoint_path=os.path.join(directory, 'checkpoint.json'))
+            db_manager.fill_database()
+        results = {}
+        for enabled in (False, True):
+            METRICS.enable(enabled)
+            METRICS.reset()
+            measure_questions(db_manager, 20)
+            results[enabled] = (measure_calls(calls), measure_questions(db_manager, count))
+        spans = sum(series['count'] for name, histogram in METRICS.snapshot()[
+            'histograms'].items() if name != 'benchmark_seconds' for series in histogram)
+        db_manager.close()
+    finally:
+        METRICS.enable(False)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"Calls per measurement: {calls}, questions: {count}")
+    for enabled, (per_call, per_question) in results.items():
+        print(f"Metrics {'enabled ' if enabled else 'disabled'}: "
+              + ', '.join(f"{label} {ns:6.1f} ns" for label, ns in per_call.items())
+              + f", question {per_question:6.3f} ms")
+    disabled, enabled = results[False][1], results[True][1]
+    spans_per_question = spans / (20 + 5 * count)
+    per_span = results[False][0]['timed'] - results[False][0]['plain']
+    print(f"Spans per question: {spans_per_question:.1f}, disabled overhead about "
+          f"{spans_per_question * per_span / 1000:.2f} µs "
+          f"({spans_per_question * per_span / 1e6 / disabled:.3%}) per question")
+    print(f"Question overhead when enabled: {(enabled / disabled - 1):+.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Unit tests for the Metrics class.
+
+This module contains test cases for the counters, histograms and spans of the metrics
+registry, its JSON and Prometheus exports, and the local metrics server.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import urllib.request
+from metrics import Metrics
+
+class TestMetrics(unittest.TestCase):
+    """
+    Test cases for the Metrics class.
+    """
+
+    def setUp(self):
+        """
+        Creates an enabled registry with three buckets.
+        """
+        self.metrics = Metrics(enabled=True, buckets=(0.001, 0.01, 0.1))
+
+    def test_disabled_registry_records_nothing(self):
+        """
+        Tests that a disabled registry ignores counters, observations and spans.
+        """
+        metrics = Metrics()
+        metrics.count('requests')
+        metrics.observe('query_seconds', 0.5)
+        with metrics.span('query_seconds'):
+            pass
+        self.assertEqual(metrics.snapshot(), {'counters': {}, 'histograms': {}})
+
+    def test_counters_are_kept_per_label(self):
+        """
+        Tests that counters add up separately for every set of labels.
+        """
+        self.metrics.count('requests', status=200)
+        self.metrics.count('requests', 2, status=200)
+        self.metrics.count('requests', status=None)
+        series = {entry['labels']['status']: entry['value']
+                  for entry in self.metrics.snapshot()['counters']['requests']}
+        self.assertEqual(series, {'200': 3, 'None': 1})
+
+    def test_histogram_buckets_are_cumulative(self):
+        """
+        Tests that observations fall into the first bucket at least as large.
+        """
+        for seconds in (0.0005, 0.001, 0.05, 2.0):
+            self.metrics.observe('query_seconds', seconds)
+        histogram = self.metrics.snapshot()['histograms']['query_seconds'][0]
+        self.assertEqual(histogram['count'], 4)
+        self.assertAlmostEqual(histogram['sum'], 2.0515)
+        self.assertEqual(histogram['buckets'],
+                         {'0.001': 2, '0.01': 2, '0.1': 3, '+Inf': 4})
+
+    def test_drained_values_are_merged(self):
+        """
+        Tests that values drained from a worker registry add up in the parent registry.
+        """
+        worker = Metrics(enabled=True, buckets=self.metrics.buckets)
+        worker.count('requests', status=200)
+        worker.observe('query_seconds', 0.05)
+        self.metrics.count('requests', status=200)
+        self.metrics.observe('query_seconds', 0.0005)
+        self.metrics.merge(worker.drain())
+        self.assertEqual(worker.snapshot(), {'counters': {}, 'histograms': {}})
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['counters']['requests'][0]['value'], 2)
+        histogram = snapshot['histograms']['query_seconds'][0]
+        self.assertEqual(histogram['count'], 2)
+        self.assertEqual(histogram['buckets'], {'0.001': 1, '0.01': 1, '0.1': 2, '+Inf': 2})
+
+    def test_span_and_timed_record_errors(self):
+        """
+        Tests that spans and timed functions record their duration and count failures.
+        """
+        @self.metrics.timed('build_seconds', kind='question')
+        def build(fail):
+            if fail:
+                raise ValueError("no Pokémon")
+            return 'question'
+
+        self.assertEqual(build(False), 'question')
+        with self.assertRaises(ValueError):
+            build(True)
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['histograms']['build_seconds'][0]['count'], 2)
+        self.assertEqual(snapshot['counters']['build_errors'],
+                         [{'labels': {'kind': 'question'}, 'value': 1}])
+
+    def test_prometheus_export(self):
+        """
+        Tests the Prometheus text format of counters and histograms.
+        """
+        self.metrics.count('http_retries', 2)
+        self.metrics.observe('db_query_seconds', 0.005, operation='fetch_all')
+        lines = self.metrics.to_prometheus().splitlines()
+        self.assertIn('# TYPE pokemon_http_retries_total counter', lines)
+        self.assertIn('pokemon_http_retries_total 2', lines)
+        self.assertIn('# TYPE pokemon_db_query_seconds histogram', lines)
+        self.assertIn('pokemon_db_query_seconds_bucket{le="0.001",operation="fetch_all"} 0',
+                      lines)
+        self.assertIn('pokemon_db_query_seconds_bucket{le="+Inf",operation="fetch_all"} 1',
+                      lines)
+        self.assertIn('pokemon_db_query_seconds_count{operation="fetch_all"} 1', lines)
+
+    def test_dump_and_serve(self):
+        """
+        Tests that the metrics are written to files and served from a local port.
+        """
+        self.metrics.count('requests')
+        directory = tempfile.mkdtemp()
+        try:
+            self.metrics.dump(os.path.join(directory, 'metrics.json'))
+            self.metrics.dump(os.path.join(directory, 'metrics.prom'))
+            with open(os.path.join(directory, 'metrics.json'), 'r', encoding='utf-8') as file:
+                self.assertEqual(json.load(file), self.metrics.snapshot())
+            with open(os.path.join(directory, 'metrics.prom'), 'r', encoding='utf-8') as file:
+                self.assertEqual(file.read(), self.metrics.to_prometheus())
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        port = self.metrics.serve(port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                self.assertIn('pokemon_requests_total 1', response.read().decode('utf-8'))
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics.json") as response:
+                self.assertEqual(json.load(response), self.metrics.snapshot())
+        finally:
+            self.metrics.stop_serving()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+mysql_backend Module
+
+This module provides the `MySQLBackend` class, the storage backend for a MySQL server. Queries
+run on the pooled connections of a `ConnectionPool`, and the schema is created by running
+`createdatabase.sql` against the server.
+"""
+
+import os
+import mysql.connector
+from connection_pool import ConnectionPool
+from metrics import METRICS
+from storage_backend import DEFAULT_MODE, StorageBackend
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'createdatabase.sql')
+COUNT_TRIGGER = (
+    'DROP TRIGGER IF EXISTS highscores_count',
+    'CREATE TRIGGER highscores_count AFTER INSERT ON highscores FOR EACH ROW '
+    'INSERT INTO highscore_counts (mode, score, entries) VALUES (NEW.mode, NEW.score, 1) '
+    'ON DUPLICATE KEY UPDATE entries = entries + 1',
+)
+
+def split_script(script):
+    """
+    Splits an SQL script into the statements sent to the server one by one. Statements end
+    with a semicolon, so statements must not contain one elsewhere.
+
+    Args:
+        script (str): The SQL script.
+
+    Returns:
+        list: The statements.
+    """
+    return [statement.strip() for statement in script.split(';') if statement.strip()]
+
+class MySQLBackend(StorageBackend):
+    """
+    Stores the Pokémon database on a MySQL server.
+
+    Attributes:
+        db_config (dict): The keyword arguments passed to `mysql.connector.connect`.
+        script_path (str): The SQL script creating the database and tables.
+        pool (ConnectionPool): The pooled connections used for queries.
+    """
+
+    name = 'mysql'
+
+    def __init__(self, db_config=None, pool_size=5, script_path=SCRIPT_PATH):
+        """
+        Initializes the MySQLBackend. Connections are opened lazily on first use.
+
+        Args:
+            db_config (dict, optional): The connection settings. Defaults to the local server.
+            pool_size (int): The number of pooled connections. If 0, every query opens its
+                             own connection.
+            script_path (str): The SQL script creating the database and tables.
+        """
+        self.db_config = db_config or {
+            'host': 'localhost',
+            'user': 'root',
+            'password': 'passwort',
+            'database': 'pokemon_db'
+        }
+        self.script_path = script_path
+        self.pool = ConnectionPool(self.db_config, pool_size)
+
+    def initialize(self, migrations=()):
+        """
+        Sets up the database and tables unless the database has the version of the SQL
+        script. Without the script nothing is done.
+
+        Args:
+            migrations (iterable): Callables migrating the data after an upgrade.
+
+        Returns:
+            bool: True if the schema script was run.
+        """
+        if not os.path.exists(self.script_path):
+            print(f"SQL script not found at {self.script_path}")
+            return False
+        return super().initialize(migrations)
+
+    def create_schema(self):
+        """
+        Executes the SQL script to set up the database and tables.
+        """
+        with open(self.script_path, 'r', encoding='utf-8') as file:
+            self.run_statements(split_script(file.read()), use_database=False)
+        print("SQL script executed successfully.")
+
+    def migrate_highscores(self):
+        """
+        Adds the primary key, the mode, the entry id and the score index to a highscores table
+        created before they existed, creates the trigger maintaining the score counts and
+        fills the score counts. Old highscores belong to the default mode. The trigger refers
+        to the mode, so it is created after the columns are added.
+        """
+        columns = self.fetch_all(
+            "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'highscores'")
+        if 'id' not in {row['COLUMN_NAME'] for row in columns}:
+            print("Adding a primary key, the mode and a score index to the highscores...")
+            self.execute(
+                'ALTER TABLE highscores ADD COLUMN id INT AUTO_INCREMENT PRIMARY KEY FIRST, '
+                f"ADD COLUMN mode VARCHAR(32) NOT NULL DEFAULT '{DEFAULT_MODE}', "
+                'ADD COLUMN entry_id CHAR(32) NULL UNIQUE, '
+                'ADD INDEX idx_highscores_mode_score (mode, score DESC, id)')
+        self._create_count_trigger()
+        super().migrate_highscores()
+
+    def _create_count_trigger(self):
+        """
+        Creates the trigger counting the highscores per mode and score, replacing an older
+        version. Trigger statements are not supported as prepared statements, so they run on
+        a connection of their own.
+        """
+        self.run_statements(COUNT_TRIGGER)
+
+    def run_statements(self, statements, use_database=True):
+        """
+        Runs SQL statements one by one on a new, unpooled connection and commits them.
+
+        Args:
+            statements (iterable): The SQL statements.
+            use_database (bool): Whether the connection uses the configured database. Without
+                                 it, statements may create or drop the database.
+        """
+        config = dict(self.db_config)
+        if not use_database:
+            config.pop('database', None)
+        conn = mysql.connector.connect(**config)
+        try:
+            cursor = conn.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+
+    def connect(self):
+        """
+        Establishes a connection to the MySQL database.
+
+        Returns:
+            mysql.connector.connection.MySQLConnection: A connection object to the database.
+        """
+        return mysql.connector.connect(**self.db_config)
+
+    @METRICS.timed('db_query_seconds', backend='mysql', operation='fetch_all')
+    def fetch_all(self, sql, params=()):
+        return self.pool.fetch_all(sql, params)
+
+    @METRICS.timed('db_query_seconds', backend='mysql', operation='execute')
+    def execute(self, sql, params=()):
+        self.pool.execute(sql, params)
+
+    @METRICS.timed('db_query_seconds', backend='mysql', operation='execute_many')
+    def execute_many(self, sql, rows):
+        self.pool.execute_many(sql, rows)
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,96 @@
+"""
+Unit tests for the MySQLBackend class.
+
+This module contains test cases for the schema of the MySQL backend. The schema script is
+checked without a server. The upgrade tests run against the local MySQL server and are skipped
+unless the environment variable POKEMON_DB_BACKEND is set to 'mysql'. They use a database of
+their own, which is dropped afterwards.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from mysql_backend import SCRIPT_PATH, MySQLBackend, split_script
+from storage_backend import DEFAULT_MODE
+
+DATABASE = 'pokemon_upgrade_test'
+DB_CONFIG = {'host': 'localhost', 'user': 'root', 'password': 'passwort', 'database': DATABASE}
+
+# The schema of the first release, before highscores had an id, a mode and score counts.
+BASELINE_SCHEMA = (
+    f'CREATE DATABASE {DATABASE}',
+    f'USE {DATABASE}',
+    'CREATE TABLE pokemon (pokedex_number INT PRIMARY KEY, name VARCHAR(100), '
+    'original_image LONGBLOB, black_image LONGBLOB)',
+    'CREATE TABLE highscores (name VARCHAR(255) NOT NULL, score INT NOT NULL)',
+    "INSERT INTO highscores (name, score) VALUES ('Ash', 10), ('Misty', 10), ('Brock', 5)",
+)
+
+STATEMENT_START = re.compile(r'^(CREATE|DROP|USE|ALTER|INSERT)\b', re.MULTILINE)
+
+class TestSchemaScript(unittest.TestCase):
+    """
+    Test cases for the MySQL schema script, which run without a server.
+    """
+
+    def test_every_chunk_is_one_statement(self):
+        """
+        Tests that splitting the script as `create_schema` does yields one statement per
+        chunk, so no statement lacks its terminating semicolon.
+        """
+        with open(SCRIPT_PATH, 'r', encoding='utf-8') as file:
+            statements = split_script(file.read())
+        self.assertGreater(len(statements), 1)
+        for statement in statements:
+            with self.subTest(statement=statement.splitlines()[0]):
+                self.assertEqual(len(STATEMENT_START.findall(statement)), 1, statement)
+
+@unittest.skipUnless(os.environ.get('POKEMON_DB_BACKEND') == 'mysql',
+                     "set POKEMON_DB_BACKEND=mysql to run against the local MySQL server")
+class TestMySQLUpgrade(unittest.TestCase):
+    """
+    Test cases upgrading a database with the baseline schema to the current schema.
+    """
+
+    def setUp(self):
+        """
+        Creates a database with the baseline schema and a copy of the schema script that
+        uses it.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.script_path = os.path.join(self.directory, 'createdatabase.sql')
+        with open(SCRIPT_PATH, 'r', encoding='utf-8') as file:
+            script = file.read().replace('pokemon_db', DATABASE)
+        with open(self.script_path, 'w', encoding='utf-8') as file:
+            file.write(script)
+        self.backend = MySQLBackend(DB_CONFIG, pool_size=1, script_path=self.script_path)
+        self.backend.run_statements((f'DROP DATABASE IF EXISTS {DATABASE}',) + BASELINE_SCHEMA,
+                                    use_database=False)
+
+    def tearDown(self):
+        """
+        Closes the backend and drops the test database.
+        """
+        self.backend.close()
+        self.backend.run_statements([f'DROP DATABASE IF EXISTS {DATABASE}'], use_database=False)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_baseline_schema_is_upgraded(self):
+        """
+        Tests that the highscores of the baseline schema are kept in the default mode, that
+        their scores are counted and that new highscores are counted by the trigger.
+        """
+        self.assertTrue(self.backend.initialize())
+        self.assertEqual([row['name'] for row in self.backend.top_highscores(mode=DEFAULT_MODE)],
+                         ['Ash', 'Misty', 'Brock'])
+        self.assertEqual(self.backend.score_counts(), {10: 2, 5: 1})
+
+        self.backend.add_highscore('Gary', 10)
+        self.assertEqual(self.backend.score_counts(), {10: 3, 5: 1})
+        self.assertEqual(self.backend.score_rank(7), 4)
+        self.assertFalse(self.backend.initialize())
+
+if __name__ == '__main__':
+    unittest.main()
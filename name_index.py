@@ -0,0 +1,90 @@
+"""
+name_index Module
+
+This module provides the `PokemonNameIndex` class, a compact in-memory index of the Pokémon
+present in the database. It keeps the Pokédex numbers as a sorted array next to their names,
+so that names can be looked up and random Pokémon from a Pokédex range can be drawn without
+any database traffic.
+"""
+
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+
+class PokemonNameIndex:
+    """
+    A sorted index of the Pokédex numbers and names present in the database.
+
+    Attributes:
+        ids (array.array): The sorted Pokédex numbers present in the database.
+        names (list): The capitalized names, in the same order as `ids`.
+    """
+
+    def __init__(self, rows=()):
+        """
+        Initializes the PokemonNameIndex.
+
+        Args:
+            rows (iterable): Pairs of Pokédex number and name.
+        """
+        entries = sorted((int(number), name.capitalize()) for number, name in rows)
+        self.ids = array('i', (number for number, _ in entries))
+        self.names = [name for _, name in entries]
+
+    def __len__(self):
+        """
+        Returns the number of Pokémon in the index.
+
+        Returns:
+            int: The number of Pokémon.
+        """
+        return len(self.ids)
+
+    def get_name(self, pokedex_number):
+        """
+        Looks up the name of a Pokémon.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+
+        Returns:
+            str: The capitalized name, or None if the Pokémon is not in the index.
+        """
+        position = bisect_left(self.ids, pokedex_number)
+        if position < len(self.ids) and self.ids[position] == pokedex_number:
+            return self.names[position]
+        return None
+
+    def count_in_range(self, low, high):
+        """
+        Counts the Pokémon present in a Pokédex range.
+
+        Args:
+            low (int): The first Pokédex number of the range.
+            high (int): The last Pokédex number of the range, inclusive.
+
+        Returns:
+            int: The number of Pokémon present in the range.
+        """
+        return bisect_right(self.ids, high) - bisect_left(self.ids, low)
+
+    def sample(self, low, high, count):
+        """
+        Draws distinct random Pokémon from a Pokédex range.
+
+        The range is located with two binary searches and only positions are sampled, so the
+        cost does not depend on the size of the range or on gaps in it.
+
+        Args:
+            low (int): The first Pokédex number of the range.
+            high (int): The last Pokédex number of the range, inclusive.
+            count (int): The number of Pokémon to draw. Fewer are returned if the range holds
+                         fewer Pokémon.
+
+        Returns:
+            list: Pairs of Pokédex number and name in random order.
+        """
+        start = bisect_left(self.ids, low)
+        end = bisect_right(self.ids, high)
+        positions = random.sample(range(start, end), min(count, max(end - start, 0)))
+        return [(self.ids[position], self.names[position]) for position in positions]
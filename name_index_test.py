@@ -0,0 +1,58 @@
+"""
+Unit tests for the PokemonNameIndex class.
+
+This module contains test cases to verify name lookups and random sampling from Pokédex
+ranges, including sparse and partially filled ranges.
+"""
+
+import unittest
+from name_index import PokemonNameIndex
+
+class TestPokemonNameIndex(unittest.TestCase):
+    """
+    Test suite for the PokemonNameIndex class.
+    """
+
+    def setUp(self):
+        """
+        Set up an index with a gap at Pokédex number 4.
+        """
+        self.index = PokemonNameIndex(
+            [(5, 'charmeleon'), (1, 'bulbasaur'), (2, 'ivysaur'), (3, 'venusaur'),
+             (152, 'chikorita')])
+
+    def test_get_name(self):
+        """
+        Test that names are capitalized and missing numbers return None.
+        """
+        self.assertEqual(self.index.get_name(1), "Bulbasaur")
+        self.assertEqual(self.index.get_name(152), "Chikorita")
+        self.assertIsNone(self.index.get_name(4))
+        self.assertIsNone(self.index.get_name(999))
+
+    def test_count_in_range(self):
+        """
+        Test that only present Pokémon are counted.
+        """
+        self.assertEqual(self.index.count_in_range(1, 151), 4)
+        self.assertEqual(self.index.count_in_range(4, 4), 0)
+        self.assertEqual(len(self.index), 5)
+
+    def test_sample_draws_present_pokemon_in_range(self):
+        """
+        Test that samples are distinct and only contain present Pokémon of the range.
+        """
+        for _ in range(50):
+            drawn = self.index.sample(1, 151, 4)
+            numbers = [number for number, _ in drawn]
+            self.assertEqual(sorted(numbers), [1, 2, 3, 5])
+
+    def test_sample_sparse_range(self):
+        """
+        Test that a range with fewer Pokémon than requested returns what is there.
+        """
+        self.assertEqual(self.index.sample(100, 200, 4), [(152, "Chikorita")])
+        self.assertEqual(self.index.sample(200, 300, 4), [])
+
+if __name__ == '__main__':
+    unittest.main()
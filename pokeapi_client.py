@@ -0,0 +1,317 @@
+"""
+pokeapi_client Module
+
+This module provides the `PokeApiClient` class, the single HTTP client used to talk to the
+PokeAPI. All requests share one keep-alive `requests.Session`, so TCP and TLS connections are
+reused. The client can be used synchronously or from asyncio, limits the number of requests
+in flight, retries failed requests with jittered exponential backoff and records the timing of
+every request. With an `HttpCache`, responses are stored on disk and revalidated with
+conditional requests, or served without any network access in offline mode.
+"""
+
+import asyncio
+import random
+import statistics
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from metrics import METRICS
+
+RequestTiming = namedtuple('RequestTiming', ['url', 'status', 'attempts', 'seconds'])
+RequestTiming.__doc__ = """
+The timing of one request, including its retries: the requested URL, the final HTTP status
+code (None if no response was received), the number of attempts and the total time in seconds.
+"""
+
+class PokeApiClient:
+    """
+    A pooled keep-alive HTTP client for the PokeAPI.
+
+    Attributes:
+        max_in_flight (int): The maximum number of concurrent requests.
+        timeout (float): The timeout of a single attempt in seconds.
+        retries (int): The number of retries after a failed attempt.
+        backoff (float): The base delay of the exponential backoff in seconds.
+        timings (list): A `RequestTiming` for every completed request.
+        cache (HttpCache): The on-disk response cache, or None.
+    """
+
+    retry_statuses = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, max_in_flight=20, timeout=10, retries=3, backoff=0.5, cache=None):
+        """
+        Initializes the PokeApiClient.
+
+        Args:
+            max_in_flight (int): The maximum number of concurrent requests.
+            timeout (float): The timeout of a single attempt in seconds.
+            retries (int): The number of retries after a failed attempt.
+            backoff (float): The base delay of the exponential backoff in seconds.
+            cache (HttpCache, optional): The on-disk response cache.
+        """
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.timings = []
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_in_flight)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix='pokeapi')
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """
+        Sends a GET request and retries it if it fails.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            requests.Response: The final response, or None if every attempt raised an error.
+        """
+        start = time.perf_counter()
+        response = None
+        attempt = 0
+        while True:
+            response = self._attempt(url)
+            if not self._should_retry(response) or attempt == self.retries:
+                break
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+        self._record(url, response, attempt + 1, time.perf_counter() - start)
+        return response
+
+    async def get_async(self, url):
+        """
+        Sends a GET request from asyncio and retries it if it fails.
+
+        The blocking request runs in the client's thread pool, which limits the number of
+        requests in flight. Backoff delays do not occupy a thread.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            requests.Response: The final response, or None if every attempt raised an error.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        response = None
+        attempt = 0
+        while True:
+            response = await loop.run_in_executor(self._executor, self._attempt, url)
+            if not self._should_retry(response) or attempt == self.retries:
+                break
+            await asyncio.sleep(self._backoff_delay(attempt))
+            attempt += 1
+        self._record(url, response, attempt + 1, time.perf_counter() - start)
+        return response
+
+    def get_json(self, url):
+        """
+        Requests a JSON document.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            dict: The decoded JSON, or None if the request failed.
+        """
+        return self._json(url, self.get(url))
+
+    async def get_json_async(self, url):
+        """
+        Requests a JSON document from asyncio.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            dict: The decoded JSON, or None if the request failed.
+        """
+        return self._json(url, await self.get_async(url))
+
+    def get_bytes(self, url):
+        """
+        Requests a binary resource such as an image.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            bytes: The response body, or None if the request failed.
+        """
+        response = self.get(url)
+        return response.content if response is not None and response.status_code == 200 else None
+
+    async def get_bytes_async(self, url):
+        """
+        Requests a binary resource such as an image from asyncio.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            bytes: The response body, or None if the request failed.
+        """
+        response = await self.get_async(url)
+        return response.content if response is not None and response.status_code == 200 else None
+
+    async def fetch_artwork_async(self, pokemon_url):
+        """
+        Fetches the details and the official artwork of a Pokémon.
+
+        Args:
+            pokemon_url (str): The URL of the Pokémon's details.
+
+        Returns:
+            tuple: A tuple containing Pokémon ID, name, and the downloaded artwork,
+                   or None if fetching fails.
+        """
+        pokemon_details = await self.get_json_async(pokemon_url)
+        if not pokemon_details:
+            return None
+
+        pokemon_name = pokemon_details['name']
+        pokemon_id = pokemon_details['id']
+        front_sprite_url = pokemon_details['sprites']['other']['official-artwork']['front_default']
+
+        print(f"Fetching Pokémon: {pokemon_name} (ID: {pokemon_id})")
+
+        if front_sprite_url:
+            image_data = await self.get_bytes_async(front_sprite_url)
+            if image_data:
+                return (pokemon_id, pokemon_name, image_data)
+        return None
+
+    def summary(self):
+        """
+        Returns a one-line summary of the recorded request timings.
+
+        Returns:
+            str: The summary line.
+        """
+        with self._lock:
+            timings = list(self.timings)
+        if not timings:
+            return "HTTP     no requests"
+        seconds = sorted(timing.seconds for timing in timings)
+        retried = sum(1 for timing in timings if timing.attempts > 1)
+        failed = sum(1 for timing in timings if timing.status != 200)
+        p95 = seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))]
+        line = (f"HTTP     {len(timings):>5} requests, {retried} retried, {failed} failed, "
+                f"mean {statistics.mean(seconds) * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms")
+        if self.cache:
+            stats = self.cache.stats()
+            line += (f", cache {stats['hits']} hits, {stats['revalidated']} revalidated, "
+                     f"{stats['entries']} entries, {stats['bytes'] / 1024 / 1024:.1f} MiB")
+        return line
+
+    def close(self):
+        """
+        Closes the session and the thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _attempt(self, url):
+        """
+        Sends a single GET request. If the URL is cached, the request is conditional and a
+        304 response is answered from the cache. In offline mode, only the cache is used.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            requests.Response: The response, or None if the request raised an error or the URL
+                               is not cached in offline mode.
+        """
+        entry = self.cache.lookup(url) if self.cache else None
+        if self.cache and self.cache.offline:
+            if entry:
+                return self.cache.read(entry)
+            print(f"Not in the offline cache: {url}")
+            return None
+
+        headers = self.cache.conditional_headers(entry) if entry else {}
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as error:
+            print(f"Error while requesting {url}: {error}")
+            return None
+
+        if response.status_code == 304 and entry:
+            cached = self.cache.read(entry, revalidated=True)
+            # The entry is dropped if its body is gone, so the retry is unconditional.
+            return cached if cached is not None else self._attempt(url)
+        if response.status_code == 200 and self.cache:
+            self.cache.store(url, response.headers, response.content)
+        return response
+
+    def _should_retry(self, response):
+        """
+        Decides whether a failed attempt should be retried.
+
+        Args:
+            response (requests.Response): The response of the attempt, or None.
+
+        Returns:
+            bool: True for connection errors, rate limiting and server errors. Never in
+                  offline mode.
+        """
+        if self.cache and self.cache.offline:
+            return False
+        return response is None or response.status_code in self.retry_statuses
+
+    def _backoff_delay(self, attempt):
+        """
+        Computes the jittered delay before a retry.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 0.
+
+        Returns:
+            float: The delay in seconds, drawn uniformly up to the exponential backoff.
+        """
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    def _record(self, url, response, attempts, seconds):
+        """
+        Records the timing of a completed request.
+
+        Args:
+            url (str): The requested URL.
+            response (requests.Response): The final response, or None.
+            attempts (int): The number of attempts made.
+            seconds (float): The total time in seconds.
+        """
+        status = response.status_code if response is not None else None
+        with self._lock:
+            self.timings.append(RequestTiming(url, status, attempts, seconds))
+        METRICS.observe('http_request_seconds', seconds, status=status)
+        if attempts > 1:
+            METRICS.count('http_retries', attempts - 1)
+
+    @staticmethod
+    def _json(url, response):
+        """
+        Decodes the JSON body of a successful response.
+
+        Args:
+            url (str): The requested URL.
+            response (requests.Response): The response, or None.
+
+        Returns:
+            dict: The decoded JSON, or None if the request failed.
+        """
+        if response is not None and response.status_code == 200:
+            return response.json()
+        print(f"Error while requesting data from {url}")
+        return None
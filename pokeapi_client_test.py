@@ -0,0 +1,163 @@
+"""
+Unit tests for the PokeApiClient class.
+
+This module contains test cases that run the HTTP client and the streaming ingest pipeline
+against a local stand-in HTTP server serving recorded PokeAPI fixtures.
+"""
+
+import asyncio
+import time
+import unittest
+from ingest_pipeline import IngestPipeline
+from ingest_pipeline_test import FakeConnection
+from pokeapi_client import PokeApiClient
+from pokeapi_stub import PokeApiStub
+from silhouette import SilhouetteEngine
+
+class StubManager:
+    """
+    The parts of the database manager used by the ingest pipeline, fetching from the stub.
+    """
+
+    def __init__(self, client):
+        """
+        Initializes the StubManager.
+
+        Args:
+            client (PokeApiClient): The HTTP client.
+        """
+        self.client = client
+        self.silhouette_engine = SilhouetteEngine()
+        self.variant_encoder = None
+        self.backend = self
+
+    async def fetch_pokemon_artwork_async(self, pokemon):
+        """
+        Fetches the artwork of a Pokémon with the HTTP client.
+
+        Args:
+            pokemon (dict): A dictionary with the 'url' of the Pokémon.
+
+        Returns:
+            tuple: The Pokémon ID, name and artwork, or None.
+        """
+        return await self.client.fetch_artwork_async(pokemon['url'])
+
+    @staticmethod
+    def save_pokemon_batch(cursor, pokemon_data, _batch_size=100):
+        """
+        Saves a batch of rows with the given cursor, in place of the storage backend.
+
+        Args:
+            cursor (FakeCursor): The cursor.
+            pokemon_data (list): The rows to insert.
+        """
+        cursor.executemany('', pokemon_data)
+
+class TestPokeApiClient(unittest.TestCase):
+    """
+    Test suite for the PokeApiClient class.
+    """
+
+    def setUp(self):
+        """
+        Start a stub server with 12 Pokémon, of which #7 is missing and whose detail document
+        of #3 fails twice before it succeeds.
+        """
+        self.stub = PokeApiStub(
+            max_pokedex_number=12, artwork_size=32, missing={7},
+            failures={'/api/v2/pokemon/3/': 2}).start()
+        self.client = PokeApiClient(max_in_flight=4, retries=3, backoff=0.01)
+
+    def tearDown(self):
+        """
+        Stop the client and the stub server.
+        """
+        self.client.close()
+        self.stub.stop()
+
+    def test_get_json_reads_recorded_fixture(self):
+        """
+        Test that the recorded detail document is served.
+        """
+        details = self.client.get_json(f"{self.stub.api_base_url}/1/")
+        self.assertEqual(details['name'], "bulbasaur")
+        self.assertEqual(self.client.timings[0].status, 200)
+
+    def test_retries_server_errors(self):
+        """
+        Test that 503 responses are retried and the attempts are recorded.
+        """
+        details = self.client.get_json(f"{self.stub.api_base_url}/3/")
+        self.assertEqual(details['name'], "venusaur")
+        self.assertEqual(self.client.timings[-1].attempts, 3)
+
+    def test_does_not_retry_not_found(self):
+        """
+        Test that a 404 response is returned without retries.
+        """
+        self.assertIsNone(self.client.get_json(f"{self.stub.api_base_url}/7/"))
+        self.assertEqual(self.client.timings[-1].attempts, 1)
+
+    def test_fetch_artwork_async(self):
+        """
+        Test that details and artwork are fetched concurrently from asyncio.
+        """
+        async def fetch_all():
+            return await asyncio.gather(*(
+                self.client.fetch_artwork_async(f"{self.stub.api_base_url}/{n}/")
+                for n in (1, 2, 4)))
+        artworks = asyncio.run(fetch_all())
+        self.assertEqual([a[1] for a in artworks], ["bulbasaur", "ivysaur", "charmander"])
+        self.assertTrue(all(a[2].startswith(b'\x89PNG') for a in artworks))
+
+    def test_pipeline_against_stub(self):
+        """
+        Test that the ingest pipeline saves every Pokémon the stub serves.
+        """
+        pipeline = IngestPipeline(StubManager(self.client), max_in_flight=5, process_workers=0,
+                                  queue_size=2, batch_size=4)
+        conn = FakeConnection()
+        saved = pipeline.run(
+            [{'url': f"{self.stub.api_base_url}/{n}/"} for n in range(1, 13)], conn)
+        self.assertEqual(saved, 11)
+        ids = sorted(row[0] for batch in conn.commits for row in batch)
+        self.assertEqual(ids, [1, 2, 3, 4, 5, 6, 8, 9, 10, 11, 12])
+        self.assertEqual(pipeline.stats['fetch'].failed, 1)
+
+    def test_injected_failures_are_retried(self):
+        """
+        Test that random 503 responses of a flaky stub are retried until they succeed.
+        """
+        flaky = PokeApiStub(max_pokedex_number=12, artwork_size=32, failure_rate=0.5,
+                            seed=3).start()
+        try:
+            client = PokeApiClient(max_in_flight=4, retries=10, backoff=0.001)
+            names = [client.get_json(f"{flaky.api_base_url}/{n}/")['name'] for n in (1, 2, 4)]
+            client.close()
+        finally:
+            flaky.stop()
+        self.assertEqual(names, ["bulbasaur", "ivysaur", "charmander"])
+        self.assertGreater(flaky.injected_failures, 0)
+        self.assertEqual(sum(t.attempts for t in client.timings), 3 + flaky.injected_failures)
+
+    def test_latency_and_bandwidth(self):
+        """
+        Test that responses are delayed by the latency and paced by the bandwidth.
+        """
+        slow = PokeApiStub(max_pokedex_number=12, artwork_size=32, latency=0.05,
+                           bandwidth=4096).start()
+        try:
+            client = PokeApiClient(max_in_flight=4)
+            body_size = len(slow.respond('/artwork/1.png')[2])
+            start = time.perf_counter()
+            artwork = client.get_bytes(f"{slow.base_url}/artwork/1.png")
+            elapsed = time.perf_counter() - start
+            client.close()
+        finally:
+            slow.stop()
+        self.assertEqual(len(artwork), body_size)
+        self.assertGreaterEqual(elapsed, 0.05 + body_size / 4096 * 0.9)
+
+if __name__ == '__main__':
+    unittest.main()
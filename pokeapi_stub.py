@@ -0,0 +1,305 @@
+"""
+pokeapi_stub Module
+
+This module provides the `PokeApiStub` class, a local stand-in for the PokeAPI used by tests
+and benchmarks. It serves the listing and detail documents recorded in
+`fixtures/pokeapi.json` and generated official artwork from a local HTTP server, so that
+ingestion can run without network access. Pokédex numbers beyond the recorded fixtures are
+served with synthetic names. Successful responses carry an ETag and a Last-Modified header
+and conditional requests are answered with 304. For benchmarks, the stub can add latency to
+every response, limit the bandwidth of response bodies and fail a seeded random share of the
+requests.
+"""
+
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image, ImageDraw
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'pokeapi.json')
+LAST_MODIFIED = 'Sat, 01 Jun 2024 00:00:00 GMT'
+
+def load_fixtures(path=FIXTURE_PATH):
+    """
+    Loads the recorded PokeAPI detail documents.
+
+    Args:
+        path (str): The path of the fixture file.
+
+    Returns:
+        dict: The detail documents keyed by Pokédex number.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return {pokemon['id']: pokemon for pokemon in json.load(file)['pokemon']}
+
+def make_artwork(pokedex_number, size=475):
+    """
+    Generates deterministic official artwork for a Pokémon: a colored shape with soft edges
+    on a transparent background.
+
+    Args:
+        pokedex_number (int): The Pokédex number of the Pokémon.
+        size (int): The width and height of the artwork.
+
+    Returns:
+        bytes: The artwork as PNG data.
+    """
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    color = ((pokedex_number * 53) % 256, (pokedex_number * 97) % 256, (pokedex_number * 31) % 256)
+    inset = size // 8 + pokedex_number % (size // 8)
+    draw.ellipse((inset, size // 10, size - inset, size - size // 10), fill=color + (255,))
+    draw.rectangle((size // 3, size // 20, 2 * size // 3, size // 2), fill=color + (160,))
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+class PokeApiStub:
+    """
+    A local HTTP server that imitates the parts of the PokeAPI used by the manager.
+
+    Attributes:
+        max_pokedex_number (int): The highest Pokédex number served.
+        artwork_size (int): The width and height of the generated artwork.
+        failures (dict): The number of 503 responses still to be sent, keyed by URL path.
+        missing (set): Pokédex numbers answered with 404.
+        latency (float): The seconds every response is delayed by.
+        bandwidth (int): The bytes per second a response body is sent at, or None.
+        failure_rate (float): The share of requests answered with 503 at random.
+        requests (list): The paths of all received requests.
+        injected_failures (int): The number of 503 responses sent at random.
+        not_modified (int): The number of 304 responses sent.
+        base_url (str): The root URL of the running server.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self, max_pokedex_number=1025, *, artwork_size=475, failures=None, missing=(),
+            latency=0.0, bandwidth=None, failure_rate=0.0, seed=0):
+        """
+        Initializes the PokeApiStub. The server starts with `start`.
+
+        Args:
+            max_pokedex_number (int): The highest Pokédex number served. The other options are
+                                      passed by keyword.
+            artwork_size (int): The width and height of the generated artwork.
+            failures (dict, optional): The number of 503 responses to send before succeeding,
+                                       keyed by URL path.
+            missing (iterable): Pokédex numbers answered with 404.
+            latency (float): The seconds every response is delayed by.
+            bandwidth (int, optional): The bytes per second each response body is sent at.
+                                       Unlimited if None.
+            failure_rate (float): The share of requests answered with 503 at random.
+            seed (int): The seed of the random failures.
+        """
+        self.max_pokedex_number = max_pokedex_number
+        self.artwork_size = artwork_size
+        self.failures = dict(failures or {})
+        self.missing = set(missing)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.failure_rate = failure_rate
+        self.requests = []
+        self.injected_failures = 0
+        self.not_modified = 0
+        self.base_url = None
+        self._fixtures = load_fixtures()
+        self._artwork = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def api_base_url(self):
+        """
+        The URL to use as `api_base_url` of the `PokemonDatabaseManager`.
+        """
+        return f"{self.base_url}/api/v2/pokemon"
+
+    def start(self):
+        """
+        Starts the server on a free local port in a background thread.
+
+        Returns:
+            PokeApiStub: The stub itself.
+        """
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Dispatches requests to the stub.
+            """
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """
+                Answers a GET request.
+                """
+                status, content_type, body, etag = stub.respond(
+                    self.path, self.headers.get('If-None-Match'))
+                if stub.latency:
+                    time.sleep(stub.latency)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                if etag:
+                    self.send_header('ETag', etag)
+                    self.send_header('Last-Modified', LAST_MODIFIED)
+                self.end_headers()
+                stub.send_body(self.wfile, body)
+
+            def log_message(self, *_args):  # pylint: disable=arguments-differ
+                """
+                Silences the request log.
+                """
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_exc):
+        self.stop()
+
+    def detail(self, pokedex_number):
+        """
+        Returns the detail document of a Pokémon with artwork URLs pointing to the stub.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+
+        Returns:
+            dict: The detail document.
+        """
+        document = json.loads(json.dumps(self._fixtures.get(pokedex_number, {
+            'id': pokedex_number,
+            'name': f"pokemon-{pokedex_number}",
+            'sprites': {'other': {'official-artwork': {}}},
+        })))
+        document['sprites']['other']['official-artwork']['front_default'] = (
+            f"{self.base_url}/artwork/{pokedex_number}.png")
+        return document
+
+    def send_body(self, wfile, body):
+        """
+        Writes a response body, in chunks paced to `bandwidth` if it is limited.
+
+        Args:
+            wfile (io.BufferedIOBase): The output stream of the connection.
+            body (bytes): The response body.
+        """
+        if not self.bandwidth:
+            wfile.write(body)
+            return
+        chunk_size = max(1, self.bandwidth // 50)
+        for offset in range(0, len(body), chunk_size):
+            chunk = body[offset:offset + chunk_size]
+            time.sleep(len(chunk) / self.bandwidth)
+            wfile.write(chunk)
+
+    def respond(self, path, if_none_match=None):
+        """
+        Builds the response to a request path, answering a matching conditional request
+        with 304.
+
+        Args:
+            path (str): The request path including the query string.
+            if_none_match (str, optional): The If-None-Match header of the request.
+
+        Returns:
+            tuple: The status code, content type, body and ETag (None for errors).
+        """
+        status, content_type, body = self._resource(path)
+        if status != 200:
+            return status, content_type, body, None
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if if_none_match == etag:
+            with self._lock:
+                self.not_modified += 1
+            return 304, content_type, b'', etag
+        return status, content_type, body, etag
+
+    def _resource(self, path):
+        """
+        Builds the full response to a request path.
+
+        Args:
+            path (str): The request path including the query string.
+
+        Returns:
+            tuple: The status code, content type and body.
+        """
+        with self._lock:
+            self.requests.append(path)
+            if self.failures.get(path, 0) > 0:
+                self.failures[path] -= 1
+                return 503, 'text/plain', b'Service Unavailable'
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                self.injected_failures += 1
+                return 503, 'text/plain', b'Service Unavailable'
+
+        if match := re.fullmatch(r'/api/v2/pokemon\?limit=(\d+)', path):
+            limit = min(int(match.group(1)), self.max_pokedex_number)
+            results = [{'name': self.detail(n)['name'], 'url': f"{self.api_base_url}/{n}/"}
+                       for n in range(1, limit + 1)]
+            return self._json({'count': self.max_pokedex_number, 'results': results})
+
+        if match := re.fullmatch(r'/api/v2/pokemon/(\d+)/?', path):
+            number = int(match.group(1))
+            if self._serves(number):
+                return self._json(self.detail(number))
+
+        if match := re.fullmatch(r'/artwork/(\d+)\.png', path):
+            number = int(match.group(1))
+            if self._serves(number):
+                with self._lock:
+                    if number not in self._artwork:
+                        self._artwork[number] = make_artwork(number, self.artwork_size)
+                    return 200, 'image/png', self._artwork[number]
+
+        return 404, 'text/plain', b'Not Found'
+
+    def _serves(self, pokedex_number):
+        """
+        Checks whether a Pokémon is served.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+
+        Returns:
+            bool: True if the Pokémon exists in the stub.
+        """
+        return 1 <= pokedex_number <= self.max_pokedex_number and pokedex_number not in self.missing
+
+    @staticmethod
+    def _json(document):
+        """
+        Encodes a JSON response.
+
+        Args:
+            document (dict): The document to send.
+
+        Returns:
+            tuple: The status code, content type and body.
+        """
+        return 200, 'application/json', json.dumps(document).encode('utf-8')
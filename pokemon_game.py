@@ -7,9 +7,10 @@ Pokémon questions, tracking the player's score, and maintaining a scoreboard
 of highscores.
 """
 
-from question import Question
 from score import Score
 from scoreboard import Scoreboard
+from storage_backend import DEFAULT_MODE
+from question_prefetcher import QuestionPrefetcher
 
 class PokemonGame:
     """
@@ -21,7 +22,7 @@ class PokemonGame:
     and submit their highscores.
     """
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, prefetch_depth=3, image_size=None):
         """
         Initializes a new instance of the PokemonGame class.
         Sets up the initial state of the game, including the scoreboard,
@@ -29,6 +30,10 @@ class PokemonGame:
 
         Args:
             db_manager (PokemonDatabaseManager): The database manager instance.
+            prefetch_depth (int): The number of questions built ahead in the background.
+                                  If 0, every question is built when it is needed.
+            image_size (int, optional): The edge length the images are shown at. If None,
+                                        the full-resolution images are used.
         """
         self.db_manager = db_manager
         self.max_pokedex_number = db_manager.max_pokedex_number
@@ -37,22 +42,25 @@ class PokemonGame:
         self.correct = True
         self.scoreboard = Scoreboard(self.db_manager)
         self.mode = (1, self.max_pokedex_number)
+        self.mode_name = DEFAULT_MODE
+        self.prefetcher = QuestionPrefetcher(self.db_manager, prefetch_depth, image_size)
 
     def start_new_game(self):
         """
         Starts a new game by resetting the score and setting the correct flag to True.
-        Also generates the first question for the game.
+        Also discards prefetched questions and generates the first question for the game.
         """
         self.score = Score()
         self.correct = True
+        self.prefetcher.reset(self.mode)
         self.next_question()
 
     def next_question(self):
         """
-        Generates a new question by selecting a random Pokémon from the Pokédex.
-        The question is created using the Question class.
+        Moves on to a new question about a random Pokémon from the Pokédex.
+        A question prefetched in the background is used if one is ready.
         """
-        self.current_question = Question(self.db_manager, self.mode)
+        self.current_question = self.prefetcher.take()
 
     def get_current_question(self):
         """
@@ -99,23 +107,43 @@ class PokemonGame:
         """
         return self.correct
 
-    def get_highscores(self):
+    def get_highscores(self, mode=None):
         """
-        Retrieves the list of highscores from the Scoreboard class.
+        Retrieves the list of highscores of a game mode from the Scoreboard class.
+
+        Args:
+            mode (str, optional): The name of the mode. Defaults to the current mode.
 
         Returns:
             list: A list of highscores.
         """
-        return self.scoreboard.get_highscores()
+        return self.scoreboard.get_highscores(mode or self.mode_name)
 
-    def submit_highscore(self, name):
+    def submit_highscore(self, name, score=None, mode_name=None):
         """
-        Submits the player's highscore to the scoreboard.
+        Submits the player's highscore to the scoreboard of a mode.
 
         Args:
             name (str): The name of the player to associate with the highscore.
+            score (int, optional): The score. Defaults to the current score.
+            mode_name (str, optional): The name of the mode. Defaults to the current mode.
+        """
+        self.scoreboard.submit_highscore(
+            name, self.score.get() if score is None else score, mode_name or self.mode_name)
+
+    def get_rank(self, score=None, mode_name=None):
+        """
+        Computes the rank a score would have on the scoreboard of a mode.
+
+        Args:
+            score (int, optional): The score. Defaults to the current score.
+            mode_name (str, optional): The name of the mode. Defaults to the current mode.
+
+        Returns:
+            tuple: The rank, 1 being the best, and the number of saved highscores.
         """
-        self.scoreboard.submit_highscore(name, self.score.get())
+        return self.scoreboard.get_rank(self.score.get() if score is None else score,
+                                        mode_name or self.mode_name)
 
     def change_mode(self, new_mode):
         """
@@ -139,5 +167,14 @@ class PokemonGame:
 
         if new_mode in mode_mapping:
             self.mode = mode_mapping[new_mode]
+            self.mode_name = new_mode
+            self.prefetcher.reset(self.mode)
         else:
             raise ValueError(f"Invalid mode: {new_mode}")
+
+    def shutdown(self):
+        """
+        Stops the background question prefetcher and the highscore writer.
+        """
+        self.prefetcher.stop()
+        self.scoreboard.close()
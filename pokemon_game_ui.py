@@ -2,11 +2,18 @@
 pokemon_game_ui Module
 
 This module provides a graphical user interface (GUI) for the "Who's that Pokemon?" game.
-It uses the tkinter library for UI components and integrates with the game logic.
+It uses the tkinter library for UI components and integrates with the game logic. Database
+and image work runs in the background through a `UiExecutor`, so the window keeps repainting
+while the backend is slow. Rendered images are kept in a `RenderCache` and the widgets of
+the end screen and the scoreboard are created once and recycled, so a kiosk that runs for
+days does not accumulate Tk images or widgets.
 """
 
 import tkinter as tk
 from PIL import ImageTk, Image
+from render_cache import RenderCache
+from ui_executor import UiExecutor
+from widget_pool import WidgetPool
 
 class PokemonGameUI:
     """
@@ -15,8 +22,11 @@ class PokemonGameUI:
     Attributes:
         root (tk.Tk): The root window of the tkinter application.
         game (object): The game logic object to interact with.
+        image_size (int): The edge length the Pokémon images are shown at.
     """
 
+    image_size = 300
+
     def __init__(self, root, game):
         """
         Initialize the PokemonGameUI class.
@@ -28,7 +38,10 @@ class PokemonGameUI:
         self.root = root
         self.game = game
         self.root.title("Who's that Pokemon?")
-        self.root.state('zoomed')
+        try:
+            self.root.state('zoomed')
+        except tk.TclError:
+            self.root.attributes('-zoomed', True)
 
         self.logo_label = None
         self.img_label = None
@@ -42,11 +55,16 @@ class PokemonGameUI:
         self.submit_button = None
         self.menu_button = None
         self.score_label = None
+        self.rank_label = None
         self.name_label = None
         self.name_entry = None
         self.mode_buton = None
         self.modes = None
         self.current_mode_index = 0
+        self.loading_label = None
+        self.executor = UiExecutor(root)
+        self.render_cache = RenderCache()
+        self.widget_pool = WidgetPool()
 
     def prepare_ui(self):
         """
@@ -86,6 +104,7 @@ class PokemonGameUI:
         self.next_button = tk.Button(
             self.root, text="Continue", command=self.next_question, width=15, height=2
         )
+        self.loading_label = tk.Label(self.root, text="Loading...", font=("Arial", 14))
 
         self.show_main_menu()
 
@@ -108,21 +127,106 @@ class PokemonGameUI:
         """
         self.scoreboard_data.config(text=f"Score: {self.game.get_score()}")
 
-    def load_image(self, img):
+    def _show_loading(self, loading):
+        """
+        Show or hide the loading indicator while background work takes longer than a frame.
+
+        Args:
+            loading (bool): True to show the indicator, False to hide it.
+        """
+        if loading:
+            self.loading_label.grid(row=6, column=1, pady=10)
+        else:
+            self.loading_label.grid_forget()
+
+    def show_error(self, error):
+        """
+        Show a failed background operation for a few seconds.
+
+        Args:
+            error (Exception): The error raised by the operation.
+        """
+        self._show_message(f"Something went wrong: {error}", row=7)
+
+    def _show_message(self, text, row):
+        """
+        Show a message in red for three seconds, on a label recycled from the widget pool.
+
+        Args:
+            text (str): The message.
+            row (int): The grid row of the message.
+        """
+        message_label = self.widget_pool.acquire(
+            'message', lambda: tk.Label(self.root, font=("Arial", 12), fg="red"))
+        message_label.config(text=text)
+        message_label.grid(row=row, column=1, pady=10)
+        self.root.after(3000, lambda: self.widget_pool.release('message', message_label))
+
+    def _run_in_background(self, work, on_done=None, channel='view'):
+        """
+        Run database and image work off the Tk thread and hand its result to a callback.
+
+        Args:
+            work (callable): The work, run in a background thread.
+            on_done (callable, optional): Called on the Tk thread with the result, unless the
+                                          player has moved on in the meantime.
+            channel (str): The executor channel. A new job makes older jobs of its channel
+                           stale.
+        """
+        self.executor.run(work, on_done=on_done, on_error=self.show_error,
+                          on_loading=self._show_loading, channel=channel)
+
+    def _fit_image(self, img):
+        """
+        Scale an image down to `image_size`, such as a full-resolution image of a row without
+        stored variants. This touches no widgets and may run in a background thread.
+
+        Args:
+            img (PIL.Image): The image.
+
+        Returns:
+            PIL.Image: The image, scaled down if it is larger than `image_size`.
+        """
+        if max(img.size) > self.image_size:
+            img = img.copy()
+            img.thumbnail((self.image_size, self.image_size), Image.Resampling.LANCZOS)
+        return img
+
+    def _render_key(self, question, variant):
         """
-        Load and display an image in the UI.
+        Build the render cache key of an image of a question.
 
         Args:
-            img (PIL.Image): The image to display.
+            question (Question): The question.
+            variant (str): 'original' or 'black'.
+
+        Returns:
+            tuple: The Pokédex number, variant and display size.
         """
-        img = ImageTk.PhotoImage(img)
-        self.img_label.config(image=img)
-        self.img_label.image = img
+        return question.pokedex_number, variant, self.image_size
+
+    def load_image(self, img, key=None):
+        """
+        Load and display an image in the UI. Images larger than `image_size` are scaled down.
+        Images with a key are rendered once and then reused from the render cache.
+
+        Args:
+            img (PIL.Image): The image to display. May be None if the key is cached.
+            key (tuple, optional): The render cache key of the image.
+        """
+        photo = self.render_cache.get(key) if key else None
+        if photo is None:
+            photo = ImageTk.PhotoImage(self._fit_image(img))
+            if key:
+                self.render_cache.put(key, photo)
+        self.img_label.config(image=photo)
+        self.img_label.image = photo
         self.img_label.grid(row=0, column=1, pady=10)
 
     def check_answer(self, choice, button):
         """
-        Check the player's answer and display the result.
+        Check the player's answer and display the result. The original image is loaded in
+        the background.
 
         Args:
             choice (str): The player's selected answer.
@@ -145,12 +249,18 @@ class PokemonGameUI:
             if btn.cget("text") == question.get_correct_answer():
                 btn.config(bg="green", fg="black")
 
-        self.load_image(question.get_original_image())
         self.next_button.grid(row=5, column=1, pady=20)
+        key = self._render_key(question, 'original')
+        if key in self.render_cache:
+            self.executor.invalidate()
+            self.load_image(None, key)
+        else:
+            self._run_in_background(lambda: self._fit_image(question.get_original_image()),
+                                   lambda img: self.load_image(img, key))
 
     def next_question(self):
         """
-        Proceed to the next question.
+        Proceed to the next question, which is built in the background.
         """
         self.next_button.grid_forget()
 
@@ -161,25 +271,56 @@ class PokemonGameUI:
         if not self.game.get_correct():
             self.end_game()
         else:
-            self.game.next_question()
-            self.ask_question()
+            self._run_in_background(self._prepare_next_question, self.ask_question)
 
     def go_to_main_menu(self):
         """
-        Return to the main menu and reset the game state.
+        Return to the main menu and reset the game state. Results of background work for the
+        previous view are discarded.
         """
+        self.executor.invalidate()
         for widget in self.root.winfo_children():
             widget.grid_forget()
 
         self.show_main_menu()
         self.game.reset_correct()
 
-    def ask_question(self):
+    def _prepare_question(self):
         """
-        Display the current question and answer choices.
+        Load the silhouette of the current question unless it is rendered already. Runs in a
+        background thread.
+
+        Returns:
+            tuple: The question and its scaled silhouette, or None if it is rendered.
         """
         question = self.game.get_current_question()
-        self.load_image(question.get_black_image())
+        if self._render_key(question, 'black') in self.render_cache:
+            return question, None
+        return question, self._fit_image(question.get_black_image())
+
+    def _prepare_next_question(self):
+        """
+        Move the game on to the next question and load its silhouette. Runs in a background
+        thread.
+
+        Returns:
+            tuple: The question and its scaled silhouette, or None if it is rendered.
+        """
+        self.game.next_question()
+        return self._prepare_question()
+
+    def ask_question(self, prepared):
+        """
+        Display a question and its answer choices.
+
+        Args:
+            prepared (tuple): The question and its scaled silhouette, from `_prepare_question`.
+        """
+        question, black_image = prepared
+        key = self._render_key(question, 'black')
+        if black_image is None and key not in self.render_cache:
+            black_image = question.get_black_image()
+        self.load_image(black_image, key)
 
         for i, choice in enumerate(question.get_choices()):
             self.answer_buttons[i].config(
@@ -188,12 +329,13 @@ class PokemonGameUI:
             )
             self.answer_buttons[i].grid(row=i + 1, column=1, pady=5)
 
+        question.warm_original_image(self.executor)
+
     def start_game(self):
         """
-        Start a new game and display the first question.
+        Start a new game and display the first question and the reset score once the game
+        is started in the background.
         """
-        self.game.start_new_game()
-
         self.start_button.grid_forget()
         self.scoreboard_button.grid_forget()
         self.mode_buton.grid_forget()
@@ -202,77 +344,128 @@ class PokemonGameUI:
         self.logo_label.grid(row=0, column=0, pady=20, padx=20)
         self.scoreboard_data.grid(row=0, column=2, pady=20, padx=20)
 
-        self.ask_question()
+        def start():
+            self.game.start_new_game()
+            return self._prepare_question()
+
+        def show(prepared):
+            self.update_scoreboard()
+            self.ask_question(prepared)
+
+        self._run_in_background(start, show)
 
-    def scoreboard(self):
+    def scoreboard(self, mode=None):
         """
-        Display the scoreboard with high scores.
+        Display the scoreboard with the high scores of a game mode, with a button that
+        switches to the next mode. The high scores are loaded in the background. The widgets
+        of the scoreboard are recycled from the widget pool.
+
+        Args:
+            mode (str, optional): The name of the mode. Defaults to the selected mode.
         """
         for widget in self.root.winfo_children():
             widget.grid_forget()
+        self.widget_pool.release('row')
 
         self.logo_label.grid(row=0, column=1, pady=20)
 
-        highscores = self.game.get_highscores()
+        modes = self._available_modes()
+        mode = mode or self.game.mode_name
+        next_mode = modes[(modes.index(mode) + 1) % len(modes)] if mode in modes else modes[0]
+        self.widget_pool.release('scoreboard_mode')
+        mode_button = self.widget_pool.acquire(
+            'scoreboard_mode', lambda: tk.Button(self.root, font=("Arial", 14)))
+        mode_button.config(text=mode, command=lambda: self.scoreboard(next_mode))
+        mode_button.grid(row=1, column=1, pady=10)
+
+        if self.menu_button is None:
+            self.menu_button = tk.Button(
+                self.root, text="Back", command=self.go_to_main_menu, font=("Arial", 14)
+            )
+        self.menu_button.grid(row=2, column=1, pady=20)
+        self._run_in_background(lambda: self.game.get_highscores(mode), self._show_highscores)
+
+    def _show_highscores(self, highscores):
+        """
+        Display loaded high scores on the scoreboard.
+
+        Args:
+            highscores (list): Dictionaries with the 'name' and 'score', best first.
+        """
         for i, entry in enumerate(highscores):
             name, score = entry['name'], entry['score']
-            tk.Label(
-                self.root, text=f"{i + 1}. {name}: {score}", font=("Arial", 14)
-            ).grid(row=i + 1, column=1, pady=5)
-
-        self.menu_button = tk.Button(
-            self.root, text="Back", command=self.go_to_main_menu, font=("Arial", 14)
-        )
-        self.menu_button.grid(row=len(highscores) + 2, column=1, pady=20)
+            row_label = self.widget_pool.acquire(
+                'row', lambda: tk.Label(self.root, font=("Arial", 14)))
+            row_label.config(text=f"{i + 1}. {name}: {score}")
+            row_label.grid(row=i + 2, column=1, pady=5)
+        self.menu_button.grid(row=len(highscores) + 3, column=1, pady=20)
 
     def end_game(self):
         """
         End the game and display the player's score with an option to submit their name.
+        The rank of the score is computed in the background. The widgets are created on the
+        first call and reused afterwards.
         """
         for widget in self.root.winfo_children():
             widget.grid_forget()
 
         self.logo_label.grid(row=0, column=1, pady=20)
 
-        self.score_label = tk.Label(
-            self.root, text=f"Your Score: {self.game.get_score()}", font=("Arial", 24, "bold")
-        )
+        if self.score_label is None:
+            self.score_label = tk.Label(self.root, font=("Arial", 24, "bold"))
+            self.rank_label = tk.Label(self.root, font=("Arial", 14))
+            self.name_label = tk.Label(self.root, text="Enter your name:", font=("Arial", 14))
+            self.name_entry = tk.Entry(self.root, font=("Arial", 14))
+            self.submit_button = tk.Button(
+                self.root, text="Submit", command=self.submit_name_and_go_to_menu,
+                font=("Arial", 14)
+            )
+
+        self.score_label.config(text=f"Your Score: {self.game.get_score()}")
         self.score_label.grid(row=1, column=1, pady=10)
 
-        self.name_label = tk.Label(self.root, text="Enter your name:", font=("Arial", 14))
-        self.name_label.grid(row=2, column=1, pady=20)
-        self.name_entry = tk.Entry(self.root, font=("Arial", 14))
-        self.name_entry.grid(row=3, column=1, pady=20)
+        self.rank_label.config(text="")
+        self.rank_label.grid(row=2, column=1, pady=5)
+        score, mode_name = self.game.get_score(), self.game.mode_name
+        self._run_in_background(
+            lambda: self.game.get_rank(score, mode_name),
+            lambda ranking: self.rank_label.config(
+                text=f"Rank #{ranking[0]} of {ranking[1] + 1} in {mode_name}"))
 
-        self.submit_button = tk.Button(
-            self.root, text="Submit", command=self.submit_name_and_go_to_menu, font=("Arial", 14)
-        )
-        self.submit_button.grid(row=4, column=1, pady=20)
+        self.name_label.grid(row=3, column=1, pady=20)
+        self.name_entry.delete(0, tk.END)
+        self.name_entry.grid(row=4, column=1, pady=20)
+        self.submit_button.grid(row=5, column=1, pady=20)
 
         self.root.bind('<Return>', lambda event: self.submit_name_and_go_to_menu())
         self.game.reset_correct()
 
     def submit_name_and_go_to_menu(self):
         """
-        Submit the player's name and return to the main menu.
+        Submit the player's name in the background and return to the main menu. The score
+        and the mode are read here, on the Tk thread, so that a new game started before the
+        job runs does not change them.
         """
         player_name = self.name_entry.get().strip()[:20]
 
         if len(player_name) < 1:
-            error_label = tk.Label(
-                self.root, text="Please enter a valid name!", font=("Arial", 12), fg="red"
-            )
-            error_label.grid(row=5, column=1, pady=10)
-            self.root.after(3000, error_label.destroy)
+            self._show_message("Please enter a valid name!", row=6)
             return
 
-        self.game.submit_highscore(player_name)
+        self.root.unbind('<Return>')
+        score, mode_name = self.game.get_score(), self.game.mode_name
+        self._run_in_background(
+            lambda: self.game.submit_highscore(player_name, score, mode_name),
+            channel='highscores')
         self.update_scoreboard()
         self.go_to_main_menu()
 
-    def change_mode(self):
+    def _available_modes(self):
         """
-        Change the game mode and update the UI based on the highest Pokédex number in the database.
+        List the game modes with Pokémon in the database.
+
+        Returns:
+            list: The names of the modes, starting with "All Pokemon".
         """
         highest_pokedex_number = self.game.max_pokedex_number
         generation_ranges = {
@@ -291,7 +484,13 @@ class PokemonGameUI:
         for gen, pokedex_range in generation_ranges.items():
             if highest_pokedex_number >= min(pokedex_range):
                 self.modes.append(gen)
+        return self.modes
 
+    def change_mode(self):
+        """
+        Change the game mode and update the UI based on the highest Pokédex number in the database.
+        """
+        self._available_modes()
         self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
         new_mode = self.modes[self.current_mode_index]
 
@@ -302,4 +501,6 @@ class PokemonGameUI:
         """
         Exit the game and close the application.
         """
+        self.executor.shutdown()
+        self.game.shutdown()
         self.root.destroy()
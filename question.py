@@ -4,6 +4,9 @@ It retrieves Pokémon data such as names and images and generates multiple-choic
 """
 
 import random
+import threading
+from memory_profiler import MEMORY
+from metrics import METRICS
 
 class Question:
     """
@@ -12,43 +15,60 @@ class Question:
     Attributes:
         pokedex_number (int): The Pokédex number of the Pokémon.
         correct_answer (str): The correct name of the Pokémon.
-        original_image (PIL.Image): The original Pokémon image.
+        original_image (PIL.Image): The original Pokémon image, loaded on first access.
         black_image (PIL.Image): The blacked-out Pokémon image.
         choices (list): A list of answer choices, including the correct answer.
         mode (tuple): A tuple defining the range of Pokédex numbers to use (min, max).
+        image_size (int): The edge length the images are shown at, or None for full resolution.
     """
 
-    def __init__(self, db_manager, mode=None):
+    @MEMORY.profiled('question')
+    @METRICS.timed('question_build_seconds')
+    def __init__(self, db_manager, mode=None, image_size=None):
         """
         Initializes a Question instance.
 
+        The Pokémon and the wrong answers are drawn from the name index of the database
+        manager without any database traffic. Only the black image is loaded up front; the
+        original image is loaded when it is first needed.
+
         Args:
             db_manager (PokemonDatabaseManager): The database manager instance.
             mode (tuple, optional): A tuple defining the range of Pokédex numbers (min, max).
                                     If None, the full range is used.
+            image_size (int, optional): The edge length the images are shown at. The nearest
+                                        stored variant is loaded.
+
+        Raises:
+            ValueError: If no Pokémon of the mode range is in the database.
         """
         self.db_manager = db_manager
         self.mode = mode or (1, self.db_manager.max_pokedex_number)
-        self.pokedex_number = random.randint(self.mode[0], self.mode[1])
-        self.correct_answer = self.db_manager.get_pokemon_name(self.pokedex_number)
-        self.original_image = self.db_manager.get_pokemon_image(self.pokedex_number)
-        self.black_image = self.db_manager.get_black_image(self.pokedex_number)
-        self.choices = self.generate_choices()
+        self.image_size = image_size
+        drawn = self.db_manager.get_name_index().sample(self.mode[0], self.mode[1], 4)
+        if not drawn:
+            raise ValueError(f"No Pokémon in the database for the range {self.mode}")
 
-    def generate_choices(self):
+        self.pokedex_number, self.correct_answer = drawn[0]
+        bundle = self.db_manager.get_question_bundle(self.pokedex_number, image_size)
+        self.black_image = bundle['black_image'] if bundle else None
+        self._original_image = None
+        self._original_loaded = False
+        self._original_warming = False
+        self._original_lock = threading.Lock()
+        self.choices = self.generate_choices([name for _, name in drawn[1:]])
+
+    def generate_choices(self, distractors):
         """
         Generates a list of answer choices, including the correct answer.
 
+        Args:
+            distractors (list): The names of the wrong answers.
+
         Returns:
-            list: A shuffled list of four Pokémon names, one of which is the correct answer.
-        """
-        choices = [self.correct_answer]
-        while len(choices) < 4:
-            choice = self.db_manager.get_pokemon_name(
-                random.randint(self.mode[0], self.mode[1])
-            )
-            if choice and choice not in choices:
-                choices.append(choice)
+            list: A shuffled list of up to four Pokémon names, one of which is the correct answer.
+        """
+        choices = [self.correct_answer] + list(distractors[:3])
         random.shuffle(choices)
         return choices
 
@@ -81,9 +101,38 @@ class Question:
 
     def get_original_image(self):
         """
-        Retrieves the original image of the Pokémon.
+        Retrieves the original image of the Pokémon, loading it on first access.
 
         Returns:
             PIL.Image: The original Pokémon image.
         """
-        return self.original_image
+        with self._original_lock:
+            if not self._original_loaded:
+                with METRICS.span('question_original_seconds'):
+                    with MEMORY.phase('question.original'):
+                        self._original_image = self.db_manager.get_pokemon_image(
+                            self.pokedex_number, self.image_size)
+                self._original_loaded = True
+            return self._original_image
+
+    @property
+    def original_image(self):
+        """
+        The original Pokémon image, loaded on first access.
+        """
+        return self.get_original_image()
+
+    def warm_original_image(self, executor):
+        """
+        Starts loading the original image in the background, so that it is ready when the
+        answer is revealed. The image is loaded at most once, however often it is warmed.
+
+        Args:
+            executor (concurrent.futures.Executor): The executor running the load, shared with
+                                                    the other background work.
+        """
+        with self._original_lock:
+            if self._original_loaded or self._original_warming:
+                return
+            self._original_warming = True
+        executor.submit(self.get_original_image)
@@ -0,0 +1,137 @@
+"""
+question_prefetcher Module
+
+This module provides the `QuestionPrefetcher` class, which builds questions in a background
+thread so that the next question is ready when the player asks for it.
+"""
+
+import threading
+from collections import deque
+from question import Question
+
+class QuestionPrefetcher:
+    """
+    Keeps a small look-ahead queue of fully built questions for the current mode.
+
+    Every call to `reset` starts a new generation: questions built for an older mode or game
+    are discarded, even if they are finished after the reset.
+
+    Attributes:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        depth (int): The number of questions to keep ready. If 0, nothing is prefetched.
+        image_size (int): The edge length the images of the questions are shown at.
+    """
+
+    def __init__(self, db_manager, depth=3, image_size=None):
+        """
+        Initializes the QuestionPrefetcher. The worker thread starts on the first `reset`.
+
+        Args:
+            db_manager (PokemonDatabaseManager): The database manager instance.
+            depth (int): The number of questions to keep ready.
+            image_size (int, optional): The edge length the images are shown at, or None for
+                                        full resolution.
+        """
+        self.db_manager = db_manager
+        self.depth = depth
+        self.image_size = image_size
+        self._ready = deque()
+        self._condition = threading.Condition()
+        self._mode = None
+        self._generation = 0
+        self._failed_generation = None
+        self._stopped = False
+        self._thread = None
+
+    def reset(self, mode):
+        """
+        Discards all prefetched questions and starts filling the queue for a mode.
+
+        Args:
+            mode (tuple): The range of Pokédex numbers (min, max) of the new questions.
+        """
+        with self._condition:
+            self._mode = mode
+            self._generation += 1
+            self._ready.clear()
+            self._condition.notify_all()
+            if self.depth > 0 and self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def take(self):
+        """
+        Returns the next question. A prefetched question is used if one is ready, otherwise
+        the question is built in the calling thread.
+
+        Returns:
+            Question: The next question for the current mode.
+        """
+        with self._condition:
+            mode = self._mode
+            if self._ready:
+                question = self._ready.popleft()
+                self._condition.notify_all()
+                return question
+        return Question(self.db_manager, mode, self.image_size)
+
+    def ready_count(self):
+        """
+        Returns the number of questions that are ready.
+
+        Returns:
+            int: The number of prefetched questions.
+        """
+        with self._condition:
+            return len(self._ready)
+
+    def stop(self):
+        """
+        Stops the worker thread.
+        """
+        with self._condition:
+            self._stopped = True
+            self._ready.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _needs_question(self):
+        """
+        Checks whether the worker should build another question. Must hold the condition.
+
+        Returns:
+            bool: True if the queue of the current generation has room.
+        """
+        return (self._mode is not None and len(self._ready) < self.depth
+                and self._failed_generation != self._generation)
+
+    def _run(self):
+        """
+        Builds questions until the queue is full, then waits for room or a reset.
+        """
+        while True:
+            with self._condition:
+                while not self._stopped and not self._needs_question():
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                generation = self._generation
+                mode = self._mode
+
+            try:
+                question = Question(self.db_manager, mode, self.image_size)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # Stop prefetching for this generation; `take` builds the question in the
+                # caller's thread, where the error is raised and can be handled.
+                print(f"Error while prefetching a question: {error}")
+                with self._condition:
+                    if generation == self._generation:
+                        self._failed_generation = generation
+                continue
+
+            with self._condition:
+                if generation == self._generation:
+                    self._ready.append(question)
+                    self._condition.notify_all()
@@ -0,0 +1,112 @@
+"""
+Unit tests for the QuestionPrefetcher class.
+
+This module contains test cases that run the prefetcher against an in-memory stand-in for
+the database manager and check that the look-ahead queue is filled and invalidated.
+"""
+
+import time
+import unittest
+from name_index import PokemonNameIndex
+from question_prefetcher import QuestionPrefetcher
+
+class FakeManager:
+    """
+    A database manager that serves names from a name index and no images.
+    """
+
+    max_pokedex_number = 300
+
+    def __init__(self):
+        """
+        Initializes the FakeManager with Pokémon 1 to 300.
+        """
+        self.name_index = PokemonNameIndex((n, f"pokemon{n}") for n in range(1, 301))
+
+    def get_name_index(self):
+        """
+        Returns the name index.
+
+        Returns:
+            PokemonNameIndex: The name index.
+        """
+        return self.name_index
+
+    def get_question_bundle(self, pokedex_number, _size=None):
+        """
+        Returns a bundle without images.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+
+        Returns:
+            dict: The bundle.
+        """
+        return {'name': self.name_index.get_name(pokedex_number), 'black_image': None}
+
+def wait_for(condition, timeout=5.0):
+    """
+    Waits until a condition is true.
+
+    Args:
+        condition (callable): The condition to check.
+        timeout (float): The maximum time to wait in seconds.
+
+    Returns:
+        bool: True if the condition became true in time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+class TestQuestionPrefetcher(unittest.TestCase):
+    """
+    Test suite for the QuestionPrefetcher class.
+    """
+
+    def setUp(self):
+        """
+        Set up a prefetcher with a depth of three questions.
+        """
+        self.prefetcher = QuestionPrefetcher(FakeManager(), depth=3)
+
+    def tearDown(self):
+        """
+        Stop the worker thread after each test.
+        """
+        self.prefetcher.stop()
+
+    def test_fills_and_refills_queue(self):
+        """
+        Test that the queue is filled up to its depth and refilled after a question is taken.
+        """
+        self.prefetcher.reset((1, 151))
+        self.assertTrue(wait_for(lambda: self.prefetcher.ready_count() == 3))
+        question = self.prefetcher.take()
+        self.assertTrue(1 <= question.pokedex_number <= 151)
+        self.assertTrue(wait_for(lambda: self.prefetcher.ready_count() == 3))
+
+    def test_reset_discards_questions_of_old_mode(self):
+        """
+        Test that questions prefetched for a previous mode are never returned.
+        """
+        self.prefetcher.reset((1, 151))
+        self.assertTrue(wait_for(lambda: self.prefetcher.ready_count() == 3))
+        self.prefetcher.reset((152, 251))
+        for _ in range(10):
+            self.assertTrue(152 <= self.prefetcher.take().pokedex_number <= 251)
+
+    def test_without_prefetching(self):
+        """
+        Test that a depth of 0 builds every question on demand.
+        """
+        prefetcher = QuestionPrefetcher(FakeManager(), depth=0)
+        prefetcher.reset((252, 300))
+        self.assertTrue(252 <= prefetcher.take().pokedex_number <= 300)
+        self.assertEqual(prefetcher.ready_count(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
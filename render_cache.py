@@ -0,0 +1,81 @@
+"""
+render_cache Module
+
+This module provides the `RenderCache` class, a least-recently-used cache of Tk-ready images
+keyed by Pokédex number, variant and display size. Showing a silhouette or artwork that was
+shown before reuses its `PhotoImage` instead of converting the PIL image again, and the
+number of Tk images alive stays bounded however long the game runs. The images themselves
+may only be created and used on the Tk thread, but lookups of the keys are thread-safe, so a
+background thread can skip loading an image that is already rendered.
+"""
+
+import threading
+from collections import OrderedDict
+
+class RenderCache:
+    """
+    An LRU cache of rendered images with a fixed number of entries.
+
+    Attributes:
+        max_entries (int): The maximum number of cached images.
+        hits (int): The number of lookups that found an image.
+        misses (int): The number of lookups that did not find an image.
+    """
+
+    def __init__(self, max_entries=32):
+        """
+        Initializes the RenderCache.
+
+        Args:
+            max_entries (int): The maximum number of cached images.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Looks up a rendered image and marks it as recently used.
+
+        Args:
+            key (tuple): The Pokédex number, variant and size of the image.
+
+        Returns:
+            object: The rendered image, or None if it is not cached.
+        """
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image):
+        """
+        Stores a rendered image and evicts the least recently used images over the limit.
+
+        Args:
+            key (tuple): The Pokédex number, variant and size of the image.
+            image (object): The rendered image.
+
+        Returns:
+            object: The stored image.
+        """
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return image
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
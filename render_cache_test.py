@@ -0,0 +1,57 @@
+"""
+Unit tests for the RenderCache class.
+
+This module contains test cases for the lookups, the least-recently-used eviction and the
+hit and miss counters of the render cache.
+"""
+
+import unittest
+from render_cache import RenderCache
+
+class TestRenderCache(unittest.TestCase):
+    """
+    Test cases for the RenderCache class.
+    """
+
+    def setUp(self):
+        """
+        Creates a cache with room for three images.
+        """
+        self.cache = RenderCache(max_entries=3)
+
+    def test_get_returns_stored_image(self):
+        """
+        Tests that a stored image is found under its key and counted as a hit.
+        """
+        image = object()
+        self.assertIs(self.cache.put((1, 'black', 300), image), image)
+        self.assertIs(self.cache.get((1, 'black', 300)), image)
+        self.assertIsNone(self.cache.get((1, 'original', 300)))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_least_recently_used_image_is_evicted(self):
+        """
+        Tests that the cache keeps its size and evicts the image used longest ago.
+        """
+        for number in range(1, 4):
+            self.cache.put((number, 'black', 300), object())
+        self.cache.get((1, 'black', 300))
+        self.cache.put((4, 'black', 300), object())
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIn((1, 'black', 300), self.cache)
+        self.assertNotIn((2, 'black', 300), self.cache)
+        self.assertIn((4, 'black', 300), self.cache)
+
+    def test_put_replaces_image(self):
+        """
+        Tests that storing a key again replaces its image without growing the cache.
+        """
+        self.cache.put((1, 'black', 300), object())
+        image = object()
+        self.cache.put((1, 'black', 300), image)
+        self.assertEqual(len(self.cache), 1)
+        self.assertIs(self.cache.get((1, 'black', 300)), image)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,11 @@ scoreboard Module
 
 This module provides a `Scoreboard` class to interact with a database of highscores.
 It allows retrieving and submitting highscores using the `PokemonDatabaseManager` class.
+Every game mode has its own highscores.
 """
 
+from storage_backend import DEFAULT_MODE
+
 class Scoreboard:
     """
     A class to manage highscores.
@@ -22,21 +25,48 @@ class Scoreboard:
         """
         self.db_manager = db_manager
 
-    def get_highscores(self):
+    def get_highscores(self, mode=DEFAULT_MODE):
         """
-        Retrieves the highscores from the database.
+        Retrieves the highscores of a game mode from the database.
+
+        Args:
+            mode (str): The game mode.
 
         Returns:
             list: A list of highscores retrieved from the database.
         """
-        return self.db_manager.get_highscore()
+        return self.db_manager.get_highscore(mode)
 
-    def submit_highscore(self, name, score):
+    def submit_highscore(self, name, score, mode=DEFAULT_MODE):
         """
-        Submits a new highscore to the database.
+        Submits a new highscore. It is journaled and on the leaderboard at once, and saved to
+        the database in the background.
 
         Args:
             name (str): The name of the player.
             score (int): The score achieved by the player.
+            mode (str): The game mode the score was achieved in.
+        """
+        writer = self.db_manager.get_highscore_writer()
+        self.db_manager.get_leaderboard(mode).add(
+            name, score, lambda: writer.submit(name, score, mode))
+
+    def get_rank(self, score, mode=DEFAULT_MODE):
+        """
+        Computes the rank a score has or would have on the scoreboard of a game mode.
+
+        Args:
+            score (int): The score.
+            mode (str): The game mode.
+
+        Returns:
+            tuple: The rank, 1 being the best, and the number of saved highscores.
+        """
+        leaderboard = self.db_manager.get_leaderboard(mode)
+        return leaderboard.rank(score), leaderboard.total()
+
+    def close(self):
+        """
+        Gives the submitted highscores time to be saved to the database.
         """
-        self.db_manager.set_highscore(name, score)
+        self.db_manager.stop_highscore_writer()
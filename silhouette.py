@@ -0,0 +1,124 @@
+"""
+silhouette Module
+
+This module provides the `SilhouetteEngine` class, which turns Pokémon artwork into the
+black "Who's that Pokémon?" silhouettes. The silhouette is built from the alpha channel
+with whole-image band operations instead of a per-pixel Python loop.
+
+Silhouettes are stored as masks: a 1-bit PNG, or an 8-bit grayscale PNG in antialiased mode.
+The black RGBA image is composited from the mask when it is read.
+"""
+
+import io
+from PIL import Image
+from metrics import METRICS
+
+class SilhouetteEngine:
+    """
+    Builds black silhouettes from the alpha channel of an image.
+
+    Attributes:
+        threshold (int): Pixels with an alpha value above this threshold become black.
+        antialias (bool): If True, the original alpha values are kept so that the edges of
+                          the silhouette stay smooth. If False, every pixel above the threshold
+                          becomes fully opaque black, which matches the legacy output.
+    """
+
+    def __init__(self, threshold=0, antialias=False):
+        """
+        Initializes the SilhouetteEngine.
+
+        Args:
+            threshold (int): The alpha threshold (0-254). The default of 0 blackens every pixel
+                             that is not fully transparent.
+            antialias (bool): Whether to keep the original alpha values at the edges.
+        """
+        if not 0 <= threshold < 255:
+            raise ValueError(f"Invalid alpha threshold: {threshold}")
+        self.threshold = threshold
+        self.antialias = antialias
+        if antialias:
+            self._alpha_table = [a if a > threshold else 0 for a in range(256)]
+        else:
+            self._alpha_table = [255 if a > threshold else 0 for a in range(256)]
+
+    @METRICS.timed('silhouette_seconds', operation='convert')
+    def convert(self, image):
+        """
+        Converts an image to its black silhouette.
+
+        Args:
+            image (PIL.Image.Image): The original image.
+
+        Returns:
+            PIL.Image.Image: The black silhouette as an RGBA image.
+        """
+        image = image.convert('RGBA')
+        alpha = image.getchannel('A').point(self._alpha_table)
+
+        if self.antialias:
+            black = Image.new('L', image.size, 0)
+            return Image.merge('RGBA', (black, black, black, alpha))
+
+        image.paste((0, 0, 0, 255), mask=alpha)
+        return image
+
+    def convert_batch(self, images):
+        """
+        Converts several images to black silhouettes in one call.
+
+        Args:
+            images (iterable): The original images as PIL images.
+
+        Returns:
+            list: The black silhouettes in the same order as the input images.
+        """
+        return [self.convert(image) for image in images]
+
+    def mask(self, image):
+        """
+        Builds the silhouette mask of an image.
+
+        Args:
+            image (PIL.Image.Image): The original image or a legacy RGBA silhouette.
+
+        Returns:
+            PIL.Image.Image: A mode '1' mask, or a mode 'L' mask with the alpha values in
+                             antialiased mode.
+        """
+        alpha = image.convert('RGBA').getchannel('A').point(self._alpha_table)
+        if self.antialias:
+            return alpha
+        return alpha.convert('1', dither=Image.Dither.NONE)
+
+    @METRICS.timed('silhouette_seconds', operation='encode_mask')
+    def encode_mask(self, image):
+        """
+        Builds the silhouette mask of an image and encodes it as PNG.
+
+        Args:
+            image (PIL.Image.Image): The original image or a legacy RGBA silhouette.
+
+        Returns:
+            bytes: The mask as a 1-bit or grayscale PNG.
+        """
+        buffer = io.BytesIO()
+        self.mask(image).save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
+
+    @staticmethod
+    @METRICS.timed('silhouette_seconds', operation='composite')
+    def composite(mask):
+        """
+        Builds the black silhouette from a mask.
+
+        Args:
+            mask (PIL.Image.Image): A mode '1' or mode 'L' mask.
+
+        Returns:
+            PIL.Image.Image: The black silhouette as an RGBA image. Pixels outside the
+                             silhouette are transparent black.
+        """
+        alpha = mask.convert('L')
+        black = Image.new('L', mask.size, 0)
+        return Image.merge('RGBA', (black, black, black, alpha))
@@ -0,0 +1,77 @@
+"""
+Microbenchmark for the silhouette engine.
+
+Compares the `SilhouetteEngine` with the legacy per-pixel loop on a 475x475 image, the size
+of the official artwork served by the PokeAPI. An image file can be passed as the first
+command line argument to benchmark real artwork instead of the generated image.
+
+Usage:
+    python silhouette_benchmark.py [image.png]
+"""
+
+import sys
+import timeit
+from PIL import Image, ImageDraw
+from silhouette import SilhouetteEngine
+from silhouette_reference import legacy_convert_to_black
+
+def make_benchmark_image(size=475):
+    """
+    Creates an RGBA image with an opaque shape on a transparent background.
+
+    Args:
+        size (int): The width and height of the image.
+
+    Returns:
+        PIL.Image.Image: The generated image.
+    """
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((40, 60, size - 40, size - 20), fill=(220, 80, 40, 255))
+    draw.rectangle((size // 3, 10, 2 * size // 3, size // 2), fill=(40, 160, 220, 200))
+    return image
+
+def measure(function, image, repeat):
+    """
+    Measures the best run time of a function over several repetitions.
+
+    Args:
+        function (callable): The function to measure. It is called with the image.
+        image (PIL.Image.Image): The input image.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The best run time in seconds.
+    """
+    return min(timeit.repeat(lambda: function(image), number=1, repeat=repeat))
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    if len(sys.argv) > 1:
+        image = Image.open(sys.argv[1])
+        image.load()
+    else:
+        image = make_benchmark_image()
+
+    engine = SilhouetteEngine()
+    antialias_engine = SilhouetteEngine(antialias=True)
+    batch = [image] * 10
+
+    identical = engine.convert(image).tobytes() == legacy_convert_to_black(image).tobytes()
+    legacy_time = measure(legacy_convert_to_black, image, 3)
+    engine_time = measure(engine.convert, image, 20)
+    antialias_time = measure(antialias_engine.convert, image, 20)
+    batch_time = measure(engine.convert_batch, batch, 5) / len(batch)
+
+    print(f"Image size: {image.size[0]}x{image.size[1]}")
+    print(f"Output identical to legacy loop: {identical}")
+    print(f"Legacy loop:          {legacy_time * 1000:8.2f} ms")
+    print(f"SilhouetteEngine:     {engine_time * 1000:8.2f} ms "
+          f"({legacy_time / engine_time:.0f}x faster)")
+    print(f"Antialiased mode:     {antialias_time * 1000:8.2f} ms")
+    print(f"Batch, per image:     {batch_time * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
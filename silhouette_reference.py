@@ -0,0 +1,27 @@
+"""
+silhouette_reference Module
+
+This module keeps the original per-pixel implementation of `convert_to_black`, which the
+`SilhouetteEngine` replaced. The silhouette tests check the engine against it and the
+silhouette benchmark measures the speed-up over it.
+"""
+
+def legacy_convert_to_black(image):
+    """
+    The original per-pixel implementation of convert_to_black, kept as a reference.
+
+    Args:
+        image (PIL.Image.Image): The original image.
+
+    Returns:
+        PIL.Image.Image: The black version of the image.
+    """
+    image = image.convert('RGBA')
+    pixels = image.load()
+    width, height = image.size
+    for y in range(height):
+        for x in range(width):
+            a = pixels[x, y][3]
+            if a > 0:
+                pixels[x, y] = (0, 0, 0, 255)
+    return image
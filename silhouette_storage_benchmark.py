@@ -0,0 +1,114 @@
+"""
+Benchmark for the storage format of the silhouettes.
+
+Compares the legacy RGBA PNG silhouettes with the 1-bit mask PNGs for generated 475x475
+artwork: the stored size and the time to read a blob and decode it into the black RGBA image
+shown by the game. Reading is measured from an in-memory copy of the blob, so the numbers
+show the decode cost without a database round trip; the smaller blobs also shorten the
+transfer from the database.
+
+Usage:
+    python silhouette_storage_benchmark.py [count]
+"""
+
+import io
+import sys
+import time
+from PIL import Image
+from pokeapi_stub import make_artwork
+from silhouette import SilhouetteEngine
+
+def legacy_blob(engine, artwork):
+    """
+    Encodes a silhouette in the legacy format.
+
+    Args:
+        engine (SilhouetteEngine): The silhouette engine.
+        artwork (PIL.Image.Image): The original artwork.
+
+    Returns:
+        bytes: The silhouette as an RGBA PNG.
+    """
+    buffer = io.BytesIO()
+    engine.convert(artwork).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def read_legacy(_engine, blob):
+    """
+    Reads a legacy silhouette.
+
+    Args:
+        blob (bytes): The RGBA PNG.
+
+    Returns:
+        PIL.Image.Image: The decoded black image.
+    """
+    image = Image.open(io.BytesIO(bytes(blob)))
+    image.load()
+    return image
+
+def read_mask(engine, blob):
+    """
+    Reads a mask silhouette and composites the black image.
+
+    Args:
+        engine (SilhouetteEngine): The silhouette engine.
+        blob (bytes): The mask PNG.
+
+    Returns:
+        PIL.Image.Image: The composited black image.
+    """
+    return engine.composite(Image.open(io.BytesIO(bytes(blob))))
+
+def measure(function, engine, blobs, repeat=5):
+    """
+    Measures the best time to read all blobs.
+
+    Args:
+        function (callable): The read function.
+        engine (SilhouetteEngine): The silhouette engine.
+        blobs (list): The blobs to read.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The best time per blob in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for blob in blobs:
+            function(engine, blob)
+        best = min(best, time.perf_counter() - start)
+    return best / len(blobs)
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    engine = SilhouetteEngine()
+    artworks = [Image.open(io.BytesIO(make_artwork(n))) for n in range(1, count + 1)]
+
+    legacy = [legacy_blob(engine, artwork) for artwork in artworks]
+    masks = [engine.encode_mask(artwork) for artwork in artworks]
+    legacy_bytes = sum(len(blob) for blob in legacy)
+    mask_bytes = sum(len(blob) for blob in masks)
+
+    identical = all(
+        read_mask(engine, mask).getchannel('A').tobytes()
+        == read_legacy(engine, blob).getchannel('A').tobytes()
+        for mask, blob in zip(masks, legacy))
+    legacy_time = measure(read_legacy, engine, legacy)
+    mask_time = measure(read_mask, engine, masks)
+
+    print(f"Silhouettes:           {count} of 475x475")
+    print(f"Alpha identical:       {identical}")
+    print(f"Legacy RGBA PNG:       {legacy_bytes / count / 1024:8.1f} KiB per row")
+    print(f"1-bit mask PNG:        {mask_bytes / count / 1024:8.1f} KiB per row "
+          f"({legacy_bytes / mask_bytes:.1f}x smaller)")
+    print(f"Legacy read + decode:  {legacy_time * 1000:8.2f} ms")
+    print(f"Mask read + composite: {mask_time * 1000:8.2f} ms "
+          f"({legacy_time / mask_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
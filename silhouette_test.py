@@ -0,0 +1,160 @@
+"""
+Unit tests for the SilhouetteEngine class.
+
+This module contains test cases to verify that the silhouette engine produces the same
+output as the legacy per-pixel loop and that the threshold, antialias and batch options
+behave as expected.
+"""
+
+import io
+import unittest
+from PIL import Image, ImageDraw
+from silhouette import SilhouetteEngine
+from silhouette_reference import legacy_convert_to_black
+
+def make_artwork(size=64):
+    """
+    Creates a small RGBA test image with soft edges and colored transparent pixels.
+
+    Args:
+        size (int): The width and height of the image.
+
+    Returns:
+        PIL.Image.Image: The generated image.
+    """
+    image = Image.new('RGBA', (size, size), (30, 60, 90, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((4, 4, size - 4, size - 4), fill=(200, 120, 40, 255))
+    for x in range(size):
+        image.putpixel((x, size // 2), (255, 255, 255, x * 255 // size))
+    return image
+
+def png_bytes(image):
+    """
+    Encodes an image as PNG.
+
+    Args:
+        image (PIL.Image.Image): The image to encode.
+
+    Returns:
+        bytes: The PNG data.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+class TestSilhouetteEngine(unittest.TestCase):
+    """
+    Test suite for the SilhouetteEngine class.
+    """
+
+    def setUp(self):
+        """
+        Set up a default engine and a test image before each test.
+        """
+        self.engine = SilhouetteEngine()
+        self.image = make_artwork()
+
+    def test_matches_legacy_output(self):
+        """
+        Test that the default settings give byte-identical output to the legacy loop.
+        """
+        expected = legacy_convert_to_black(self.image)
+        result = self.engine.convert(self.image)
+        self.assertEqual(result.tobytes(), expected.tobytes())
+        self.assertEqual(png_bytes(result), png_bytes(expected))
+
+    def test_matches_legacy_output_for_rgb_input(self):
+        """
+        Test that images without an alpha channel are handled like the legacy loop.
+        """
+        image = self.image.convert('RGB')
+        expected = legacy_convert_to_black(image)
+        self.assertEqual(self.engine.convert(image).tobytes(), expected.tobytes())
+
+    def test_does_not_modify_input(self):
+        """
+        Test that the original image is left untouched.
+        """
+        before = self.image.tobytes()
+        self.engine.convert(self.image)
+        self.assertEqual(self.image.tobytes(), before)
+
+    def test_threshold(self):
+        """
+        Test that pixels at or below the alpha threshold are left unchanged.
+        """
+        engine = SilhouetteEngine(threshold=128)
+        result = engine.convert(self.image)
+        for x in range(self.image.width):
+            pixel = self.image.getpixel((x, self.image.height // 2))
+            if pixel[3] > 128:
+                self.assertEqual(result.getpixel((x, self.image.height // 2)), (0, 0, 0, 255))
+            else:
+                self.assertEqual(result.getpixel((x, self.image.height // 2)), pixel)
+
+    def test_antialias_keeps_alpha(self):
+        """
+        Test that the antialiased mode keeps the alpha channel and blackens the color.
+        """
+        engine = SilhouetteEngine(antialias=True)
+        result = engine.convert(self.image)
+        self.assertEqual(result.getchannel('A').tobytes(), self.image.getchannel('A').tobytes())
+        self.assertEqual(result.getchannel('R').getextrema(), (0, 0))
+
+    def test_invalid_threshold(self):
+        """
+        Test that an out-of-range threshold is rejected.
+        """
+        with self.assertRaises(ValueError):
+            SilhouetteEngine(threshold=255)
+
+    def test_convert_batch(self):
+        """
+        Test that a batch conversion returns one silhouette per image in order.
+        """
+        images = [make_artwork(16), make_artwork(32)]
+        results = self.engine.convert_batch(images)
+        self.assertEqual([r.size for r in results], [(16, 16), (32, 32)])
+        self.assertEqual(results[1].tobytes(), legacy_convert_to_black(images[1]).tobytes())
+
+    def test_mask_is_one_bit(self):
+        """
+        Test that the default mask is a 1-bit image that is much smaller than the RGBA
+        silhouette.
+        """
+        mask_data = self.engine.encode_mask(self.image)
+        self.assertEqual(Image.open(io.BytesIO(mask_data)).mode, '1')
+        self.assertLess(len(mask_data), len(png_bytes(self.engine.convert(self.image))))
+
+    def test_composite_matches_silhouette(self):
+        """
+        Test that the image composited from a mask has the alpha channel of the silhouette
+        and is black wherever it is visible.
+        """
+        expected = self.engine.convert(self.image)
+        mask = Image.open(io.BytesIO(self.engine.encode_mask(self.image)))
+        result = self.engine.composite(mask)
+        self.assertEqual(result.mode, 'RGBA')
+        self.assertEqual(result.getchannel('A').tobytes(), expected.getchannel('A').tobytes())
+        self.assertEqual(result.getchannel('R').getextrema(), (0, 0))
+
+    def test_antialiased_mask_roundtrip(self):
+        """
+        Test that an antialiased mask keeps the alpha values and is byte-identical after
+        compositing.
+        """
+        engine = SilhouetteEngine(antialias=True)
+        mask = Image.open(io.BytesIO(engine.encode_mask(self.image)))
+        self.assertEqual(mask.mode, 'L')
+        self.assertEqual(engine.composite(mask).tobytes(), engine.convert(self.image).tobytes())
+
+    def test_mask_of_legacy_silhouette(self):
+        """
+        Test that migrating a legacy RGBA silhouette gives the same mask as the artwork.
+        """
+        legacy = legacy_convert_to_black(self.image)
+        self.assertEqual(self.engine.encode_mask(legacy), self.engine.encode_mask(self.image))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+splash_screen Module
+
+This module provides the `SplashScreen` class, shown while the game starts. It only needs
+tkinter, so the window with the logo appears before the database, PIL and HTTP modules are
+imported. Background threads report their progress with `report`; the splash screen picks up
+the latest report on the Tk thread.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+class SplashScreen:
+    """
+    A logo with a status line and a progress bar, centered in the root window.
+
+    Attributes:
+        root (tk.Tk): The root window.
+        frame (tk.Frame): The frame holding the splash widgets.
+        poll_interval (int): The milliseconds between two checks for new reports.
+    """
+
+    def __init__(self, root, logo_path='logo.png', poll_interval=50):
+        """
+        Initializes the SplashScreen and shows it.
+
+        Args:
+            root (tk.Tk): The root window.
+            logo_path (str): The path of the logo image, shown at half size.
+            poll_interval (int): The milliseconds between two checks for new reports.
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self.frame = tk.Frame(root)
+        try:
+            self.logo = tk.PhotoImage(file=logo_path).subsample(2)
+            tk.Label(self.frame, image=self.logo).pack(pady=20)
+        except tk.TclError:
+            self.logo = None
+        self.status_label = tk.Label(self.frame, text="Starting...", font=("Arial", 14))
+        self.status_label.pack(pady=10)
+        self.progress_bar = ttk.Progressbar(self.frame, length=397, maximum=1.0)
+        self.progress_bar.pack(pady=10)
+        self.frame.place(relx=0.5, rely=0.5, anchor="center")
+        self._report = None
+        self._lock = threading.Lock()
+        self._poll_id = root.after(poll_interval, self._poll)
+
+    def report(self, status, fraction=None):
+        """
+        Reports the startup progress. May be called from any thread.
+
+        Args:
+            status (str): The status line.
+            fraction (float, optional): The completed fraction between 0 and 1, or None to
+                                        keep the progress bar.
+        """
+        with self._lock:
+            self._report = (status, fraction)
+
+    def show_error(self, error):
+        """
+        Shows that the startup failed.
+
+        Args:
+            error (Exception): The error that stopped the startup.
+        """
+        self._stop_polling()
+        self.status_label.config(text=f"Startup failed: {error}", fg="red")
+
+    def close(self):
+        """
+        Removes the splash screen.
+        """
+        self._stop_polling()
+        self.frame.destroy()
+
+    def _poll(self):
+        """
+        Shows the latest report and checks again later.
+        """
+        with self._lock:
+            report, self._report = self._report, None
+        if report:
+            status, fraction = report
+            self.status_label.config(text=status)
+            if fraction is not None:
+                self.progress_bar.config(value=fraction)
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _stop_polling(self):
+        """
+        Stops checking for new reports.
+        """
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
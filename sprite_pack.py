@@ -0,0 +1,238 @@
+"""
+sprite_pack Module
+
+This module provides a pack file that stores every sprite and silhouette of the Pokémon
+database in one file, so that images can be served without a database round trip.
+
+The file starts with a header and a fixed-width index with one slot per Pokédex number,
+image size and kind ('original' or 'black'). The image data is appended after the index.
+A slot holds the offset and length of its image, so a lookup is a single read of the index
+followed by a slice of the memory-mapped file. The `SpritePackWriter` only ever appends image
+data; replacing an image appends the new data and repoints its slot. Packs are written with
+`export_sprite_pack.py`.
+"""
+
+import mmap
+import os
+import struct
+
+MAGIC = b'PKMPACK1'
+HEADER = struct.Struct('<8sII')
+SIZE = struct.Struct('<I')
+SLOT = struct.Struct('<QI')
+KINDS = ('original', 'black')
+
+def _layout(max_pokedex_number, sizes):
+    """
+    Computes the length of the header and index of a pack.
+
+    Args:
+        max_pokedex_number (int): The highest Pokédex number with a slot.
+        sizes (tuple): The image sizes with a slot, 0 standing for full resolution.
+
+    Returns:
+        tuple: The offset of the index and the offset of the first image.
+    """
+    index_offset = HEADER.size + SIZE.size * len(sizes)
+    return index_offset, index_offset + SLOT.size * max_pokedex_number * len(sizes) * len(KINDS)
+
+class SpritePack:
+    """
+    A read-only view of a sprite pack file through `mmap`.
+
+    Attributes:
+        path (str): The path of the pack file.
+        max_pokedex_number (int): The highest Pokédex number with a slot.
+        sizes (tuple): The stored image sizes, 0 standing for full resolution.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps a sprite pack file.
+
+        Args:
+            path (str): The path of the pack file.
+
+        Raises:
+            ValueError: If the file is not a sprite pack.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        try:
+            magic, self.max_pokedex_number, size_count = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"Not a sprite pack: {path}")
+            self.sizes = tuple(SIZE.unpack_from(self._map, HEADER.size + SIZE.size * i)[0]
+                               for i in range(size_count))
+        except (struct.error, ValueError):
+            self.close()
+            raise
+        self._index_offset, _ = _layout(self.max_pokedex_number, self.sizes)
+        self._size_slots = {size: i for i, size in enumerate(self.sizes)}
+
+    def get(self, pokedex_number, kind, size=None):
+        """
+        Looks up an image without copying it.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            kind (str): 'original' or 'black'.
+            size (int, optional): The size of the variant, or None for full resolution.
+
+        Returns:
+            memoryview: The encoded image as a slice of the mapped file, or None if it is
+                        not in the pack.
+        """
+        slot = self._slot(pokedex_number, kind, size)
+        if slot is None:
+            return None
+        offset, length = SLOT.unpack_from(self._map, self._index_offset + SLOT.size * slot)
+        if length == 0:
+            return None
+        return self._view[offset:offset + length]
+
+    def close(self):
+        """
+        Unmaps the file. Slices returned by `get` must be released before.
+        """
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def _slot(self, pokedex_number, kind, size):
+        """
+        Computes the index slot of an image.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            kind (str): 'original' or 'black'.
+            size (int): The size of the variant, or None for full resolution.
+
+        Returns:
+            int: The slot number, or None if the pack has no slot for the image.
+        """
+        size_slot = self._size_slots.get(size or 0)
+        if size_slot is None or not 1 <= pokedex_number <= self.max_pokedex_number:
+            return None
+        return ((pokedex_number - 1) * len(self.sizes) + size_slot) * len(KINDS) + KINDS.index(kind)
+
+class SpritePackWriter(SpritePack):
+    """
+    Appends images to a sprite pack file. An existing pack with the same layout is extended,
+    otherwise a new pack is created.
+    """
+
+    def __init__(self, path, max_pokedex_number, sizes=()):
+        """
+        Opens or creates a sprite pack file for appending.
+
+        Args:
+            path (str): The path of the pack file.
+            max_pokedex_number (int): The highest Pokédex number with a slot.
+            sizes (iterable): The variant sizes with a slot, in addition to full resolution.
+        """
+        sizes = (0,) + tuple(sorted(set(sizes) - {0}))
+        if not self._matches(path, max_pokedex_number, sizes):
+            _, data_offset = _layout(max_pokedex_number, sizes)
+            with open(path, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, max_pokedex_number, len(sizes)))
+                file.write(b''.join(SIZE.pack(size) for size in sizes))
+                file.truncate(data_offset)
+        self._file = open(path, 'r+b')  # pylint: disable=consider-using-with
+        super().__init__(path)
+
+    def add(self, pokedex_number, kind, size, data):
+        """
+        Appends an image and points its slot to it.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            kind (str): 'original' or 'black'.
+            size (int): The size of the variant, or None for full resolution.
+            data (bytes): The encoded image.
+
+        Raises:
+            ValueError: If the pack has no slot for the image.
+        """
+        slot = self._slot(pokedex_number, kind, size)
+        if slot is None:
+            raise ValueError(f"No slot for {kind} image of #{pokedex_number} at size {size}")
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self._file.seek(self._index_offset + SLOT.size * slot)
+        self._file.write(SLOT.pack(offset, len(data)))
+
+    def has(self, pokedex_number, kind, size=None):
+        """
+        Checks whether an image is in the pack.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            kind (str): 'original' or 'black'.
+            size (int, optional): The size of the variant, or None for full resolution.
+
+        Returns:
+            bool: True if the slot of the image is filled.
+        """
+        slot = self._slot(pokedex_number, kind, size)
+        if slot is None:
+            return False
+        self._file.seek(self._index_offset + SLOT.size * slot)
+        return SLOT.unpack(self._file.read(SLOT.size))[1] > 0
+
+    def get(self, pokedex_number, kind, size=None):
+        """
+        Reads an image back from the file.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            kind (str): 'original' or 'black'.
+            size (int, optional): The size of the variant, or None for full resolution.
+
+        Returns:
+            bytes: The encoded image, or None if it is not in the pack.
+        """
+        slot = self._slot(pokedex_number, kind, size)
+        if slot is None:
+            return None
+        self._file.seek(self._index_offset + SLOT.size * slot)
+        offset, length = SLOT.unpack(self._file.read(SLOT.size))
+        if length == 0:
+            return None
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def close(self):
+        """
+        Flushes the appended images to disk and closes the file.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        super().close()
+
+    @staticmethod
+    def _matches(path, max_pokedex_number, sizes):
+        """
+        Checks whether an existing file is a pack with the given layout.
+
+        Args:
+            path (str): The path of the pack file.
+            max_pokedex_number (int): The highest Pokédex number with a slot.
+            sizes (tuple): The image sizes with a slot.
+
+        Returns:
+            bool: True if the file can be extended.
+        """
+        try:
+            with SpritePack(path) as pack:
+                return pack.max_pokedex_number == max_pokedex_number and pack.sizes == sizes
+        except (OSError, ValueError):
+            return False
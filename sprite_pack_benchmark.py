@@ -0,0 +1,59 @@
+"""
+Benchmark for image lookups from the sprite pack.
+
+Writes the generated artwork and silhouette masks of all Pokémon to a temporary sprite pack
+and measures the time of a lookup, which returns a memoryview of the mapped file, and of a
+lookup followed by decoding the image.
+
+Usage:
+    python sprite_pack_benchmark.py [count]
+"""
+
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from PIL import Image
+from pokeapi_stub import make_artwork
+from silhouette import SilhouetteEngine
+from sprite_pack import SpritePack, SpritePackWriter
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1025
+    engine = SilhouetteEngine()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'sprites.pack')
+    try:
+        with SpritePackWriter(path, count) as pack:
+            for number in range(1, count + 1):
+                artwork = make_artwork(number, 128)
+                pack.add(number, 'original', None, artwork)
+                pack.add(number, 'black', None,
+                         engine.encode_mask(Image.open(io.BytesIO(artwork))))
+
+        numbers = [random.randint(1, count) for _ in range(100000)]
+        with SpritePack(path) as pack:
+            start = time.perf_counter()
+            for number in numbers:
+                pack.get(number, 'black')
+            lookup = (time.perf_counter() - start) / len(numbers)
+
+            start = time.perf_counter()
+            for number in numbers[:2000]:
+                engine.composite(Image.open(io.BytesIO(pack.get(number, 'black'))))
+            decode = (time.perf_counter() - start) / 2000
+
+        print(f"Pack:                  {count} Pokémon, {os.path.getsize(path) / 1024:.0f} KiB")
+        print(f"Lookup (memoryview):   {lookup * 1e6:8.2f} µs")
+        print(f"Lookup + composite:    {decode * 1e6:8.2f} µs")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
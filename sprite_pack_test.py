@@ -0,0 +1,107 @@
+"""
+Unit tests for the SpritePack and SpritePackWriter classes.
+
+This module contains test cases that write sprite packs to a temporary directory and read
+them back through the memory-mapped reader.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from sprite_pack import SpritePack, SpritePackWriter
+
+class TestSpritePack(unittest.TestCase):
+    """
+    Test suite for the sprite pack file.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory for the pack file.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'sprites.pack')
+
+    def tearDown(self):
+        """
+        Remove the temporary directory.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write(self, images, sizes=(96,)):
+        """
+        Writes images to the pack.
+
+        Args:
+            images (dict): The image data keyed by (pokedex_number, kind, size).
+            sizes (tuple): The variant sizes of the pack.
+        """
+        with SpritePackWriter(self.path, 10, sizes) as pack:
+            for (number, kind, size), data in images.items():
+                pack.add(number, kind, size, data)
+
+    def test_roundtrip_with_memoryview(self):
+        """
+        Test that images are read back as memoryview slices of the mapped file.
+        """
+        self.write({(1, 'original', None): b'full', (1, 'black', None): b'mask',
+                    (10, 'original', 96): b'small'})
+        with SpritePack(self.path) as pack:
+            self.assertEqual(pack.sizes, (0, 96))
+            data = pack.get(1, 'original')
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(bytes(data), b'full')
+            self.assertEqual(bytes(pack.get(1, 'black')), b'mask')
+            self.assertEqual(bytes(pack.get(10, 'original', 96)), b'small')
+            self.assertIsNone(pack.get(10, 'black', 96))
+            self.assertIsNone(pack.get(2, 'original'))
+            data.release()
+
+    def test_missing_slots(self):
+        """
+        Test that unknown Pokédex numbers and sizes have no slot.
+        """
+        self.write({})
+        with SpritePack(self.path) as pack:
+            self.assertIsNone(pack.get(11, 'original'))
+            self.assertIsNone(pack.get(0, 'original'))
+            self.assertIsNone(pack.get(1, 'original', 300))
+        with SpritePackWriter(self.path, 10, (96,)) as pack:
+            with self.assertRaises(ValueError):
+                pack.add(11, 'original', None, b'data')
+
+    def test_reopening_appends(self):
+        """
+        Test that a pack with the same layout is extended and that replaced images are
+        appended instead of overwritten.
+        """
+        self.write({(1, 'original', None): b'first'})
+        size = os.path.getsize(self.path)
+        self.write({(2, 'original', None): b'second', (1, 'original', None): b'newer'})
+        self.assertEqual(os.path.getsize(self.path), size + len(b'second') + len(b'newer'))
+        with SpritePack(self.path) as pack:
+            self.assertEqual(bytes(pack.get(1, 'original')), b'newer')
+            self.assertEqual(bytes(pack.get(2, 'original')), b'second')
+
+    def test_new_layout_recreates_pack(self):
+        """
+        Test that a pack with different variant sizes is replaced.
+        """
+        self.write({(1, 'original', None): b'first'})
+        self.write({}, sizes=(96, 300))
+        with SpritePack(self.path) as pack:
+            self.assertEqual(pack.sizes, (0, 96, 300))
+            self.assertIsNone(pack.get(1, 'original'))
+
+    def test_rejects_other_files(self):
+        """
+        Test that a file that is not a sprite pack is rejected.
+        """
+        with open(self.path, 'wb') as file:
+            file.write(b'not a sprite pack file')
+        with self.assertRaises(ValueError):
+            SpritePack(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+sqlite_backend Module
+
+This module provides the `SQLiteBackend` class, the storage backend for single-host
+deployments. The database is an embedded SQLite file in WAL mode, so readers never block the
+ingest writer, with pragmas tuned for a read-heavy game: relaxed syncing, an in-memory page
+cache and memory-mapped reads. Every thread uses its own connection, which is closed once
+the thread has ended.
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from metrics import METRICS
+from storage_backend import StorageBackend
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'createdatabase_sqlite.sql')
+
+class SQLiteBackend(StorageBackend):
+    """
+    Stores the Pokémon database in an SQLite file.
+
+    Attributes:
+        path (str): The path of the database file.
+        script_path (str): The SQL script creating the tables.
+        pragmas (dict): The pragmas applied to every connection.
+    """
+
+    name = 'sqlite'
+    insert_ignore = 'INSERT OR IGNORE'
+    default_pragmas = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'cache_size': -64 * 1024,
+        'mmap_size': 256 * 1024 * 1024,
+        'busy_timeout': 5000,
+    }
+
+    def __init__(self, path='pokemon.db', script_path=SCRIPT_PATH, pragmas=None):
+        """
+        Initializes the SQLiteBackend. Connections are opened lazily on first use.
+
+        Args:
+            path (str): The path of the database file. It is created if necessary.
+            script_path (str): The SQL script creating the tables.
+            pragmas (dict, optional): Pragmas overriding the defaults.
+        """
+        self.path = path
+        self.script_path = script_path
+        self.pragmas = dict(self.default_pragmas, **(pragmas or {}))
+        self._local = threading.local()
+        self._connections = []  # (weak reference to the thread, connection)
+        self._lock = threading.Lock()
+
+    def create_schema(self):
+        """
+        Executes the SQL script to create the tables.
+        """
+        with open(self.script_path, 'r', encoding='utf-8') as file:
+            script = file.read()
+        conn = self._connection()
+        conn.executescript(script)
+        conn.commit()
+
+    def connect(self):
+        """
+        Opens a new connection with the tuned pragmas.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        for pragma, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    @METRICS.timed('db_query_seconds', backend='sqlite', operation='fetch_all')
+    def fetch_all(self, sql, params=()):
+        cursor = self._connection().execute(self.sql(sql), params)
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        cursor.close()
+        return rows
+
+    @METRICS.timed('db_query_seconds', backend='sqlite', operation='execute')
+    def execute(self, sql, params=()):
+        conn = self._connection()
+        with conn:
+            conn.execute(self.sql(sql), params)
+
+    @METRICS.timed('db_query_seconds', backend='sqlite', operation='execute_many')
+    def execute_many(self, sql, rows):
+        conn = self._connection()
+        with conn:
+            conn.executemany(self.sql(sql), rows)
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for _, conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def sql(self, statement):
+        return statement.replace('%s', '?')
+
+    def _connection(self):
+        """
+        Returns the connection of the calling thread, opening it on first use. Opening a
+        connection closes the connections of threads that have ended, so short-lived threads
+        do not leak connections and file descriptors.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self.connect()
+            self._local.conn = conn
+            ended = []
+            with self._lock:
+                running = [(weakref.ref(threading.current_thread()), conn)]
+                for thread, old in self._connections:
+                    owner = thread()
+                    if owner is not None and owner.is_alive():
+                        running.append((thread, old))
+                    else:
+                        ended.append(old)
+                self._connections = running
+            for old in ended:
+                old.close()
+        return conn
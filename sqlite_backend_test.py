@@ -0,0 +1,96 @@
+"""
+Unit tests for the SQLiteBackend class.
+
+This module contains test cases that check the connection settings, the dialect translation
+and the per-thread connections of the SQLite storage backend.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from sqlite_backend import SQLiteBackend
+
+class TestSQLiteBackend(unittest.TestCase):
+    """
+    Test suite for the SQLiteBackend class.
+    """
+
+    def setUp(self):
+        """
+        Create a backend with an initialized database in a temporary directory.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.backend = SQLiteBackend(os.path.join(self.directory, 'pokemon.db'))
+        self.backend.initialize()
+
+    def tearDown(self):
+        """
+        Close the backend and remove the temporary directory.
+        """
+        self.backend.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_pragmas(self):
+        """
+        Test that connections use WAL mode and the tuned pragmas.
+        """
+        self.assertEqual(self.backend.fetch_one('PRAGMA journal_mode')['journal_mode'], 'wal')
+        self.assertEqual(self.backend.fetch_one('PRAGMA synchronous')['synchronous'], 1)
+
+    def test_insert_ignore_and_placeholders(self):
+        """
+        Test that the shared SQL runs with the SQLite dialect.
+        """
+        conn = self.backend.connect()
+        rows = [(1, 'bulbasaur', b'original', b'mask', [(96, b'small', b'small mask')])]
+        self.backend.save_pokemon_batch(conn.cursor(), rows + rows)
+        conn.commit()
+        conn.close()
+        self.assertEqual(self.backend.load_names(), [(1, 'bulbasaur')])
+        self.assertEqual(self.backend.load_images(('original_image',), 1, 96),
+                         {'original_image': b'small'})
+        self.assertEqual(self.backend.load_images(('black_image',), 1, 300),
+                         {'black_image': b'mask'})
+        self.assertIsNone(self.backend.load_images(('black_image',), 2))
+
+    def test_connection_per_thread(self):
+        """
+        Test that every thread reads through its own connection.
+        """
+        self.backend.add_highscore("Ash", 5)
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self.backend.top_highscores(1)))
+        thread.start()
+        thread.join()
+        self.assertEqual(results, [[{'name': "Ash", 'score': 5}]])
+        self.assertEqual(len(self.backend._connections), 2)  # pylint: disable=protected-access
+
+    def test_connections_of_ended_threads_are_closed(self):
+        """
+        Test that the connections of ended threads are closed instead of piling up.
+        """
+        self.backend.add_highscore("Ash", 5)
+        for _ in range(20):
+            thread = threading.Thread(target=lambda: self.backend.top_highscores(1))
+            thread.start()
+            thread.join()
+        self.assertLessEqual(len(self.backend._connections), 2)  # pylint: disable=protected-access
+        self.assertEqual(self.backend.top_highscores(1), [{'name': "Ash", 'score': 5}])
+
+    def test_schema_version_check(self):
+        """
+        Test that the schema script only runs again when the script changes.
+        """
+        self.assertEqual(self.backend.stored_schema_version(), self.backend.schema_version())
+        self.backend.execute('DROP TABLE pokemon_variants')
+        self.assertFalse(self.backend.initialize())
+
+        self.backend.execute("UPDATE schema_info SET version = 'old'")
+        self.assertTrue(self.backend.initialize())
+        self.assertEqual(self.backend.fetch_all('SELECT * FROM pokemon_variants'), [])
+
+if __name__ == '__main__':
+    unittest.main()
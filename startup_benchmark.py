@@ -0,0 +1,107 @@
+"""
+Benchmark for the startup path.
+
+Measures the two parts of the startup that come before the game can be shown, each in the
+old and the new way:
+
+* Imports: the modules imported before the first frame, now only `main` with tkinter, the
+  splash screen and the executor, compared with the database manager with the HTTP client and
+  the ingest pipeline, the game UI and the MySQL connector that `main` used to import up
+  front. Each set is imported by a fresh interpreter.
+* Schema: running the whole schema script, as every start used to do, compared with the
+  schema-version check of an up-to-date SQLite database.
+
+The time to the first frame of the real window is printed by `main.py` at every start.
+
+Usage:
+    python startup_benchmark.py [runs]
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from sqlite_backend import SQLiteBackend
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import {modules}; "
+    "print((time.perf_counter() - start) * 1000)")
+
+def measure_imports(modules, runs):
+    """
+    Measures the time a fresh interpreter needs to import modules.
+
+    Args:
+        modules (list): The module names.
+        runs (int): The number of interpreters started.
+
+    Returns:
+        float: The median import time in milliseconds.
+    """
+    snippet = IMPORT_SNIPPET.format(modules=', '.join(modules))
+    directory = os.path.dirname(os.path.abspath(__file__))
+    times = [float(subprocess.run([sys.executable, '-c', snippet], cwd=directory, check=True,
+                                  capture_output=True, text=True).stdout)
+             for _ in range(runs)]
+    return statistics.median(times)
+
+def measure_schema(directory, runs):
+    """
+    Measures running the schema script and checking the schema version.
+
+    Args:
+        directory (str): A temporary directory for the database.
+        runs (int): The number of measurements.
+
+    Returns:
+        tuple: The median times in milliseconds of the script and of the version check.
+    """
+    backend = SQLiteBackend(os.path.join(directory, 'pokemon.db'))
+    try:
+        backend.initialize()
+        script, check = [], []
+        for _ in range(runs):
+            start = time.perf_counter()
+            backend.create_schema()
+            backend.migrate_highscores()
+            script.append((time.perf_counter() - start) * 1000)
+            backend.close()
+            start = time.perf_counter()
+            backend.initialize()
+            check.append((time.perf_counter() - start) * 1000)
+            backend.close()
+        return statistics.median(script), statistics.median(check)
+    finally:
+        backend.close()
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    eager = ['main', 'database_manager', 'pokeapi_client', 'ingest_pipeline', 'pokemon_game',
+             'pokemon_game_ui']
+    try:
+        import mysql.connector  # pylint: disable=import-outside-toplevel,unused-import
+        eager.append('mysql_backend')
+    except ImportError:
+        pass
+    lazy_ms = measure_imports(['main'], runs)
+    eager_ms = measure_imports(eager, runs)
+
+    directory = tempfile.mkdtemp()
+    try:
+        script_ms, check_ms = measure_schema(directory, runs)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"Runs: {runs} (medians)")
+    print(f"Imports before first frame: eager {eager_ms:7.1f} ms, lazy {lazy_ms:7.1f} ms")
+    print(f"Schema at startup (SQLite): script {script_ms:7.2f} ms, "
+          f"version check {check_ms:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+storage_backend Module
+
+This module provides the `StorageBackend` base class, the interface between the
+`PokemonDatabaseManager` and the database that stores the Pokémon, their images and the
+highscores. The pokemon, name and highscore operations are written once in portable SQL with
+%s placeholders; a backend implements the connection handling and adapts the SQL dialect.
+Two backends exist: `MySQLBackend` for a MySQL server and `SQLiteBackend` for an embedded
+SQLite file; `database_manager.create_backend` creates either by name.
+"""
+
+import hashlib
+from metrics import METRICS
+
+DEFAULT_MODE = 'All Pokemon'
+
+class StorageBackend:  # pylint: disable=too-many-public-methods
+    """
+    The operations of the Pokémon database, built on a few primitives that every backend
+    implements: `connect`, `fetch_all`, `execute`, `execute_many`, `create_schema` and `close`.
+
+    Attributes:
+        name (str): The name of the backend.
+        insert_ignore (str): The statement that inserts rows unless their key exists.
+        script_path (str): The SQL script creating the schema.
+    """
+
+    name = 'base'
+    insert_ignore = 'INSERT IGNORE'
+    script_path = None
+
+    def initialize(self, migrations=()):
+        """
+        Creates or upgrades the database schema unless the database already has the version
+        of the schema script. Checking the version is a single query, so starting against an
+        up-to-date database does not run the script.
+
+        Args:
+            migrations (iterable): Callables migrating the data after an upgrade. They run
+                                   before the version is stored, so migrations that fail
+                                   run again on the next start.
+
+        Returns:
+            bool: True if the schema script was run.
+        """
+        version = self.schema_version()
+        if self.stored_schema_version() == version:
+            return False
+        self.create_schema()
+        self.migrate_highscores()
+        for migration in migrations:
+            migration()
+        self.execute('DELETE FROM schema_info')
+        self.execute('INSERT INTO schema_info (version) VALUES (%s)', (version,))
+        return True
+
+    def create_schema(self):
+        """
+        Runs the SQL script creating the database schema if it does not exist yet.
+        """
+        raise NotImplementedError
+
+    def schema_version(self):
+        """
+        Computes the version of the schema script.
+
+        Returns:
+            str: The SHA-256 hash of the script.
+        """
+        with open(self.script_path, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    def stored_schema_version(self):
+        """
+        Loads the version of the schema script last run against the database.
+
+        Returns:
+            str: The version, or None if the schema has no version yet.
+        """
+        try:
+            result = self.fetch_one('SELECT version FROM schema_info')
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+        return result['version'] if result else None
+
+    def connect(self):
+        """
+        Opens a new DB-API connection, used by the ingest writer for its own transactions.
+
+        Returns:
+            object: A connection with `cursor`, `commit` and `close`.
+        """
+        raise NotImplementedError
+
+    def fetch_all(self, sql, params=()):
+        """
+        Executes a query and returns all rows as dictionaries.
+
+        Args:
+            sql (str): The SQL query with %s placeholders.
+            params (tuple): The query parameters.
+
+        Returns:
+            list: A list of dictionaries mapping column names to values.
+        """
+        raise NotImplementedError
+
+    def fetch_one(self, sql, params=()):
+        """
+        Executes a query and returns its first row as a dictionary.
+
+        Args:
+            sql (str): The SQL query with %s placeholders.
+            params (tuple): The query parameters.
+
+        Returns:
+            dict: The first row, or None if the query returned no rows.
+        """
+        rows = self.fetch_all(sql, params)
+        return rows[0] if rows else None
+
+    def execute(self, sql, params=()):
+        """
+        Executes a statement that does not return rows and commits it.
+
+        Args:
+            sql (str): The SQL statement with %s placeholders.
+            params (tuple): The statement parameters.
+        """
+        raise NotImplementedError
+
+    def execute_many(self, sql, rows):
+        """
+        Executes a statement once per parameter row and commits all rows together.
+
+        Args:
+            sql (str): The SQL statement with %s placeholders.
+            rows (list): The parameter tuples.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Closes all connections of the backend.
+        """
+        raise NotImplementedError
+
+    @METRICS.timed('db_save_batch_seconds')
+    def save_pokemon_batch(self, cursor, pokemon_data, batch_size=100):
+        """
+        Inserts Pokémon rows and their image variants with a cursor of `connect`. The caller
+        commits.
+
+        Args:
+            cursor (object): The cursor.
+            pokemon_data (list): Pokémon data tuples, optionally with a list of
+                                 (size, image, mask) variants as fifth element.
+            batch_size (int): The size of each batch for insertion.
+        """
+        sql = self.sql(
+            f"{self.insert_ignore} INTO pokemon (pokedex_number, name, original_image, "
+            "black_image) VALUES (%s, %s, %s, %s)")
+        variant_sql = self.sql(
+            f"{self.insert_ignore} INTO pokemon_variants (pokedex_number, size, original_image, "
+            "black_image) VALUES (%s, %s, %s, %s)")
+        for i in range(0, len(pokemon_data), batch_size):
+            batch = pokemon_data[i:i + batch_size]
+            cursor.executemany(sql, [row[:4] for row in batch])
+            variants = [(row[0],) + tuple(variant)
+                        for row in batch if len(row) > 4 for variant in row[4]]
+            if variants:
+                cursor.executemany(variant_sql, variants)
+
+    def load_images(self, columns, pokedex_number, variant_size=None):
+        """
+        Loads image columns of a Pokémon. If the requested variant was not stored, the
+        full-resolution images are loaded instead.
+
+        Args:
+            columns (tuple): The names of the image columns.
+            pokedex_number (int): The Pokédex number of the Pokémon.
+            variant_size (int, optional): The size of the variant, or None for full resolution.
+
+        Returns:
+            dict: The image data keyed by column, or None if the Pokémon is not found.
+        """
+        select = ', '.join(columns)
+        result = None
+        if variant_size is not None:
+            result = self.fetch_one(
+                f'SELECT {select} FROM pokemon_variants WHERE pokedex_number = %s AND size = %s',
+                (pokedex_number, variant_size))
+        if not result:
+            result = self.fetch_one(
+                f'SELECT {select} FROM pokemon WHERE pokedex_number = %s', (pokedex_number,))
+        return result
+
+    def load_names(self):
+        """
+        Loads the names of all Pokémon.
+
+        Returns:
+            list: (Pokédex number, name) tuples.
+        """
+        return [(row['pokedex_number'], row['name'])
+                for row in self.fetch_all('SELECT pokedex_number, name FROM pokemon')]
+
+    def pokedex_numbers(self, max_pokedex_number):
+        """
+        Loads the Pokédex numbers present in the database.
+
+        Args:
+            max_pokedex_number (int): The highest Pokédex number of interest.
+
+        Returns:
+            set: The present Pokédex numbers up to `max_pokedex_number`.
+        """
+        rows = self.fetch_all(
+            'SELECT pokedex_number FROM pokemon WHERE pokedex_number BETWEEN 1 AND %s',
+            (max_pokedex_number,))
+        return {row['pokedex_number'] for row in rows}
+
+    def missing_pokedex_numbers(self, max_pokedex_number):
+        """
+        Determines which Pokédex numbers are missing from the database.
+
+        Args:
+            max_pokedex_number (int): The highest Pokédex number of interest.
+
+        Returns:
+            list: The sorted missing Pokédex numbers up to `max_pokedex_number`.
+        """
+        present = self.pokedex_numbers(max_pokedex_number)
+        return [n for n in range(1, max_pokedex_number + 1) if n not in present]
+
+    def highest_pokedex_number(self):
+        """
+        Loads the highest Pokédex number in the database.
+
+        Returns:
+            int: The highest Pokédex number, or 0 if the table is empty.
+        """
+        result = self.fetch_one(
+            'SELECT MAX(pokedex_number) AS highest_pokedex_number FROM pokemon')
+        if result and result['highest_pokedex_number'] is not None:
+            return int(result['highest_pokedex_number'])
+        return 0
+
+    def legacy_silhouettes(self, after, limit):
+        """
+        Loads silhouettes still stored as RGBA PNGs, found by the color type byte of their
+        PNG header.
+
+        Args:
+            after (int): Only rows with a higher Pokédex number are loaded.
+            limit (int): The maximum number of rows.
+
+        Returns:
+            list: Rows with the 'pokedex_number' and 'black_image', ordered by number.
+        """
+        return self.fetch_all(
+            "SELECT pokedex_number, black_image FROM pokemon "
+            "WHERE pokedex_number > %s AND SUBSTR(black_image, 26, 1) = X'06' "
+            "ORDER BY pokedex_number LIMIT %s", (after, limit))
+
+    def update_silhouettes(self, updates):
+        """
+        Replaces silhouettes.
+
+        Args:
+            updates (list): (silhouette data, Pokédex number) tuples.
+        """
+        self.execute_many('UPDATE pokemon SET black_image = %s WHERE pokedex_number = %s',
+                          updates)
+
+    def image_rows(self, low, high):
+        """
+        Loads all images of a range of Pokémon, for example to export them.
+
+        Args:
+            low (int): The lowest Pokédex number.
+            high (int): The highest Pokédex number.
+
+        Returns:
+            list: Rows with the 'pokedex_number', 'original_image' and 'black_image', and the
+                  'size' for variants.
+        """
+        rows = self.fetch_all(
+            'SELECT pokedex_number, original_image, black_image FROM pokemon '
+            'WHERE pokedex_number BETWEEN %s AND %s', (low, high))
+        return rows + self.fetch_all(
+            'SELECT pokedex_number, size, original_image, black_image '
+            'FROM pokemon_variants WHERE pokedex_number BETWEEN %s AND %s', (low, high))
+
+    def add_highscore(self, name, score, mode=DEFAULT_MODE):
+        """
+        Saves a highscore.
+
+        Args:
+            name (str): The name of the player.
+            score (int): The score of the player.
+            mode (str): The game mode the score was earned in.
+        """
+        self.execute('INSERT INTO highscores (name, score, mode) VALUES (%s, %s, %s)',
+                     (name, score, mode))
+
+    def add_highscores(self, entries):
+        """
+        Saves a batch of journaled highscores. Highscores whose entry id is already saved are
+        skipped, so a batch can be retried safely.
+
+        Args:
+            entries (list): (entry id, name, score, mode) tuples.
+        """
+        self.execute_many(
+            f'{self.insert_ignore} INTO highscores (entry_id, name, score, mode) '
+            'VALUES (%s, %s, %s, %s)', entries)
+
+    def highscore_entries(self, entry_ids):
+        """
+        Finds the journaled highscores that are saved.
+
+        Args:
+            entry_ids (list): The entry ids.
+
+        Returns:
+            set: The entry ids present in the highscores table.
+        """
+        if not entry_ids:
+            return set()
+        placeholders = ', '.join(['%s'] * len(entry_ids))
+        rows = self.fetch_all(
+            f'SELECT entry_id FROM highscores WHERE entry_id IN ({placeholders})',
+            tuple(entry_ids))
+        return {row['entry_id'] for row in rows}
+
+    def top_highscores(self, limit=10, mode=DEFAULT_MODE):
+        """
+        Loads the best highscores of a mode from the score index. Equal scores are ordered by
+        age.
+
+        Args:
+            limit (int): The number of highscores.
+            mode (str): The game mode.
+
+        Returns:
+            list: Dictionaries with the 'name' and 'score', best first.
+        """
+        return self.fetch_all(
+            'SELECT name, score FROM highscores WHERE mode = %s ORDER BY score DESC, id '
+            'LIMIT %s', (mode, limit))
+
+    def score_counts(self, mode=DEFAULT_MODE):
+        """
+        Loads the number of highscores per score of a mode, maintained by a trigger on
+        insert.
+
+        Args:
+            mode (str): The game mode.
+
+        Returns:
+            dict: The number of highscores keyed by score.
+        """
+        rows = self.fetch_all('SELECT score, entries FROM highscore_counts WHERE mode = %s',
+                              (mode,))
+        return {row['score']: row['entries'] for row in rows}
+
+    def score_rank(self, score, mode=DEFAULT_MODE):
+        """
+        Computes the rank a score has or would have among the highscores of a mode.
+
+        Args:
+            score (int): The score.
+            mode (str): The game mode.
+
+        Returns:
+            int: 1 plus the number of highscores that are strictly better.
+        """
+        result = self.fetch_one(
+            'SELECT COALESCE(SUM(entries), 0) AS better FROM highscore_counts '
+            'WHERE mode = %s AND score > %s', (mode, score))
+        return int(result['better']) + 1
+
+    def migrate_highscores(self):
+        """
+        Fills the score counts of highscores saved before the counts were maintained.
+        """
+        if self.fetch_one('SELECT score FROM highscore_counts LIMIT 1'):
+            return
+        self.execute(
+            'INSERT INTO highscore_counts (mode, score, entries) '
+            'SELECT mode, score, COUNT(*) FROM highscores GROUP BY mode, score')
+
+    def sql(self, statement):
+        """
+        Adapts a statement with %s placeholders to the dialect of the backend.
+
+        Args:
+            statement (str): The SQL statement.
+
+        Returns:
+            str: The statement to execute.
+        """
+        return statement
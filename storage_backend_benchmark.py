@@ -0,0 +1,103 @@
+"""
+Benchmark for the storage backends.
+
+Fills a database from the local PokeAPI stub and builds the same seeded sequence of questions
+on every backend: an SQLite file in a temporary directory and, if it is reachable, the local
+MySQL server. The image cache is disabled, so every question reads its silhouette from the
+backend.
+
+Usage:
+    python storage_backend_benchmark.py [questions] [pokemon]
+"""
+
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import mysql.connector
+from database_manager import PokemonDatabaseManager, create_backend
+from pokeapi_stub import PokeApiStub
+from question import Question
+
+def measure_questions(db_manager, count, seed=42):
+    """
+    Measures the time needed to build a number of questions.
+
+    Args:
+        db_manager (PokemonDatabaseManager): The database manager instance.
+        count (int): The number of questions to build.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        list: The latency of every question in milliseconds.
+    """
+    random.seed(seed)
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        question = Question(db_manager, image_size=300)
+        question.get_original_image()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def run(backend, stub, count, max_pokedex_number, directory):
+    """
+    Fills a database on a backend and measures the questions.
+
+    Args:
+        backend (StorageBackend): The backend.
+        stub (PokeApiStub): The running PokeAPI stub.
+        count (int): The number of questions to build.
+        max_pokedex_number (int): The number of Pokémon to ingest.
+        directory (str): A temporary directory for the ingest checkpoint.
+
+    Returns:
+        tuple: The ingest time in seconds and the question latencies in milliseconds.
+    """
+    db_manager = PokemonDatabaseManager(
+        max_pokedex_number, image_cache_bytes=0, api_base_url=stub.api_base_url,
+        http_cache_dir=None, backend=backend,
+        checkpoint_path=os.path.join(directory, f"{backend.name}.checkpoint.json"))
+    try:
+        start = time.perf_counter()
+        db_manager.fill_database()
+        ingest = time.perf_counter() - start
+        measure_questions(db_manager, 5)
+        return ingest, measure_questions(db_manager, count)
+    finally:
+        db_manager.close()
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    max_pokedex_number = int(sys.argv[2]) if len(sys.argv) > 2 else 151
+    directory = tempfile.mkdtemp()
+    results = {}
+    try:
+        with PokeApiStub(max_pokedex_number) as stub:
+            results['SQLite (WAL)'] = run(
+                create_backend('sqlite', path=os.path.join(directory, 'pokemon.db')),
+                stub, count, max_pokedex_number, directory)
+            try:
+                results['MySQL'] = run(create_backend('mysql'), stub, count,
+                                       max_pokedex_number, directory)
+            except mysql.connector.Error as error:
+                print(f"MySQL skipped: {error}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"Pokémon: {max_pokedex_number}, questions per run: {count}")
+    for label, (ingest, latencies) in results.items():
+        latencies.sort()
+        print(f"{label:<14} ingest {ingest:6.2f} s, question mean "
+              f"{statistics.mean(latencies):6.2f} ms, "
+              f"median {statistics.median(latencies):6.2f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95)]:6.2f} ms")
+
+if __name__ == "__main__":
+    main()
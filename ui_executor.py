@@ -0,0 +1,198 @@
+"""
+ui_executor Module
+
+This module provides the `UiExecutor` class, the layer between the Tk user interface and the
+game logic. Database and image work runs in a background thread, so the Tk event loop keeps
+repainting, and the results are handed to callbacks on the Tk thread by polling with
+`root.after`, as Tk widgets may only be touched from the thread running the main loop.
+
+Jobs are grouped in channels. Starting a job or calling `invalidate` on a channel makes the
+earlier jobs of that channel stale: they still run to completion, but their results are
+discarded, so a slow answer never overwrites the view the player has moved on to. A job that
+takes longer than a frame switches on a loading state until its result arrives.
+"""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+class UiExecutor:
+    """
+    Runs work in the background and delivers the results on the Tk thread.
+
+    Attributes:
+        root (tk.Misc): The widget whose `after` method schedules the callbacks.
+        loading_delay (int): The milliseconds a job may take before its loading state is shown.
+        poll_interval (int): The milliseconds between two checks for finished jobs.
+        discarded (int): The number of stale results that were discarded.
+    """
+
+    def __init__(self, root, max_workers=1, loading_delay=16, poll_interval=8):
+        """
+        Initializes the UiExecutor.
+
+        Args:
+            root (tk.Misc): The widget whose `after` method schedules the callbacks.
+            max_workers (int): The number of worker threads. With one worker, jobs run in the
+                               order they were started and never concurrently.
+            loading_delay (int): The milliseconds a job may take before its loading state is
+                                 shown.
+            poll_interval (int): The milliseconds between two checks for finished jobs.
+        """
+        self.root = root
+        self.loading_delay = loading_delay
+        self.poll_interval = poll_interval
+        self.discarded = 0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='ui-worker')
+        self._finished = queue.SimpleQueue()
+        self._channels = {}
+        self._in_flight = 0
+        self._poll_id = None
+
+    def run(self, work, on_done=None, on_error=None, on_loading=None, channel='view'):
+        """
+        Starts a job in the background. Must be called on the Tk thread.
+
+        Args:
+            work (callable): The work, called without arguments in a worker thread.
+            on_done (callable, optional): Called on the Tk thread with the result of `work`.
+            on_error (callable, optional): Called on the Tk thread with the exception raised
+                                           by `work`. If None, the exception is printed.
+            on_loading (callable, optional): Called on the Tk thread with True if the job
+                                             takes longer than `loading_delay`, and with False
+                                             when it finishes or becomes stale.
+            channel (str): The channel of the job. Earlier jobs of the channel become stale.
+
+        Returns:
+            int: The generation of the job within its channel.
+        """
+        generation = self.invalidate(channel)
+        state = self._channels[channel]
+        if on_loading:
+            state['timer'] = self.root.after(
+                self.loading_delay, lambda: self._show_loading(channel, generation, on_loading))
+        future = self._executor.submit(work)
+        future.add_done_callback(
+            lambda done: self._finished.put((channel, generation, done, on_done, on_error)))
+        self._in_flight += 1
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+        return generation
+
+    def submit(self, work):
+        """
+        Runs work in the background whose result is not needed, such as warming a cache.
+        It shares the worker threads with the jobs started by `run`.
+
+        Args:
+            work (callable): The work, called without arguments in a worker thread.
+
+        Returns:
+            concurrent.futures.Future: The future of the work.
+        """
+        return self._executor.submit(work)
+
+    def invalidate(self, channel='view'):
+        """
+        Makes the running jobs of a channel stale and ends their loading state.
+
+        Args:
+            channel (str): The channel.
+
+        Returns:
+            int: The new generation of the channel.
+        """
+        state = self._channels.setdefault(
+            channel, {'generation': 0, 'timer': None, 'loading': None})
+        self._end_loading(state)
+        state['generation'] += 1
+        return state['generation']
+
+    def is_current(self, channel, generation):
+        """
+        Checks whether a job is the latest of its channel.
+
+        Args:
+            channel (str): The channel.
+            generation (int): The generation of the job.
+
+        Returns:
+            bool: True if no later job was started and the channel was not invalidated.
+        """
+        state = self._channels.get(channel)
+        return state is not None and state['generation'] == generation
+
+    def pending(self):
+        """
+        Counts the jobs whose results were not delivered yet.
+
+        Returns:
+            int: The number of running and finished but undelivered jobs.
+        """
+        return self._in_flight
+
+    def shutdown(self):
+        """
+        Stops delivering results and lets the worker threads finish without waiting for them.
+        Queued jobs that have not started are cancelled.
+        """
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        for state in self._channels.values():
+            self._end_loading(state)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        """
+        Delivers the results of the finished jobs and checks again while jobs are running.
+        """
+        self._poll_id = None
+        while True:
+            try:
+                channel, generation, future, on_done, on_error = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight -= 1
+            if not self.is_current(channel, generation):
+                self.discarded += 1
+                continue
+            self._end_loading(self._channels[channel])
+            error = future.exception()
+            if error is None:
+                if on_done:
+                    on_done(future.result())
+            elif on_error:
+                on_error(error)
+            else:
+                print(f"Background job failed: {error!r}")
+        if self._in_flight > 0:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _show_loading(self, channel, generation, on_loading):
+        """
+        Switches on the loading state of a job that is still running.
+
+        Args:
+            channel (str): The channel of the job.
+            generation (int): The generation of the job.
+            on_loading (callable): The loading callback of the job.
+        """
+        state = self._channels[channel]
+        state['timer'] = None
+        if state['generation'] == generation:
+            state['loading'] = on_loading
+            on_loading(True)
+
+    def _end_loading(self, state):
+        """
+        Cancels the loading timer of a channel and switches off its loading state.
+
+        Args:
+            state (dict): The state of the channel.
+        """
+        if state['timer'] is not None:
+            self.root.after_cancel(state['timer'])
+            state['timer'] = None
+        if state['loading'] is not None:
+            loading, state['loading'] = state['loading'], None
+            loading(False)
@@ -0,0 +1,168 @@
+"""
+Unit tests for the UiExecutor class.
+
+This module contains test cases that run the executor against a stand-in for the Tk root
+window, whose `after` callbacks are run by the test thread, so no display is needed.
+"""
+
+import threading
+import time
+import unittest
+from ui_executor import UiExecutor
+
+class FakeRoot:
+    """
+    A Tk root window stand-in that runs `after` callbacks when the test processes events.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FakeRoot without scheduled callbacks.
+        """
+        self.callbacks = {}
+        self.next_id = 0
+        self.thread = threading.current_thread()
+
+    def after(self, delay, callback):
+        """
+        Schedules a callback.
+
+        Args:
+            delay (int): The delay in milliseconds.
+            callback (callable): The callback.
+
+        Returns:
+            int: The id of the callback.
+        """
+        self.next_id += 1
+        self.callbacks[self.next_id] = (time.monotonic() + delay / 1000, callback)
+        return self.next_id
+
+    def after_cancel(self, callback_id):
+        """
+        Cancels a scheduled callback.
+
+        Args:
+            callback_id (int): The id of the callback.
+        """
+        self.callbacks.pop(callback_id, None)
+
+    def process(self, until, timeout=5.0):
+        """
+        Runs due callbacks like the Tk main loop until a condition holds.
+
+        Args:
+            until (callable): The condition.
+            timeout (float): The maximum number of seconds to run.
+
+        Returns:
+            bool: True if the condition holds.
+        """
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            now = time.monotonic()
+            for callback_id, (due, callback) in sorted(self.callbacks.items()):
+                if due <= now:
+                    del self.callbacks[callback_id]
+                    callback()
+            time.sleep(0.001)
+        return until()
+
+class TestUiExecutor(unittest.TestCase):
+    """
+    Test suite for the UiExecutor class.
+    """
+
+    def setUp(self):
+        """
+        Create an executor on a fake root window.
+        """
+        self.root = FakeRoot()
+        self.executor = UiExecutor(self.root)
+        self.delivered = []
+
+    def tearDown(self):
+        """
+        Shut the executor down.
+        """
+        self.executor.shutdown()
+
+    def on_done(self, result):
+        """
+        Records a delivered result and the thread it was delivered on.
+
+        Args:
+            result (object): The result.
+        """
+        self.delivered.append((result, threading.current_thread()))
+
+    def test_result_is_delivered_on_the_ui_thread(self):
+        """
+        Test that work runs in a worker thread and its result reaches the Tk thread.
+        """
+        self.executor.run(threading.current_thread, self.on_done)
+        self.assertTrue(self.root.process(lambda: self.delivered))
+        worker, delivered_on = self.delivered[0]
+        self.assertIsNot(worker, self.root.thread)
+        self.assertIs(delivered_on, self.root.thread)
+
+    def test_run_does_not_block(self):
+        """
+        Test that starting slow work returns within a frame.
+        """
+        start = time.perf_counter()
+        self.executor.run(lambda: time.sleep(0.2), self.on_done)
+        self.assertLess(time.perf_counter() - start, 0.016)
+        self.assertTrue(self.root.process(lambda: self.delivered))
+
+    def test_stale_results_are_discarded(self):
+        """
+        Test that only the latest job of a channel delivers its result.
+        """
+        self.executor.run(lambda: time.sleep(0.05) or "old", self.on_done)
+        self.executor.run(lambda: "new", self.on_done)
+        self.assertTrue(self.root.process(lambda: self.executor.discarded == 1))
+        self.assertEqual([result for result, _ in self.delivered], ["new"])
+
+        self.executor.run(lambda: "left", self.on_done)
+        self.executor.invalidate()
+        self.assertTrue(self.root.process(lambda: self.executor.discarded == 2))
+        self.assertEqual(len(self.delivered), 1)
+
+    def test_submitted_work_runs_in_the_background(self):
+        """
+        Test that submitted work runs in a worker thread without delivering a result.
+        """
+        future = self.executor.submit(threading.current_thread)
+        self.assertIsNot(future.result(timeout=5), threading.current_thread())
+        self.assertEqual(self.executor.pending(), 0)
+
+    def test_loading_state(self):
+        """
+        Test that the loading state is shown for slow work only and hidden afterwards.
+        """
+        loading = []
+        self.executor.run(lambda: "fast", self.on_done, on_loading=loading.append)
+        self.assertTrue(self.root.process(lambda: self.delivered))
+        self.assertEqual(loading, [])
+
+        self.executor.run(lambda: time.sleep(0.1), self.on_done, on_loading=loading.append)
+        self.assertTrue(self.root.process(lambda: len(self.delivered) == 2))
+        self.assertEqual(loading, [True, False])
+
+    def test_errors_are_delivered(self):
+        """
+        Test that an exception of the work is passed to the error callback.
+        """
+        errors = []
+
+        def fail():
+            raise OSError("database unavailable")
+
+        self.executor.run(fail, self.on_done, on_error=errors.append)
+        self.assertTrue(self.root.process(lambda: errors))
+        self.assertIsInstance(errors[0], OSError)
+        self.assertEqual(self.delivered, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+"""
+Soak test for the PokemonGameUI class.
+
+This module plays many rounds through the real Tk widgets of the game UI, with a stand-in
+for the game logic, and checks that the number of widgets, of Tk images and of Python
+allocations stays flat once the caches are warm. It needs a display, for example a virtual
+one started with `xvfb-run`, and is skipped without one unless the environment variable
+POKEMON_REQUIRE_DISPLAY is set, as it is in CI.
+"""
+
+import os
+import time
+import tkinter as tk
+import tracemalloc
+import unittest
+from PIL import Image
+from pokemon_game_ui import PokemonGameUI
+
+ROUNDS = 3000
+WARMUP_ROUNDS = 300
+POKEMON = 60
+
+class FakeQuestion:
+    """
+    A question stand-in with small generated images.
+    """
+
+    def __init__(self, pokedex_number):
+        """
+        Initializes the FakeQuestion.
+
+        Args:
+            pokedex_number (int): The Pokédex number of the Pokémon.
+        """
+        self.pokedex_number = pokedex_number
+        self.choices = [f"Pokemon {pokedex_number + offset}" for offset in range(4)]
+
+    def get_correct_answer(self):
+        """
+        Returns the first choice as the correct answer.
+        """
+        return self.choices[0]
+
+    def get_choices(self):
+        """
+        Returns the four choices.
+        """
+        return self.choices
+
+    def get_black_image(self):
+        """
+        Returns a small black image.
+        """
+        return Image.new('RGBA', (96, 96), (0, 0, 0, 255))
+
+    def get_original_image(self):
+        """
+        Returns a small colored image.
+        """
+        return Image.new('RGBA', (96, 96), (self.pokedex_number % 256, 80, 160, 255))
+
+    def warm_original_image(self, _executor):
+        """
+        Does nothing, the images are generated on demand.
+        """
+
+class FakeGame:
+    """
+    A game stand-in that cycles through a fixed set of Pokémon.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FakeGame.
+        """
+        self.mode_name = "All Pokemon"
+        self.max_pokedex_number = 151
+        self.drawn = 0
+        self.score = 0
+        self.correct = True
+        self.question = FakeQuestion(1)
+        self.highscores = []
+
+    def start_new_game(self):
+        """
+        Resets the score and draws the first question.
+        """
+        self.score = 0
+        self.correct = True
+        self.next_question()
+
+    def next_question(self):
+        """
+        Draws the next question.
+        """
+        self.drawn += 1
+        self.question = FakeQuestion(self.drawn % POKEMON + 1)
+
+    def get_current_question(self):
+        """
+        Returns the current question.
+        """
+        return self.question
+
+    def increase_score(self):
+        """
+        Counts a correct answer.
+        """
+        self.score += 1
+
+    def get_score(self):
+        """
+        Returns the score.
+        """
+        return self.score
+
+    def reset_correct(self):
+        """
+        Resets the correct flag.
+        """
+        self.correct = True
+
+    def wrong_answer(self):
+        """
+        Records a wrong answer.
+        """
+        self.correct = False
+
+    def get_correct(self):
+        """
+        Returns whether the last answer was correct.
+        """
+        return self.correct
+
+    def get_highscores(self, mode=None):
+        """
+        Returns the ten best scores.
+        """
+        del mode
+        return sorted(self.highscores, key=lambda entry: -entry['score'])[:10]
+
+    def submit_highscore(self, name, score, _mode_name):
+        """
+        Keeps the last hundred scores.
+        """
+        self.highscores = self.highscores[-99:] + [{'name': name, 'score': score}]
+
+    def get_rank(self, _score, _mode_name):
+        """
+        Returns a fixed rank.
+        """
+        return 1, len(self.highscores)
+
+    def shutdown(self):
+        """
+        Does nothing.
+        """
+
+class TestUiSoak(unittest.TestCase):
+    """
+    Plays many rounds through the game UI and checks for leaks.
+    """
+
+    def setUp(self):
+        """
+        Creates the root window and the game UI, or skips the test without a display unless
+        a display is required.
+        """
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as error:
+            if os.environ.get('POKEMON_REQUIRE_DISPLAY'):
+                raise
+            self.skipTest(f"No display: {error}")
+        self.game = FakeGame()
+        self.ui = PokemonGameUI(self.root, self.game)
+        self.ui.executor.poll_interval = 1
+        self.ui.prepare_ui()
+
+    def tearDown(self):
+        """
+        Destroys the root window.
+        """
+        self.ui.executor.shutdown()
+        self.root.destroy()
+
+    def pump(self):
+        """
+        Processes Tk events until all background work is delivered.
+        """
+        self.root.update()
+        while self.ui.executor.pending():
+            time.sleep(0.001)
+            self.root.update()
+
+    def play_round(self, round_number):
+        """
+        Plays one game of a few questions, submits the score and visits the scoreboard.
+
+        Args:
+            round_number (int): The number of the round.
+        """
+        self.ui.start_game()
+        self.pump()
+        for answer in range(round_number % 4 + 1):
+            question = self.game.get_current_question()
+            correct = answer < round_number % 4
+            choice = question.get_correct_answer() if correct else question.get_choices()[1]
+            button = next(btn for btn in self.ui.answer_buttons if btn.cget("text") == choice)
+            self.ui.check_answer(choice, button)
+            self.pump()
+            self.ui.next_question()
+            self.pump()
+
+        self.ui.name_entry.insert(0, f"Player {round_number}")
+        self.ui.submit_name_and_go_to_menu()
+        self.pump()
+        if round_number % 5 == 0:
+            self.ui.scoreboard()
+            self.pump()
+            self.ui.go_to_main_menu()
+
+    def usage(self):
+        """
+        Measures the widgets, Tk images and Python memory in use.
+
+        Returns:
+            tuple: The number of widgets, the number of Tk images and the traced bytes.
+        """
+        self.pump()
+        return (len(self.root.winfo_children()), len(self.root.image_names()),
+                tracemalloc.get_traced_memory()[0])
+
+    def test_long_session_stays_flat(self):
+        """
+        Tests that widgets, images and memory stop growing after the warmup rounds.
+        """
+        tracemalloc.start()
+        try:
+            for round_number in range(WARMUP_ROUNDS):
+                self.play_round(round_number)
+            widgets, images, memory = self.usage()
+            for round_number in range(WARMUP_ROUNDS, ROUNDS):
+                self.play_round(round_number)
+            final_widgets, final_images, final_memory = self.usage()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(final_widgets, widgets)
+        self.assertLessEqual(final_images, images + 1)
+        self.assertLess(final_memory - memory, 512 * 1024)
+        self.assertGreater(self.ui.render_cache.hits, 0)
+
+if __name__ == '__main__':
+    unittest.main()
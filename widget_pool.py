@@ -0,0 +1,72 @@
+"""
+widget_pool Module
+
+This module provides the `WidgetPool` class, which recycles Tk widgets that are shown and
+hidden again and again, such as the rows of the scoreboard and message labels. Widgets are
+created once and handed out again after they were released, so the number of widgets, and
+the memory they hold, stays flat over long sessions.
+"""
+
+class WidgetPool:
+    """
+    Free and used widgets grouped by kind.
+
+    Attributes:
+        created (int): The number of widgets created by the pool.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty WidgetPool.
+        """
+        self.created = 0
+        self._free = {}
+        self._used = {}
+
+    def acquire(self, kind, factory):
+        """
+        Hands out a released widget of a kind, or creates one.
+
+        Args:
+            kind (str): The kind of widget, for example 'row'.
+            factory (callable): Creates a new widget of the kind.
+
+        Returns:
+            tk.Widget: The widget. The caller configures and places it.
+        """
+        free = self._free.setdefault(kind, [])
+        if free:
+            widget = free.pop()
+        else:
+            widget = factory()
+            self.created += 1
+        self._used.setdefault(kind, []).append(widget)
+        return widget
+
+    def release(self, kind, widget=None):
+        """
+        Hides widgets and returns them to the pool.
+
+        Args:
+            kind (str): The kind of widget.
+            widget (tk.Widget, optional): The widget to release. If None, all used widgets of
+                                          the kind are released.
+        """
+        used = self._used.get(kind, [])
+        widgets = list(used) if widget is None else [widget] if widget in used else []
+        for released in widgets:
+            used.remove(released)
+            released.grid_forget()
+            self._free.setdefault(kind, []).append(released)
+
+    def count(self, kind):
+        """
+        Counts the widgets of a kind.
+
+        Args:
+            kind (str): The kind of widget.
+
+        Returns:
+            int: The number of free and used widgets of the kind.
+        """
+        return len(self._free.get(kind, ())) + len(self._used.get(kind, ()))
@@ -0,0 +1,76 @@
+"""
+Unit tests for the WidgetPool class.
+
+This module contains test cases that recycle stand-ins for Tk widgets, so no display is
+needed.
+"""
+
+import unittest
+from widget_pool import WidgetPool
+
+class FakeWidget:  # pylint: disable=too-few-public-methods
+    """
+    A Tk widget stand-in that records whether it is placed in the grid.
+    """
+
+    def __init__(self):
+        """
+        Initializes a placed FakeWidget.
+        """
+        self.placed = True
+
+    def grid_forget(self):
+        """
+        Removes the widget from the grid.
+        """
+        self.placed = False
+
+class TestWidgetPool(unittest.TestCase):
+    """
+    Test cases for the WidgetPool class.
+    """
+
+    def setUp(self):
+        """
+        Creates an empty pool.
+        """
+        self.pool = WidgetPool()
+
+    def test_released_widgets_are_reused(self):
+        """
+        Tests that widgets are created only while no released widget of the kind is free.
+        """
+        rows = [self.pool.acquire('row', FakeWidget) for _ in range(3)]
+        self.pool.release('row')
+        self.assertTrue(all(not row.placed for row in rows))
+
+        again = [self.pool.acquire('row', FakeWidget) for _ in range(3)]
+        self.assertCountEqual(again, rows)
+        self.assertEqual(self.pool.created, 3)
+        self.assertEqual(self.pool.count('row'), 3)
+
+    def test_release_single_widget(self):
+        """
+        Tests that releasing one widget leaves the others of its kind in use.
+        """
+        first = self.pool.acquire('message', FakeWidget)
+        second = self.pool.acquire('message', FakeWidget)
+        self.pool.release('message', first)
+        self.pool.release('message', first)
+
+        self.assertFalse(first.placed)
+        self.assertTrue(second.placed)
+        self.assertIs(self.pool.acquire('message', FakeWidget), first)
+        self.assertEqual(self.pool.count('message'), 2)
+
+    def test_kinds_are_separate(self):
+        """
+        Tests that a released widget is only handed out again for its own kind.
+        """
+        row = self.pool.acquire('row', FakeWidget)
+        self.pool.release('row')
+        self.assertIsNot(self.pool.acquire('message', FakeWidget), row)
+        self.assertEqual(self.pool.created, 2)
+
+if __name__ == '__main__':
+    unittest.main()